@@ -0,0 +1,183 @@
+# Aho-Corasick Word Search Solver by Ben Friedland
+
+# The goal of this program is to solve word search puzzles.
+
+# The other solvers search for one word at a time, so the time they take
+# grows with the length of the word list. This version compiles the whole
+# word list into a single Aho-Corasick automaton: a trie of every word,
+# plus "failure" links which say where to carry on from in the trie when
+# the next letter doesn't continue the current word. Each line of the
+# grid (see line_word_search_solver.extract_lines) is then read through
+# the automaton once, and every word ending at each letter is reported
+# along the way. The reversal of every word is compiled in as well, so
+# that the lines only need to be read in one direction each: finding a
+# reversed word finds the word itself reading the opposite way.
+
+# This means the time spent searching depends on the size of the grid
+# and the number of matches, rather than on the number of words.
+
+
+import collections
+
+import word_search_solver as wss
+import line_word_search_solver as lws
+
+
+class Automaton(object):
+    '''
+    Create an Automaton from a list of words, which are normalized
+    the same way the other solvers treat them (upper-cased, with spaces
+    removed) before being compiled into the automaton.
+
+    Contains a words_by_pattern dictionary mapping each normalized
+    pattern back to the list of original words which produced it, and
+    a reversed_words_by_pattern dictionary doing the same for the
+    reversal of each normalized pattern.
+    '''
+
+    def __init__(self, words):
+
+        # Each node in the trie is an index into these three lists.
+        # Node 0 is the root, which represents the empty string.
+        self.transitions = [{}]
+        self.failures = [0]
+        self.outputs = [[]]
+
+        # More than one word may normalize to the same pattern,
+        # eg 'Save As' and 'SAVEAS'; all of them must be reported.
+        self.words_by_pattern = collections.defaultdict(list)
+        self.reversed_words_by_pattern = collections.defaultdict(list)
+
+        for word in words:
+
+            pattern = wss.normalize_word(word)
+
+            # An empty pattern would match everywhere.
+            if not pattern:
+                continue
+
+            reversed_pattern = pattern[::-1]
+
+            if word not in self.words_by_pattern[pattern]:
+                self.words_by_pattern[pattern].append(word)
+                self.reversed_words_by_pattern[reversed_pattern].append(word)
+
+            # A palindrome and its reversal share a node in the trie,
+            # so add_pattern only records the pattern there once.
+            self.add_pattern(pattern)
+            self.add_pattern(reversed_pattern)
+
+        self.build_failure_links()
+
+    def add_pattern(self, pattern):
+        '''
+        Add pattern to the trie, creating nodes for it as needed.
+        '''
+
+        node = 0
+
+        for letter in pattern:
+
+            next_node = self.transitions[node].get(letter)
+
+            if next_node is None:
+                next_node = len(self.transitions)
+                self.transitions[node][letter] = next_node
+                self.transitions.append({})
+                self.failures.append(0)
+                self.outputs.append([])
+
+            node = next_node
+
+        if pattern not in self.outputs[node]:
+            self.outputs[node].append(pattern)
+
+    def build_failure_links(self):
+        '''
+        Point every node at the node for the longest proper suffix of its
+        string which is also in the trie, and give each node the outputs
+        of the node it fails to, so shorter words ending inside longer
+        ones are reported too.
+        '''
+
+        # Breadth-first, so every failure target is finished
+        # before the nodes which fail to it are visited.
+        queue = collections.deque(self.transitions[0].values())
+
+        while queue:
+
+            node = queue.popleft()
+
+            for letter, child in self.transitions[node].items():
+
+                queue.append(child)
+
+                failure = self.failures[node]
+
+                while failure and letter not in self.transitions[failure]:
+                    failure = self.failures[failure]
+
+                failure = self.transitions[failure].get(letter, 0)
+
+                self.failures[child] = failure
+                self.outputs[child].extend(self.outputs[failure])
+
+    def search(self, text):
+        '''
+        Read text through the automaton, yielding a
+        (start_index, pattern) tuple for every match.
+        '''
+
+        transitions = self.transitions
+        failures = self.failures
+        outputs = self.outputs
+
+        node = 0
+
+        for index, letter in enumerate(text):
+
+            while node and letter not in transitions[node]:
+                node = failures[node]
+
+            node = transitions[node].get(letter, 0)
+
+            for pattern in outputs[node]:
+                yield index - len(pattern) + 1, pattern
+
+
+def solve_puzzle(words, graph, automaton=None):
+    '''
+    Find every word in words inside graph (a list of strings, which
+    may be of different lengths) and return the same {word: {direction:
+    [(x, y), ...]}} dictionary returned by the other solvers.
+
+    An Automaton which was already compiled from words may be passed in
+    to avoid compiling it again.
+    '''
+
+    if automaton is None:
+        automaton = Automaton(words)
+
+    found_words = {}
+
+    for line, x, y, direction in lws.extract_lines(graph):
+
+        for index, pattern in automaton.search(line):
+
+            coords = lws.locate_match(x, y, direction, index)
+
+            for each_word in automaton.words_by_pattern.get(pattern, ()):
+                directions_found = found_words.setdefault(each_word, {})
+                directions_found.setdefault(direction, []).append(coords)
+
+            # The same tiles, read backwards, spell any word whose
+            # reversal is this pattern. For a palindrome, that is
+            # the word which was just found in the other direction.
+            for each_word in automaton.reversed_words_by_pattern.get(pattern,
+                                                                     ()):
+                flipped, opposite = wss.flip_match(coords, direction,
+                                                   len(pattern))
+                directions_found = found_words.setdefault(each_word, {})
+                directions_found.setdefault(opposite, []).append(flipped)
+
+    return wss.arrange_results(words, found_words)
@@ -0,0 +1,260 @@
+# Batch Word Search Solver by Ben Friedland
+
+# The goal of this program is to solve many word search puzzles at once.
+
+# Running word_search_solver.py solves one puzzle per process, which means
+# paying for Python's startup and for loading the word list every time.
+# This version takes either a directory of puzzle grids (which share one
+# word list) or a manifest file listing puzzles, and hands the puzzles out
+# to a pool of worker processes. Each worker keeps every word list it has
+# compiled, so a word list is only compiled once per worker rather than
+# once per puzzle.
+
+# Manifest files list one puzzle per line, as tab-separated paths:
+#     <path to keys>  <path to grid>  <(optional) path to output>
+# Relative paths are relative to the manifest file, and blank lines and
+# lines starting with '#' are ignored. Puzzles without an output path are
+# written next to their grid, as <grid name>_solution.txt.
+
+# A puzzle which can't be solved (a missing or unreadable file, say)
+# doesn't stop the others: it's reported once the rest are written.
+
+
+import os
+import time
+
+import word_search_solver as wss
+
+
+# Word lists this process has already compiled, keyed by
+# (key_path, engine). Each worker process has its own copy.
+COMPILED_WORD_LISTS = {}
+
+
+def solution_path_for(grid_path, output_directory=None):
+    '''
+    Return the path a solution to the grid at grid_path is written to
+    when none is given: <grid name>_solution.txt, in output_directory
+    if there is one, or next to the grid if not.
+    '''
+
+    directory, file_name = os.path.split(grid_path)
+
+    if output_directory is not None:
+        directory = output_directory
+
+    name = os.path.splitext(file_name)[0]
+
+    return os.path.join(directory, '{}_solution.txt'.format(name))
+
+
+def read_manifest(manifest_path):
+    '''
+    Load the manifest file at manifest_path and return a list of
+    (key_path, grid_path, solution_path) tuples, one per puzzle.
+    '''
+
+    base_directory = os.path.dirname(manifest_path)
+
+    puzzles = []
+
+    for line_number, line in enumerate(
+            wss.load_list_from_text_file(manifest_path), 1):
+
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+
+        paths = [os.path.join(base_directory, each_path.strip())
+                 for each_path in line.split('\t')]
+
+        if len(paths) == 2:
+            paths.append(solution_path_for(paths[1]))
+
+        if len(paths) != 3:
+            raise ValueError("Line {} of {} should have two or three"
+                             " tab-separated paths.".format(line_number,
+                                                            manifest_path))
+
+        puzzles.append(tuple(paths))
+
+    return puzzles
+
+
+def read_directory(grid_directory, key_path, output_directory=None):
+    '''
+    Return a list of (key_path, grid_path, solution_path) tuples, one
+    for every .txt file in grid_directory, all sharing the word list at
+    key_path. Solutions go to output_directory, which defaults to a
+    'solutions' directory inside grid_directory.
+    '''
+
+    if output_directory is None:
+        output_directory = os.path.join(grid_directory, 'solutions')
+
+    puzzles = []
+
+    for file_name in sorted(os.listdir(grid_directory)):
+
+        grid_path = os.path.join(grid_directory, file_name)
+
+        if not file_name.endswith('.txt') or not os.path.isfile(grid_path):
+            continue
+
+        # The word list may be kept alongside the grids.
+        if os.path.abspath(grid_path) == os.path.abspath(key_path):
+            continue
+
+        solution_path = solution_path_for(grid_path, output_directory)
+
+        puzzles.append((key_path, grid_path, solution_path))
+
+    return puzzles
+
+
+def compile_word_list(key_path, engine):
+    '''
+    Return a function which solves a graph for the word list at key_path
+    (a plain word list, or an index saved by word_index) using engine,
+    loading and compiling the word list only the first time this process
+    asks for it.
+    '''
+
+    import word_index
+
+    cache_key = (key_path, engine)
+
+    if cache_key not in COMPILED_WORD_LISTS:
+        keys = word_index.load_word_index(key_path)
+        COMPILED_WORD_LISTS[cache_key] = wss.compile_engine(engine, keys)
+
+    return COMPILED_WORD_LISTS[cache_key]
+
+
+def solve_puzzle_files(puzzle, engine='aho_corasick'):
+    '''
+    Solve one (key_path, grid_path, solution_path) puzzle with engine
+    (a key in word_search_solver.ENGINES), write its solution file,
+    and return the solution_path.
+
+    This runs inside the worker processes.
+    '''
+
+    key_path, grid_path, solution_path = puzzle
+
+    solve = compile_word_list(key_path, engine)
+
+    results = solve(wss.load_list_from_text_file(grid_path))
+
+    output_directory = os.path.dirname(solution_path)
+
+    if output_directory and not os.path.isdir(output_directory):
+        try:
+            os.makedirs(output_directory)
+        except OSError:
+            # Another worker may have just made it.
+            if not os.path.isdir(output_directory):
+                raise
+
+    wss.write_solution_to_file(results, solution_path)
+
+    return solution_path
+
+
+def solve_batch(puzzles, workers=None, engine='aho_corasick'):
+    '''
+    Solve every (key_path, grid_path, solution_path) puzzle in puzzles
+    across a pool of worker processes (defaults to one per CPU), writing
+    a solution file for each, and return a tuple of (solution_paths,
+    elapsed_seconds).
+
+    solution_paths is in the same order as puzzles. A puzzle which
+    couldn't be solved has the exception it raised in place of its
+    solution_path, and the rest of the batch is solved regardless.
+    '''
+
+    import concurrent.futures
+
+    # Fail before starting any processes if the engine doesn't exist.
+    wss.load_engine(engine)
+
+    solution_paths = [None] * len(puzzles)
+
+    start_time = time.time()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+
+        futures = dict((pool.submit(solve_puzzle_files, each_puzzle,
+                                    engine), index)
+                       for index, each_puzzle in enumerate(puzzles))
+
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                solution_paths[futures[future]] = future.result()
+            except Exception as error:
+                solution_paths[futures[future]] = error
+
+    return solution_paths, time.time() - start_time
+
+
+def handle_cli_arguments():
+    '''
+    Handle command line interface arguments for solving a directory
+    of puzzle grids, or the puzzles listed in a manifest file.
+    '''
+
+    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Solve many word search puzzles across processes.")
+    parser.add_argument('puzzles',
+                        help="a directory of grids, or a manifest file")
+    parser.add_argument('--keys', default='word_list.txt',
+                        help="word list for every grid in a directory")
+    parser.add_argument('--output', default=None,
+                        help="directory for the solutions to a directory")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="number of worker processes (one per CPU)")
+    parser.add_argument('--engine', default='aho_corasick',
+                        choices=sorted(wss.ENGINES),
+                        help="solver used for every puzzle")
+
+    arguments = parser.parse_args()
+
+    try:
+        if os.path.isdir(arguments.puzzles):
+            puzzles = read_directory(arguments.puzzles, arguments.keys,
+                                     arguments.output)
+        else:
+            puzzles = read_manifest(arguments.puzzles)
+
+        solution_paths, elapsed = solve_batch(puzzles, arguments.workers,
+                                              arguments.engine)
+
+    except (IOError, ValueError):
+        print("\n{}\n".format(sys.exc_info()[1]))
+        sys.exit(1)
+
+    failures = [(each_puzzle[1], solution_path)
+                for each_puzzle, solution_path in zip(puzzles, solution_paths)
+                if isinstance(solution_path, Exception)]
+
+    # Avoid dividing by zero for an empty batch.
+    rate = len(solution_paths) / elapsed if elapsed else 0.0
+
+    print("{} solution files written in {:.2f} seconds"
+          " ({:.1f} puzzles per second).".format(
+              len(solution_paths) - len(failures), elapsed, rate))
+
+    if failures:
+
+        print("\n{} puzzles couldn't be solved:".format(len(failures)))
+
+        for grid_path, error in failures:
+            print("    {}: {}".format(grid_path, error))
+
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    handle_cli_arguments()
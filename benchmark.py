@@ -0,0 +1,279 @@
+# Benchmarks for the word search solvers by Ben Friedland
+
+# The puzzle in word_search.txt is only 18 by 18 tiles, which is too small
+# to tell the solvers apart. This makes puzzles of any size instead, from
+# a seed, so the same puzzles can be made again on any machine:
+# generate_puzzle fills a grid with random letters, then writes each word
+# into it at a random place, reading in a random direction.
+
+# Letters are drawn from an alphabet with a configurable skew. With a
+# skew of 0 every letter is equally likely, and as the skew grows the
+# first letters of the alphabet crowd out the rest (the chance of the
+# letter at index i is proportional to 1 / (i + 1) ** skew), which makes
+# grids with far more partial matches, like real text does.
+
+# run_sweep solves a puzzle for every combination of the sizes, word
+# counts, word lengths and skews given, with every solver path given:
+# WordSearchSolver.solve_puzzle (reading the puzzle from files, as the
+# command line does), and each engine in word_search_solver.ENGINES. It
+# yields one dictionary per run, holding the best wall time of several
+# repeats, the matches found per second, and the peak memory allocated
+# by Python while solving (measured in a separate run, since measuring
+# memory slows everything down). Memory used by the tiled solver's worker
+# processes, or inside NumPy, isn't counted.
+
+# Run from the command line, each result is written as a line of JSON.
+
+
+import os
+import time
+import random
+
+import word_search_solver as wss
+
+
+DEFAULT_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# The name of the path through WordSearchSolver.solve_puzzle, which
+# reads the puzzle from files, alongside the names in ENGINES.
+SOLVER_PATH = 'WordSearchSolver'
+
+
+def letter_weights(alphabet, skew):
+    '''
+    Return a list of the relative chance of drawing each letter
+    in alphabet, for the given skew (see the top of this module).
+    '''
+
+    return [1.0 / (index + 1) ** skew for index in range(len(alphabet))]
+
+
+def generate_puzzle(height, width, word_count, word_length,
+                    alphabet=DEFAULT_ALPHABET, skew=0.0, seed=0):
+    '''
+    Return a tuple of (words, graph) for a puzzle of height by width
+    tiles, with word_count distinct words of word_length letters (or as
+    many as fit) drawn from alphabet, each planted in the grid reading in
+    a random direction. The same arguments always make the same puzzle.
+    '''
+
+    generator = random.Random(seed)
+
+    weights = letter_weights(alphabet, skew)
+
+    def draw_letters(count):
+        return generator.choices(alphabet, weights, k=count)
+
+    grid = [draw_letters(width) for _ in range(height)]
+
+    # Every direction has room for a word this long somewhere.
+    word_length = max(1, min(word_length, height, width))
+
+    words = set()
+
+    # A small alphabet may not have word_count distinct words
+    # of this length, so give up after a reasonable number of tries.
+    for _ in range(word_count * 100):
+
+        if len(words) == word_count:
+            break
+
+        words.add(''.join(draw_letters(word_length)))
+
+    words = sorted(words)
+
+    directions = sorted(wss.WordSearchSolver.directions)
+
+    for each_word in words:
+
+        direction = generator.choice(directions)
+        dy, dx = wss.WordSearchSolver.directions[direction]
+
+        # The range of starting tiles from which the
+        # word stays inside the grid, in each dimension.
+        span = word_length - 1
+        x = generator.randint(span if dx < 0 else 0,
+                              width - 1 - (span if dx > 0 else 0))
+        y = generator.randint(span if dy < 0 else 0,
+                              height - 1 - (span if dy > 0 else 0))
+
+        for index, letter in enumerate(each_word):
+            grid[y + index * dy][x + index * dx] = letter
+
+    # Shuffled so that no solver gains from the words being in order.
+    generator.shuffle(words)
+
+    return words, [''.join(each_row) for each_row in grid]
+
+
+def count_matches(results):
+    '''
+    Return the total number of matches in the results of solving a puzzle.
+    '''
+
+    return sum(len(locations)
+               for directions_found in results.values()
+               for locations in directions_found.values())
+
+
+def make_solver(solver_path, words, graph, directory):
+    '''
+    Return a function which solves the puzzle of words and graph
+    along solver_path (SOLVER_PATH or a key in ENGINES), writing
+    any files it needs into directory first.
+    '''
+
+    if solver_path != SOLVER_PATH:
+        solve_puzzle = wss.load_engine(solver_path)
+        return lambda: solve_puzzle(words, graph)
+
+    key_path = os.path.join(directory, 'keys.txt')
+    grid_path = os.path.join(directory, 'grid.txt')
+
+    for path, lines in ((key_path, words), (grid_path, graph)):
+        with open(path, 'w') as each_file:
+            each_file.write('\n'.join(lines) + '\n')
+
+    solver = wss.WordSearchSolver(key_path, grid_path, None, no_output=True)
+
+    return solver.solve_puzzle
+
+
+def measure(solve, repeat=3, memory=True):
+    '''
+    Call solve repeat times, and return a tuple of (best_seconds,
+    matches, peak_bytes), where peak_bytes is None unless memory is True.
+    '''
+
+    import tracemalloc
+
+    best_seconds = None
+
+    for _ in range(repeat):
+
+        start_time = time.perf_counter()
+        results = solve()
+        seconds = time.perf_counter() - start_time
+
+        if best_seconds is None or seconds < best_seconds:
+            best_seconds = seconds
+
+    peak_bytes = None
+
+    if memory:
+        tracemalloc.start()
+        try:
+            solve()
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return best_seconds, count_matches(results), peak_bytes
+
+
+def run_sweep(sizes=(50, 100, 200), word_counts=(10, 100),
+              word_lengths=(5, 8), skews=(0.0, 1.0), solver_paths=None,
+              alphabet=DEFAULT_ALPHABET, repeat=3, memory=True, seed=0):
+    '''
+    Solve a generated puzzle for every combination of sizes (the height
+    and width of square grids), word_counts, word_lengths and skews along
+    every one of solver_paths (defaults to SOLVER_PATH and every engine),
+    yielding a dictionary describing each run as it finishes.
+    '''
+
+    import itertools
+    import tempfile
+
+    if solver_paths is None:
+        solver_paths = [SOLVER_PATH] + sorted(wss.ENGINES)
+
+    for each_path in solver_paths:
+        if each_path != SOLVER_PATH:
+            wss.load_engine(each_path)
+
+    combinations = itertools.product(sizes, word_counts, word_lengths, skews)
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        for size, word_count, word_length, skew in combinations:
+
+            words, graph = generate_puzzle(size, size, word_count,
+                                           word_length, alphabet, skew, seed)
+
+            for each_path in solver_paths:
+
+                solve = make_solver(each_path, words, graph, directory)
+
+                seconds, matches, peak_bytes = measure(solve, repeat, memory)
+
+                yield {
+                    'solver': each_path,
+                    'size': size,
+                    'words': len(words),
+                    'word_length': word_length,
+                    'alphabet': len(alphabet),
+                    'skew': skew,
+                    'seed': seed,
+                    'seconds': seconds,
+                    'matches': matches,
+                    'matches_per_second': matches / seconds if seconds else 0,
+                    'peak_bytes': peak_bytes
+                }
+
+
+def handle_cli_arguments():
+    '''
+    Handle command line interface arguments for running a
+    benchmark sweep and writing its results as JSON Lines.
+    '''
+
+    import sys
+    import json
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the word search solvers on generated puzzles.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 100, 200],
+                        help="height and width of each grid")
+    parser.add_argument('--word-counts', type=int, nargs='+',
+                        default=[10, 100], help="number of words")
+    parser.add_argument('--word-lengths', type=int, nargs='+',
+                        default=[5, 8], help="letters in each word")
+    parser.add_argument('--skews', type=float, nargs='+', default=[0.0, 1.0],
+                        help="how unevenly letters are drawn (0 is evenly)")
+    parser.add_argument('--solvers', nargs='+', default=None,
+                        choices=[SOLVER_PATH] + sorted(wss.ENGINES),
+                        help="solver paths to run (all of them)")
+    parser.add_argument('--alphabet', default=DEFAULT_ALPHABET,
+                        help="letters grids and words are made of")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="runs of each solver, keeping the fastest")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="skip measuring peak memory")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="seed for generating puzzles")
+    parser.add_argument('--output', default=None,
+                        help="(optional) path to output, instead of stdout")
+
+    arguments = parser.parse_args()
+
+    output = sys.stdout
+
+    if arguments.output is not None:
+        output = open(arguments.output, 'w')
+
+    try:
+        for each_result in run_sweep(arguments.sizes, arguments.word_counts,
+                                     arguments.word_lengths, arguments.skews,
+                                     arguments.solvers, arguments.alphabet,
+                                     arguments.repeat,
+                                     not arguments.no_memory, arguments.seed):
+            output.write(json.dumps(each_result) + '\n')
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == '__main__':
+    handle_cli_arguments()
@@ -0,0 +1,152 @@
+# Bitboard Word Search Solver by Ben Friedland
+
+# The goal of this program is to solve word search puzzles.
+
+# This is the dictionary of coordinates from word_search_solver.py
+# turned into bitboards, as used by chess engines. Each letter gets one
+# Python integer with one bit per tile, which is set if that letter is
+# found at that tile. Python integers can be as large as they need to
+# be, so a single integer covers a grid of any size.
+
+# Stepping one tile in any direction is a fixed distance in bits, so
+# shifting a letter's bitboard lines up the tiles it is found at with
+# the tiles a word would have to start at for that letter to be in the
+# right place. ANDing together one shifted bitboard per letter in the
+# word leaves a bit set for every tile the whole word starts at, and
+# each AND handles the entire grid at once.
+
+# Each row is followed by a guard bit which is never set in any
+# bitboard. Stepping left or right off the edge of a row always lands on
+# a guard bit, so a word can't wrap around from one row onto the next.
+# Steps off the top or bottom of the grid shift bits out of range, where
+# they are either dropped or never set in another letter's bitboard.
+
+# This needs nothing beyond pure Python, unlike numpy_word_search_solver.
+
+
+import functools
+
+import word_search_solver as wss
+
+
+def build_bitboards(graph):
+    '''
+    Take in a list of equal-length strings and return a tuple of
+    (bitboards, stride), where bitboards is a dictionary mapping each
+    letter in graph to an integer with the bit at (y * stride + x) set
+    for every (x, y) at which the letter is found.
+
+    stride is one more than the width of the graph, to leave room
+    for the guard bit at the end of every row.
+
+    Raises ValueError if the graph isn't a rectangle, since a longer
+    row would spill into the next one and make false matches.
+    '''
+
+    graph_width = len(graph[0]) if graph else 0
+
+    if any(len(each_row) != graph_width for each_row in graph):
+        raise ValueError("Grid rows must all be the same length.")
+
+    stride = graph_width + 1
+
+    # ORing each bit into a growing integer would copy the whole integer
+    # for every tile. Setting bits in a bytearray doesn't copy anything,
+    # and each letter's bytes are turned into an integer only once.
+    size = (len(graph) * stride + 7) // 8
+
+    letter_bytes = {}
+
+    for y_coordinate, each_row in enumerate(graph):
+
+        row_offset = y_coordinate * stride
+
+        for x_coordinate, each_letter in enumerate(each_row):
+
+            position = row_offset + x_coordinate
+
+            each_bytes = letter_bytes.get(each_letter)
+
+            if each_bytes is None:
+                each_bytes = letter_bytes[each_letter] = bytearray(size)
+
+            each_bytes[position >> 3] |= 1 << (position & 7)
+
+    bitboards = dict((each_letter, int.from_bytes(each_bytes, 'little'))
+                     for each_letter, each_bytes in letter_bytes.items())
+
+    return bitboards, stride
+
+
+def find_word_in_direction(bitboards, stride, word, direction):
+    '''
+    Return a list of the (x, y) coordinates of every tile at which
+    the already-normalized word starts, reading in direction (a key in
+    WordSearchSolver.directions), using bitboards and stride from
+    build_bitboards.
+
+    Coordinates are ordered top to bottom, then left to right.
+    '''
+
+    dy, dx = wss.WordSearchSolver.directions[direction]
+
+    step = dy * stride + dx
+
+    starts = -1  # Every bit set.
+
+    for index, each_letter in enumerate(word):
+
+        letter_bitboard = bitboards.get(each_letter, 0)
+
+        # Move the bit for the tile holding this letter back
+        # onto the bit for the tile the word would start at.
+        offset = index * step
+
+        if offset >= 0:
+            starts &= letter_bitboard >> offset
+        else:
+            starts &= letter_bitboard << -offset
+
+        if not starts:
+            return []
+
+    results = []
+
+    # Pop set bits off the bottom of the bitboard, so that
+    # the results come out in top to bottom, left to right order.
+    while starts:
+        lowest_bit = starts & -starts
+        position = lowest_bit.bit_length() - 1
+        starts ^= lowest_bit
+
+        y, x = divmod(position, stride)
+
+        # The (x, y) ordering is intentional for readability.
+        results.append((x, y))
+
+    return results
+
+
+def solve_puzzle(words, graph):
+    '''
+    Find every word in words inside graph (a list of equal-length strings)
+    and return the same {word: {direction: [(x, y), ...]}} dictionary
+    returned by the other solvers.
+    '''
+
+    bitboards, stride = build_bitboards(graph)
+
+    find = functools.partial(find_word_in_direction, bitboards, stride)
+
+    found_words = {}
+
+    for each_word in words:
+
+        target = wss.normalize_word(each_word)
+
+        if not target:
+            continue
+
+        found_words[each_word] = wss.find_in_all_directions(target, find)
+
+    return wss.arrange_results(words, found_words)
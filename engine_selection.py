@@ -0,0 +1,233 @@
+# Automatic engine selection for the word search solvers by Ben Friedland
+
+# Which solver is fastest depends on the puzzle. The dictionary of
+# coordinates and the simple solver slow down with every word added,
+# the Aho-Corasick automaton reads the whole grid once however many words
+# there are, and NumPy and the bitboards handle a whole grid at a time
+# per letter of each word, but pay for every match they turn back into
+# coordinates. A grid made of only a few letters makes far more partial
+# and complete matches than one using the whole alphabet, which slows down
+# every solver, though not all of them equally.
+
+# estimate_costs predicts how many seconds each engine in
+# word_search_solver.ENGINES would take, from statistics which are cheap to
+# gather: how often each letter appears in the grid, how many words there
+# are and how long they are, and from those, roughly how many tiles each
+# engine will look at and how many matches there will be. The constants
+# in COSTS were measured with CPython 3.11 on grids of 20x20 to 300x300
+# tiles, with alphabets of 2 and 26 letters and 10 to 400 words. The
+# predictions are rough, but only need to rank the engines, which usually
+# differ by far more than the predictions are off by.
+
+# Registered in ENGINES as 'auto', so it can be used anywhere an
+# engine name can. The engine chosen, and why, is logged at INFO level.
+
+
+import os
+import logging
+import collections
+
+import word_search_solver as wss
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds per unit of work, for each kind of work each engine does.
+COSTS = {
+    # Building the Puzzle's tables, per tile.
+    'coordinates_tile': 1e-5,
+    # Checking for a word at one occurrence of its first letter.
+    'coordinates_probe': 1e-6,
+    # Checking for a word and its reversal at one tile, in one direction.
+    'simple_probe': 3e-7,
+    # Searching one line of the grid for one word, per letter, using
+    # str.find, which runs in C.
+    'lines_letter': 2e-8,
+    # Reading one letter of the grid through the automaton.
+    'aho_corasick_letter': 3.5e-7,
+    # Compiling one letter of one word into the automaton.
+    'aho_corasick_word_letter': 2e-6,
+    # Comparing one tile in one NumPy mask, and each mask operation.
+    'numpy_tile': 1.5e-10,
+    'numpy_operation': 5e-6,
+    # Shifting and ANDing one bit of a bitboard, and
+    # setting the bit for one tile in its letter's bitboard.
+    'bitboard_bit': 7e-11,
+    'bitboard_build': 1.6e-7,
+    # Starting the worker processes for the tiled solver.
+    'tiled_start': 0.3,
+    # Turning one match back into coordinates, for every engine but
+    # the bitboards, which pay bitboard_match instead.
+    'match': 1e-6,
+    'bitboard_match': 4e-6
+}
+
+
+def gather_statistics(words, graph):
+    '''
+    Return a dictionary of the statistics estimate_costs works from.
+    '''
+
+    letter_counts = collections.Counter()
+
+    for each_row in graph:
+        letter_counts.update(each_row)
+
+    tiles = sum(letter_counts.values())
+
+    targets = [target for target in (wss.normalize_word(each_word)
+                                     for each_word in words) if target]
+
+    # How often a word starts at a tile in one direction, if
+    # the letters in the grid are placed at random.
+    expected_matches = 0.0
+
+    # How many tiles hold the first letter of a word or its reversal.
+    first_letter_tiles = 0
+
+    for target in targets:
+
+        chance = 1.0
+
+        for letter in target:
+            chance *= letter_counts[letter] / float(tiles or 1)
+
+        expected_matches += 8 * tiles * chance
+
+        first_letter_tiles += (letter_counts[target[0]] +
+                               letter_counts[target[-1]])
+
+    # The chance that two tiles hold the same letter, which is how
+    # often a search which has matched one letter goes on to the next.
+    repeat_chance = sum((count / float(tiles)) ** 2
+                        for count in letter_counts.values()) if tiles else 0.0
+
+    widths = set(len(each_row) for each_row in graph)
+
+    try:
+        ''.join(graph).encode('latin-1')
+        single_byte = True
+    except UnicodeEncodeError:
+        single_byte = False
+
+    return {
+        'tiles': tiles,
+        'words': len(targets),
+        'word_letters': sum(len(target) for target in targets),
+        'mean_length': (sum(len(target) for target in targets) /
+                        float(len(targets))) if targets else 0.0,
+        'expected_matches': expected_matches,
+        'first_letter_tiles': first_letter_tiles,
+        'repeat_chance': repeat_chance,
+        'rectangular': len(widths) <= 1,
+        'single_byte': single_byte
+    }
+
+
+def estimate_costs(words, graph, statistics=None):
+    '''
+    Return a dictionary mapping the name of every engine which can
+    solve graph to the number of seconds it is expected to take.
+    '''
+
+    import importlib.util
+
+    if statistics is None:
+        statistics = gather_statistics(words, graph)
+
+    tiles = statistics['tiles']
+    word_count = statistics['words']
+    matches = statistics['expected_matches']
+    match_cost = matches * COSTS['match']
+
+    # Each letter matched makes the next one worth checking.
+    run_length = 1 + statistics['repeat_chance'] * 2
+
+    costs = {}
+
+    costs['coordinates'] = (
+        tiles * COSTS['coordinates_tile'] +
+        4 * statistics['first_letter_tiles'] * run_length *
+        COSTS['coordinates_probe'] + match_cost)
+
+    costs['simple'] = (4 * word_count * tiles * run_length *
+                       COSTS['simple_probe'] + match_cost)
+
+    # Every line is searched once in each direction for each word.
+    costs['lines'] = (8 * word_count * tiles * COSTS['lines_letter'] +
+                      match_cost)
+
+    costs['aho_corasick'] = (
+        2 * statistics['word_letters'] * COSTS['aho_corasick_word_letter'] +
+        4 * tiles * COSTS['aho_corasick_letter'] + match_cost)
+
+    # The engines which read the grid as lines of letters can solve
+    # grids with rows of different lengths, but the others can't.
+    if not statistics['rectangular']:
+        return costs
+
+    operations = 8 * statistics['word_letters']
+
+    if (statistics['single_byte'] and
+            importlib.util.find_spec('numpy') is not None):
+        costs['numpy'] = (operations * tiles * COSTS['numpy_tile'] +
+                          operations * COSTS['numpy_operation'] + match_cost)
+
+    costs['bitboard'] = (tiles * COSTS['bitboard_build'] +
+                         operations * tiles * COSTS['bitboard_bit'] +
+                         matches * COSTS['bitboard_match'])
+
+    workers = os.cpu_count() or 1
+
+    # Splitting the grid up only pays off if there's
+    # more than one CPU to hand the pieces to.
+    if statistics['single_byte'] and workers > 1:
+        costs['tiled'] = (COSTS['tiled_start'] +
+                          costs['aho_corasick'] / workers)
+
+    return costs
+
+
+def choose_engine(words, graph):
+    '''
+    Return a tuple of (engine, reason), where engine is the name of
+    the engine expected to solve graph for words the fastest, and
+    reason is a sentence explaining why.
+    '''
+
+    statistics = gather_statistics(words, graph)
+
+    costs = estimate_costs(words, graph, statistics)
+
+    ranking = sorted(costs, key=lambda engine: costs[engine])
+
+    engine = ranking[0]
+
+    reason = ("{} words (mean length {:.1f}) in {} tiles, {} distinct"
+              " letters, about {:.0f} matches expected; {} estimated at"
+              " {:.4f}s".format(statistics['words'],
+                                statistics['mean_length'],
+                                statistics['tiles'],
+                                len(set(''.join(graph))),
+                                statistics['expected_matches'],
+                                engine, costs[engine]))
+
+    if len(ranking) > 1:
+        reason += ", ahead of {} at {:.4f}s".format(ranking[1],
+                                                    costs[ranking[1]])
+
+    return engine, reason + '.'
+
+
+def solve_puzzle(words, graph):
+    '''
+    Find every word in words inside graph with whichever engine
+    choose_engine expects to be fastest, and return the same
+    {word: {direction: [(x, y), ...]}} dictionary as the other solvers.
+    '''
+
+    engine, reason = choose_engine(words, graph)
+
+    logger.info("Chose the '%s' engine: %s", engine, reason)
+
+    return wss.load_engine(engine)(words, graph)
@@ -0,0 +1,175 @@
+# Line Word Search Solver by Ben Friedland
+
+# The goal of this program is to solve word search puzzles.
+
+# Both of the other solvers step through the grid one tile at a time
+# in Python, for every word and every direction. This version instead
+# cuts the grid into straight lines of letters once: every row, every
+# column, and both families of diagonals. Each line is kept as a plain
+# string along with the coordinates of its first letter and the
+# direction it was read in, which is all that is needed to turn a
+# position in the line back into (x, y) coordinates.
+
+# Finding a word is then a matter of calling str.find on each line
+# for the word and for the word spelled backwards, which does the
+# letter-by-letter comparison in C rather than in the Python interpreter.
+# Lines only need to be read in the four directions listed in
+# WordSearchSolver.canonical_directions, because finding the reversed
+# word in a line finds the word itself reading the opposite way.
+
+# Rows don't all have to be the same length (a grid file ending with a
+# blank line gives an empty last row, for example). A column or diagonal
+# which crosses a short row is cut in two at the missing tile, so no
+# word is found running through a tile which isn't there.
+
+
+import word_search_solver as wss
+
+
+def extract_lines(graph):
+    '''
+    Take in a list of strings and return a list of (line, x, y,
+    direction) tuples, one for every row, column and diagonal in the
+    graph, or for every unbroken piece of one if it crosses a row too
+    short to reach it.
+
+    x and y are the coordinates of the first letter in the line, and
+    direction is the code (from WordSearchSolver.canonical_directions)
+    of the direction the line was read in. Letter number i of the line
+    can be found at (x + i * dx, y + i * dy), using the steps for that
+    direction in WordSearchSolver.directions.
+    '''
+
+    graph_height = len(graph)                       # y axis
+    graph_width = max([len(each_row) for each_row in graph] or [0])
+
+    starts = []
+
+    for y in range(graph_height):
+        starts.append((0, y, 'LR'))
+
+    for x in range(graph_width):
+        starts.append((x, 0, 'D'))
+
+    # Diagonals running down and right start along the top edge
+    # and the left edge, while those running down and left start
+    # along the top edge and the right edge.
+    for x in range(graph_width):
+        starts.append((x, 0, 'DDR'))
+    for y in range(1, graph_height):
+        starts.append((0, y, 'DDR'))
+
+    for x in range(graph_width):
+        starts.append((x, 0, 'DDL'))
+    for y in range(1, graph_height):
+        starts.append((graph_width - 1, y, 'DDL'))
+
+    lines = []
+
+    for x, y, direction in starts:
+
+        dy, dx = wss.WordSearchSolver.directions[direction]
+
+        letters = []
+        step_x, step_y = x, y
+
+        while 0 <= step_y < graph_height and 0 <= step_x < graph_width:
+
+            row = graph[step_y]
+
+            if step_x < len(row):
+                letters.append(row[step_x])
+
+            else:
+                # The line is broken here, so start a new one after it.
+                if letters:
+                    lines.append((''.join(letters), x, y, direction))
+                    letters = []
+
+                x, y = step_x + dx, step_y + dy
+
+            step_x += dx
+            step_y += dy
+
+        if letters:
+            lines.append((''.join(letters), x, y, direction))
+
+    return lines
+
+
+def find_all(line, word):
+    '''
+    Return a list of every index in line at which word begins,
+    including occurrences which overlap each other.
+    '''
+
+    indices = []
+
+    index = line.find(word)
+
+    while index != -1:
+        indices.append(index)
+        index = line.find(word, index + 1)
+
+    return indices
+
+
+def locate_match(x, y, direction, index):
+    '''
+    Return the (x, y) coordinates of letter number index in
+    a line which starts at x, y and is read in direction.
+    '''
+
+    dy, dx = wss.WordSearchSolver.directions[direction]
+
+    return (x + index * dx, y + index * dy)
+
+
+def solve_puzzle(words, graph):
+    '''
+    Find every word in words inside graph (a list of strings) and return
+    the same {word: {direction: [(x, y), ...]}} dictionary returned by
+    the other solvers.
+    '''
+
+    lines = extract_lines(graph)
+
+    found_words = {}
+
+    for each_word in words:
+
+        target = wss.normalize_word(each_word)
+
+        # An empty string would be "found" between every pair of letters.
+        if not target:
+            continue
+
+        reversed_target = target[::-1]
+
+        found_words[each_word] = directions_found = {}
+
+        for line, x, y, direction in lines:
+
+            if len(target) > len(line):
+                continue
+
+            indices = find_all(line, target)
+
+            # A palindrome reads the same backwards, so the matches
+            # for its reversal are the ones which were just found.
+            if reversed_target == target:
+                reversed_indices = indices
+            else:
+                reversed_indices = find_all(line, reversed_target)
+
+            for index in indices:
+                coords = locate_match(x, y, direction, index)
+                directions_found.setdefault(direction, []).append(coords)
+
+            for index in reversed_indices:
+                coords, opposite = wss.flip_match(
+                    locate_match(x, y, direction, index),
+                    direction, len(target))
+                directions_found.setdefault(opposite, []).append(coords)
+
+    return wss.arrange_results(words, found_words)
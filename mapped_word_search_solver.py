@@ -0,0 +1,246 @@
+# Memory-Mapped Word Search Solver by Ben Friedland
+
+# The goal of this program is to solve word search puzzles too large to
+# load into memory.
+
+# load_list_from_text_file reads a whole grid into a list of strings,
+# and WordSearchSolver then builds several more structures with an entry
+# for every tile. This version instead memory-maps the grid file and,
+# since every row is the same length, treats the mapping as a grid of
+# bytes: the letter at (x, y) is always at offset y * stride + x, where
+# stride is the length of a row plus its line ending. The operating
+# system pages the file in and out as it is read, so nothing is copied
+# until a row is asked for.
+
+# The grid is solved in horizontal bands of rows, each with a halo of
+# extra rows above and below as tall as the longest word minus one letter,
+# so that every word starting in the band fits in what is read. Any of the
+# solvers in word_search_solver.ENGINES can solve each band, and only the
+# matches starting inside the band itself are kept. Only one band's rows
+# are held in memory at a time, however large the grid file is.
+
+# Grids must be made of single-byte (eg ASCII) characters, one row per line.
+
+
+import mmap
+
+import word_search_solver as wss
+
+
+class MappedGrid(object):
+    '''
+    Create a MappedGrid from the path to a grid file with rows of
+    equal length, which can then be used like the list of strings
+    returned by load_list_from_text_file without reading the file.
+
+    Call close when finished with it, or use it in a with statement.
+    '''
+
+    def __init__(self, grid_path):
+
+        self.grid_file = open(grid_path, 'rb')
+
+        try:
+            self.mapping = mmap.mmap(self.grid_file.fileno(), 0,
+                                     access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file can't be mapped.
+            self.mapping = b''
+
+        size = len(self.mapping)
+
+        first_line_end = self.mapping.find(b'\n')
+
+        if first_line_end == -1:
+            # A single row, without a line ending.
+            self.width = size
+            self.stride = size
+            self.line_ending = b''
+            self.height = 1 if size else 0
+            return
+
+        if first_line_end > 0 and self.mapping[first_line_end - 1:
+                                               first_line_end] == b'\r':
+            self.width = first_line_end - 1
+        else:
+            self.width = first_line_end
+
+        self.stride = first_line_end + 1
+
+        self.line_ending = self.mapping[self.width:self.stride]
+
+        line_ending_length = len(self.line_ending)
+
+        # Grid files which end with blank lines are accepted by
+        # load_list_from_text_file, so they're accepted here too. The
+        # blank lines aren't rows: only the line ending after the last
+        # letter is counted.
+        end = size
+
+        while end and self.mapping[end - 1] in b'\r\n':
+            end -= 1
+
+        size = min(size, end + line_ending_length)
+
+        # The last row doesn't need a line ending.
+        self.height = (size + line_ending_length) // self.stride
+
+        full_size = self.height * self.stride
+
+        if (self.width == 0 or
+                size not in (full_size, full_size - line_ending_length)):
+            self.close()
+            raise ValueError("Grid rows in {} must all be the same"
+                             " length.".format(grid_path))
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, y):
+
+        if isinstance(y, slice):
+            return [self[each_y] for each_y in range(*y.indices(self.height))]
+
+        if y < 0:
+            y += self.height
+
+        if not 0 <= y < self.height:
+            raise IndexError("Row {} is outside of the grid.".format(y))
+
+        start = y * self.stride
+
+        row = self.mapping[start:start + self.stride]
+
+        # Rows are only checked as they're read, rather than reading
+        # the whole file up front, so check this one ends where it should.
+        line_ending = row[self.width:]
+
+        if line_ending != self.line_ending and not (
+                y == self.height - 1 and not line_ending):
+            raise ValueError("Grid row {} is not {} letters"
+                             " long.".format(y, self.width))
+
+        return row[:self.width].decode('latin-1')
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield self[y]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception_info):
+        self.close()
+
+    def close(self):
+        '''
+        Release the mapping and the grid file.
+        '''
+
+        if isinstance(self.mapping, mmap.mmap):
+            self.mapping.close()
+
+        self.grid_file.close()
+
+
+def solve_in_bands(words, grid, engine='aho_corasick', band_height=None):
+    '''
+    Find every word in words inside grid (a MappedGrid, or anything
+    else which acts like a list of equal-length strings) one band of
+    rows at a time, using engine (a key in word_search_solver.ENGINES),
+    and return the same {word: {direction: [(x, y), ...]}} dictionary
+    as the other solvers.
+
+    band_height defaults to however many rows fit in about 16MB.
+    '''
+
+    if band_height is None:
+        row_length = len(grid[0]) if len(grid) else 1
+        band_height = max(1, (16 * 1024 * 1024) // max(1, row_length))
+
+    solve = wss.compile_engine(engine, words)
+
+    # Every word starting in a band ends within this many rows of it.
+    longest_word = max([len(wss.normalize_word(each_word))
+                        for each_word in words] or [0])
+    halo = max(0, longest_word - 1)
+
+    found_words = {}
+
+    for top in range(0, len(grid), band_height):
+
+        bottom = min(top + band_height, len(grid))
+
+        region_top = max(0, top - halo)
+        region_bottom = min(len(grid), bottom + halo)
+
+        results = solve(grid[region_top:region_bottom])
+
+        for each_word, directions_found in results.items():
+            for each_direction, locations in directions_found.items():
+                for x, y in locations:
+
+                    # Move from the region's coordinates to the grid's.
+                    y += region_top
+
+                    # Matches starting in the halo belong to another band.
+                    if top <= y < bottom:
+                        found_directions = found_words.setdefault(each_word,
+                                                                  {})
+                        found_directions.setdefault(each_direction,
+                                                    []).append((x, y))
+
+    return wss.arrange_results(words, found_words)
+
+
+def solve_puzzle_file(words, grid_path, engine='aho_corasick',
+                      band_height=None):
+    '''
+    Memory-map the grid file at grid_path and find every word in words
+    inside it, one band of rows at a time. See solve_in_bands.
+    '''
+
+    with MappedGrid(grid_path) as grid:
+        return solve_in_bands(words, grid, engine, band_height)
+
+
+def handle_cli_arguments():
+    '''
+    Handle command line interface arguments for solving a puzzle
+    straight from a memory-mapped grid file.
+    '''
+
+    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Solve a word search puzzle from a memory-mapped grid.")
+    parser.add_argument('keys', help="path to keys")
+    parser.add_argument('grid', help="path to grid")
+    parser.add_argument('solution', nargs='?', default='mapped_solution.txt',
+                        help="(optional) path to output")
+    parser.add_argument('--engine', default='aho_corasick',
+                        choices=sorted(wss.ENGINES),
+                        help="solver used for each band of rows")
+    parser.add_argument('--band-height', type=int, default=None,
+                        help="number of rows solved at a time")
+
+    arguments = parser.parse_args()
+
+    try:
+        words = wss.load_list_from_text_file(arguments.keys)
+
+        results = solve_puzzle_file(words, arguments.grid, arguments.engine,
+                                    arguments.band_height)
+
+        wss.write_solution_to_file(results, arguments.solution)
+
+    except (IOError, ValueError):
+        print("\n{}\n".format(sys.exc_info()[1]))
+        sys.exit(1)
+
+    print("{} file written.".format(arguments.solution))
+
+
+if __name__ == '__main__':
+    handle_cli_arguments()
@@ -0,0 +1,145 @@
+# NumPy Word Search Solver by Ben Friedland
+
+# The goal of this program is to solve word search puzzles.
+
+# This version loads the grid into a two-dimensional NumPy array of bytes.
+# To find a word in one direction, it compares a shifted view of the whole
+# grid against each letter of the word, producing one boolean mask per
+# letter, and ANDs the masks together. Whatever survives is a tile at which
+# the whole word starts in that direction. Every comparison runs over the
+# entire grid at once inside NumPy, rather than tile by tile in Python.
+
+# NumPy is optional. If it can't be imported, solve_puzzle falls back
+# to the pure-Python line_word_search_solver, which gives the same results.
+# So do grids which can't be loaded into an array: those with rows of
+# different lengths, or letters which don't fit in a byte. Empty rows at
+# the bottom of the grid (from a grid file ending with a blank line) hold
+# no tiles, so they're left out of the array rather than falling back.
+
+
+import functools
+
+import word_search_solver as wss
+import line_word_search_solver as lws
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def build_array(graph):
+    '''
+    Take in a list of equal-length strings and return a two-dimensional
+    uint8 NumPy array with one byte per tile, indexed as array[y, x].
+
+    Raises ValueError if the graph contains characters which
+    don't fit in a single byte, or if it isn't a rectangle.
+    '''
+
+    graph_height = len(graph)
+    graph_width = len(graph[0]) if graph else 0
+
+    try:
+        data = ''.join(graph).encode('latin-1')
+    except UnicodeEncodeError:
+        raise ValueError("Grid contains characters outside of Latin-1.")
+
+    if len(data) != graph_height * graph_width:
+        raise ValueError("Grid rows must all be the same length.")
+
+    array = numpy.frombuffer(data, dtype=numpy.uint8)
+
+    return array.reshape((graph_height, graph_width))
+
+
+def find_word_in_direction(array, word, direction):
+    '''
+    Return a list of the (x, y) coordinates of every tile in array
+    (from build_array) at which the already-normalized word starts,
+    reading in direction (a key in WordSearchSolver.directions).
+
+    Coordinates are ordered top to bottom, then left to right.
+    '''
+
+    graph_height, graph_width = array.shape
+
+    dy, dx = wss.WordSearchSolver.directions[direction]
+
+    # Only tiles from which the whole word fits inside the
+    # grid can be starting points, which bounds the mask.
+    span_y = (len(word) - 1) * dy
+    span_x = (len(word) - 1) * dx
+
+    top = max(0, -span_y)
+    bottom = graph_height - max(0, span_y)
+    left = max(0, -span_x)
+    right = graph_width - max(0, span_x)
+
+    if bottom <= top or right <= left:
+        return []
+
+    mask = numpy.ones((bottom - top, right - left), dtype=bool)
+
+    for index, each_letter in enumerate(word):
+
+        code = ord(each_letter)
+
+        # This letter can't possibly be in a grid of single bytes.
+        if code > 255:
+            return []
+
+        # The view of the grid holding each starting tile's
+        # index-th letter in this direction:
+        y = top + index * dy
+        x = left + index * dx
+        shifted = array[y:y + bottom - top, x:x + right - left]
+
+        mask &= (shifted == code)
+
+        if not mask.any():
+            return []
+
+    ys, xs = numpy.nonzero(mask)
+
+    # The (x, y) ordering is intentional for readability.
+    return list(zip((xs + left).tolist(), (ys + top).tolist()))
+
+
+def solve_puzzle(words, graph):
+    '''
+    Find every word in words inside graph (a list of equal-length strings)
+    and return the same {word: {direction: [(x, y), ...]}} dictionary
+    returned by the other solvers.
+
+    Falls back to line_word_search_solver if NumPy is not
+    installed or the grid can't be loaded into an array.
+    '''
+
+    if numpy is None:
+        return lws.solve_puzzle(words, graph)
+
+    graph = list(graph)
+
+    while graph and not graph[-1]:
+        graph.pop()
+
+    try:
+        array = build_array(graph)
+    except ValueError:
+        return lws.solve_puzzle(words, graph)
+
+    find = functools.partial(find_word_in_direction, array)
+
+    found_words = {}
+
+    for each_word in words:
+
+        target = wss.normalize_word(each_word)
+
+        if not target:
+            continue
+
+        found_words[each_word] = wss.find_in_all_directions(target, find)
+
+    return wss.arrange_results(words, found_words)
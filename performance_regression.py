@@ -0,0 +1,305 @@
+# Performance regression checks for the word search solvers by Ben Friedland
+
+# The unit tests check that each solver finds the right words in
+# word_search.txt, but not whether a change has made one of them slower,
+# or made it disagree with the others on a puzzle big enough to be
+# interesting. This replays a fixed corpus of generated puzzles (see
+# benchmark.py) through every solver path, and checks two things:
+
+# First, that every path returns exactly the same results dictionary for
+# each puzzle, so a change which speeds a solver up can't quietly change
+# what it finds.
+
+# Second, that no path has become slower than it was when the baseline
+# file was written. Timings are noisy, so a path only counts as slower
+# when its best time over several repeats is more than threshold times
+# its baseline time, plus a fixed tolerance in seconds, which keeps the
+# very fastest runs (where a little noise is a large fraction) from
+# failing at random.
+
+# Timings depend on the machine, so the baseline should be written, with
+# --update-baseline, on the machine that will run the checks, and written
+# again when a change is meant to make something slower, or changes the
+# code every solve goes through (such as the probing loop in
+# word_search_solver). The baseline records the Python version and
+# platform it was written with, and a warning is printed when they don't
+# match.
+
+# By default, both the baseline and the checks take the best of 10 runs
+# of each solver (DEFAULT_REPEAT), and a check allows 1.5 times the
+# baseline time (DEFAULT_THRESHOLD) plus 0.01 seconds (DEFAULT_TOLERANCE).
+# Taking the best of fewer runs, or allowing less, was enough for a single
+# busy moment to fail the baseline file kept with the code against its own
+# commit. With these defaults it passes on an idle machine. Write and
+# check the baseline with nothing else running, or raise --repeat to give
+# each solver more chances at a quiet run.
+
+# Run from the command line, the exit status is 1 if any check fails.
+
+
+import sys
+
+import benchmark
+
+
+DEFAULT_BASELINE_PATH = 'performance_baseline.json'
+
+# The puzzles replayed, as the arguments to benchmark.generate_puzzle.
+# They're kept small enough for the slowest solvers to get through all
+# of them in a few seconds each.
+CORPUS = (
+    {'height': 18, 'width': 18, 'word_count': 50, 'word_length': 6,
+     'skew': 0.0, 'seed': 1},
+    {'height': 60, 'width': 60, 'word_count': 100, 'word_length': 7,
+     'skew': 0.0, 'seed': 2},
+    {'height': 60, 'width': 80, 'word_count': 40, 'word_length': 4,
+     'alphabet': 'ABC', 'skew': 0.0, 'seed': 3},
+    {'height': 120, 'width': 120, 'word_count': 20, 'word_length': 9,
+     'skew': 1.5, 'seed': 4}
+)
+
+DEFAULT_THRESHOLD = 1.5
+DEFAULT_TOLERANCE = 0.01
+DEFAULT_REPEAT = 10
+
+
+def puzzle_name(specification):
+    '''
+    Return a short name for the puzzle made from specification,
+    which is the same every time the corpus is replayed.
+    '''
+
+    alphabet = specification.get('alphabet', benchmark.DEFAULT_ALPHABET)
+
+    return ('{height}x{width}, {word_count} words of {word_length}'
+            ' letters, {letters} letter alphabet, skew {skew},'
+            ' seed {seed}'.format(letters=len(alphabet), **specification))
+
+
+def available_solver_paths():
+    '''
+    Return a list of every solver path which can run here, leaving out
+    any engine whose optional dependencies (such as NumPy) are missing.
+    '''
+
+    import word_search_solver as wss
+
+    solver_paths = [benchmark.SOLVER_PATH]
+
+    for each_engine in sorted(wss.ENGINES):
+        try:
+            wss.load_engine(each_engine)
+        except ImportError:
+            continue
+        solver_paths.append(each_engine)
+
+    return solver_paths
+
+
+def replay_corpus(corpus=CORPUS, solver_paths=None, repeat=DEFAULT_REPEAT):
+    '''
+    Solve every puzzle in corpus along every one of solver_paths (defaults
+    to available_solver_paths()), and return a tuple of (timings,
+    mismatches): timings maps each puzzle's name to a dictionary of the
+    best time taken by each path, and mismatches is a list of (puzzle
+    name, solver path) pairs where a path's results differed from those
+    of the first path.
+    '''
+
+    import tempfile
+
+    if solver_paths is None:
+        solver_paths = available_solver_paths()
+
+    timings = {}
+    mismatches = []
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        for each_specification in corpus:
+
+            name = puzzle_name(each_specification)
+
+            words, graph = benchmark.generate_puzzle(**each_specification)
+
+            timings[name] = {}
+
+            expected = None
+
+            for each_path in solver_paths:
+
+                solve = benchmark.make_solver(each_path, words, graph,
+                                              directory)
+
+                results = solve()
+
+                if expected is None:
+                    expected = results
+                elif results != expected:
+                    mismatches.append((name, each_path))
+
+                seconds, _, _ = benchmark.measure(solve, repeat,
+                                                  memory=False)
+
+                timings[name][each_path] = seconds
+
+    return timings, mismatches
+
+
+def find_slowdowns(timings, baseline, threshold=DEFAULT_THRESHOLD,
+                   tolerance=DEFAULT_TOLERANCE):
+    '''
+    Return a list of (puzzle name, solver path, baseline seconds, seconds)
+    tuples for each time in timings which is more than threshold times
+    its time in baseline, plus tolerance. Times with nothing to compare
+    against in baseline are left out.
+    '''
+
+    slowdowns = []
+
+    for name in sorted(timings):
+        for each_path in sorted(timings[name]):
+
+            baseline_seconds = baseline.get(name, {}).get(each_path)
+
+            if baseline_seconds is None:
+                continue
+
+            seconds = timings[name][each_path]
+
+            if seconds > baseline_seconds * threshold + tolerance:
+                slowdowns.append((name, each_path, baseline_seconds,
+                                  seconds))
+
+    return slowdowns
+
+
+def describe_environment():
+    '''
+    Return a dictionary describing the Python and
+    platform the timings are being taken with.
+    '''
+
+    import platform
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform()
+    }
+
+
+def load_baseline(baseline_path):
+    '''
+    Return a tuple of (timings, environment) read from the baseline file.
+    '''
+
+    import json
+
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+
+    return baseline['timings'], baseline['environment']
+
+
+def save_baseline(timings, baseline_path):
+    '''
+    Write timings, and the environment they
+    were taken in, to the baseline file.
+    '''
+
+    import json
+
+    with open(baseline_path, 'w') as baseline_file:
+        json.dump({'environment': describe_environment(),
+                   'timings': timings},
+                  baseline_file, indent=2, sort_keys=True)
+        baseline_file.write('\n')
+
+
+def handle_cli_arguments():
+    '''
+    Handle command line interface arguments for replaying the corpus and
+    either checking it against the baseline or writing a new baseline.
+    '''
+
+    import os
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Check the word search solvers for slowdowns"
+                    " and for disagreements between solvers.")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH,
+                        help="path to the baseline timings")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="write new baseline timings instead of"
+                             " checking against them")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="how many times slower than its baseline a"
+                             " solver may get")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="seconds of noise to allow on top of that")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help="runs of each solver, keeping the fastest")
+    parser.add_argument('--solvers', nargs='+', default=None,
+                        help="solver paths to run (all those available)")
+
+    arguments = parser.parse_args()
+
+    if arguments.threshold < 1:
+        parser.error("--threshold must be at least 1.")
+
+    baseline = None
+
+    if not arguments.update_baseline:
+
+        if not os.path.exists(arguments.baseline):
+            parser.error("No baseline at '{}'. Write one with"
+                         " --update-baseline.".format(arguments.baseline))
+
+        baseline, environment = load_baseline(arguments.baseline)
+
+        if environment != describe_environment():
+            print("Warning: the baseline was written with Python {} on {},"
+                  " so timings may not be comparable.".format(
+                      environment.get('python'), environment.get('platform')))
+
+    timings, mismatches = replay_corpus(solver_paths=arguments.solvers,
+                                        repeat=arguments.repeat)
+
+    failed = False
+
+    for name, each_path in mismatches:
+        print("MISMATCH: {} disagrees with {} on the puzzle {}.".format(
+            each_path, (arguments.solvers or [benchmark.SOLVER_PATH])[0],
+            name))
+        failed = True
+
+    if arguments.update_baseline:
+
+        # A baseline is only worth keeping if the solvers agree.
+        if failed:
+            print("Not writing a baseline while solvers disagree.")
+        else:
+            save_baseline(timings, arguments.baseline)
+            print("Wrote baseline timings to '{}'.".format(
+                arguments.baseline))
+
+    else:
+
+        for name, each_path, baseline_seconds, seconds in find_slowdowns(
+                timings, baseline, arguments.threshold, arguments.tolerance):
+            print("SLOWDOWN: {} took {:.4f}s, up from {:.4f}s, on the"
+                  " puzzle {}.".format(each_path, seconds, baseline_seconds,
+                                       name))
+            failed = True
+
+        if not failed:
+            print("All {} solvers agree and none have slowed down.".format(
+                len(next(iter(timings.values())))))
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    handle_cli_arguments()
@@ -0,0 +1,435 @@
+# Live word search puzzle sessions by Ben Friedland
+
+# The solvers all start from nothing, so changing a single letter in a
+# grid means solving the whole puzzle again. A PuzzleSession solves a
+# puzzle once and then keeps every match it found, filed under each of
+# the tiles the match covers, so that the results can be brought up to
+# date after an edit by only looking at the letters near it.
+
+# Changing the letter at a tile can only break the matches which cover
+# that tile, and can only make new matches which cover it too. Every word
+# covering the tile lies within the longest word's length of it along one
+# of the four lines through it (its row, its column and its two diagonals),
+# reading either way. So the session drops the matches covering each
+# edited tile, and then reads just those four short windows of the grid
+# through an Aho-Corasick automaton of the word list, which finds every
+# word and its reversal in a single pass. Each edit takes time depending
+# on the length of the longest word, rather than on the size of the grid
+# or the number of words.
+
+# Words can be added to and removed from the session as well. New words
+# are found with the same tables a word_search_solver.Puzzle searches
+# (the coordinates of every letter, the letter at every coordinate, and
+# how far each tile is from the edge), so only the tiles holding each new
+# word's first letter are looked at, and the words which were already
+# there aren't searched for again. A Puzzle can't be changed, so the
+# session keeps its own tables, and patches only the edited tiles in them
+# rather than building them again for the whole grid. The automaton is
+# only compiled again the next time the grid is edited.
+
+# Every operation records how long it took, and can rewrite the solution
+# file afterwards. The solution file formats have no way to change part
+# of a file, so the whole file is written again.
+
+
+import time
+import collections
+
+import word_search_solver as wss
+import line_word_search_solver as lws
+import aho_corasick_word_search_solver as acws
+
+
+class PuzzleSession(object):
+    '''
+    Create a PuzzleSession from a list of words and a graph (a list of
+    strings, one per row) and solve it, ready for the graph to be edited
+    with edit_cells and the words to be changed with add_words and
+    remove_words.
+
+    If an optional solution_path is given, the solution file there is
+    written once the puzzle is solved and again after every operation,
+    in output_format (a key in solution_formats.WRITERS).
+
+    Contains a matches set of (word, direction, x, y) tuples, one for every
+    match currently in the grid, a matches_by_tile dictionary mapping each
+    (x, y) tile to the set of matches which cover it, a matches_by_word
+    dictionary doing the same for each word, and a latencies list of
+    (operation, seconds) tuples, one for every operation so far.
+    '''
+
+    def __init__(self, words, graph, solution_path=None,
+                 output_format='text'):
+
+        # A dictionary (of words to None) rather than a list, so words
+        # can be found and removed quickly while keeping their order.
+        self.words = dict.fromkeys(words)
+
+        # Rows are kept as lists of letters, so they can be changed.
+        self.grid = [list(each_row) for each_row in graph]
+
+        self.solution_path = solution_path
+        self.output_format = output_format
+
+        # The tables word_search_solver.iter_word_locations searches,
+        # kept up to date as letters are edited. Edits never change the
+        # length of a row, so how far each tile is from the edge of the
+        # grid never changes.
+        self.coordinates = collections.defaultdict(set)
+        self.letters_by_coordinate = {}
+
+        for y, each_row in enumerate(self.grid):
+            for x, letter in enumerate(each_row):
+                self.coordinates[letter].add((y, x))
+                self.letters_by_coordinate[(y, x)] = letter
+
+        self.reach = wss.build_reach_table(self.grid)
+
+        self.matches = set()
+        self.matches_by_tile = collections.defaultdict(set)
+        self.matches_by_word = collections.defaultdict(set)
+
+        self.latencies = []
+
+        start_time = time.time()
+
+        # Set back to None whenever the word list changes, and compiled
+        # again by edit_cells only when it's needed.
+        self.automaton = acws.Automaton(self.words)
+
+        self.longest_word = max([len(wss.normalize_word(each_word))
+                                 for each_word in self.words] or [0])
+
+        results = acws.solve_puzzle(self.words, graph, self.automaton)
+
+        for each_word, directions_found in results.items():
+            for each_direction, locations in directions_found.items():
+                for x, y in locations:
+                    self.add_match((each_word, each_direction, x, y))
+
+        self.finish_operation('solve', start_time)
+
+    @classmethod
+    def from_files(cls, key_path, grid_path, solution_path=None,
+                   output_format='text'):
+        '''
+        Create a PuzzleSession from the word list at key_path
+        and the grid file at grid_path.
+        '''
+
+        graph = wss.load_list_from_text_file(grid_path)
+
+        # Blank lines at the end of the file aren't rows to be edited.
+        while graph and not graph[-1]:
+            graph.pop()
+
+        return cls(wss.load_list_from_text_file(key_path), graph,
+                   solution_path, output_format)
+
+    def finish_operation(self, operation, start_time):
+        '''
+        Write the solution file, if there is one, and record how long
+        the operation which began at start_time took.
+        '''
+
+        if self.solution_path is not None:
+            import solution_formats
+            solution_formats.write_solution(self.results(),
+                                            self.solution_path,
+                                            self.output_format)
+
+        self.latencies.append((operation, time.time() - start_time))
+
+    def add_match(self, match):
+        '''
+        Record a (word, direction, x, y) match, filing it under
+        every tile it covers.
+        '''
+
+        if match in self.matches:
+            return
+
+        self.matches.add(match)
+        self.matches_by_word[match[0]].add(match)
+
+        for each_tile in self.tiles_covered_by(match):
+            self.matches_by_tile[each_tile].add(match)
+
+    def remove_match(self, match):
+        '''
+        Forget a (word, direction, x, y) match.
+        '''
+
+        self.matches.discard(match)
+
+        matches_for_word = self.matches_by_word.get(match[0])
+
+        if matches_for_word is not None:
+            matches_for_word.discard(match)
+
+            if not matches_for_word:
+                del self.matches_by_word[match[0]]
+
+        for each_tile in self.tiles_covered_by(match):
+
+            matches_here = self.matches_by_tile.get(each_tile)
+
+            if matches_here is not None:
+                matches_here.discard(match)
+
+                # Don't keep an empty set for every tile ever matched.
+                if not matches_here:
+                    del self.matches_by_tile[each_tile]
+
+    def tiles_covered_by(self, match):
+        '''
+        Return a list of the (x, y) tiles covered by
+        a (word, direction, x, y) match.
+        '''
+
+        each_word, direction, x, y = match
+
+        dy, dx = wss.WordSearchSolver.directions[direction]
+
+        return [(x + index * dx, y + index * dy)
+                for index in range(len(wss.normalize_word(each_word)))]
+
+    def letter_at(self, x, y):
+        '''
+        Return the letter at (x, y), or None if it is outside of the grid.
+        '''
+
+        if 0 <= y < len(self.grid) and 0 <= x < len(self.grid[y]):
+            return self.grid[y][x]
+
+        return None
+
+    def edit_cells(self, edits):
+        '''
+        Change the letters in the grid, bring every match up to date, and
+        return a tuple of (added, removed) sets of the (word, direction,
+        x, y) matches which were made or broken.
+
+        edits is a dictionary mapping (x, y) tiles to their new letters,
+        or an iterable of ((x, y), letter) pairs.
+        '''
+
+        start_time = time.time()
+
+        if hasattr(edits, 'items'):
+            edits = edits.items()
+
+        edits = list(edits)
+
+        for (x, y), letter in edits:
+
+            if self.letter_at(x, y) is None:
+                raise IndexError("({}, {}) is outside of the"
+                                 " grid.".format(x, y))
+
+            if len(letter) != 1:
+                raise ValueError("Each tile holds exactly one letter,"
+                                 " not '{}'.".format(letter))
+
+        removed = set()
+
+        for (x, y), letter in edits:
+
+            removed.update(self.matches_by_tile.get((x, y), ()))
+
+            self.coordinates[self.grid[y][x]].discard((y, x))
+            self.coordinates[letter].add((y, x))
+            self.letters_by_coordinate[(y, x)] = letter
+
+            self.grid[y][x] = letter
+
+        for each_match in removed:
+            self.remove_match(each_match)
+
+        if self.automaton is None:
+            self.automaton = acws.Automaton(self.words)
+
+        found = set()
+
+        for (x, y), letter in edits:
+            found.update(self.find_matches_through(x, y))
+
+        for each_match in found:
+            self.add_match(each_match)
+
+        self.finish_operation('edit_cells', start_time)
+
+        # A match which was broken by one edit and remade by another
+        # (or by setting a letter to itself) hasn't really changed.
+        return found - removed, removed - found
+
+    def add_words(self, words):
+        '''
+        Add words to the word list, search for only the new ones, and
+        return a tuple of (added, removed) sets of the (word, direction,
+        x, y) matches which were found or lost. Nothing is ever lost by
+        adding words, so removed is always empty.
+        '''
+
+        start_time = time.time()
+
+        added = set()
+        new_words = []
+
+        for each_word in words:
+
+            if each_word in self.words:
+                continue
+
+            self.words[each_word] = None
+            new_words.append(each_word)
+
+            target = wss.normalize_word(each_word)
+
+            self.longest_word = max(self.longest_word, len(target))
+
+            if not target:
+                continue
+
+            for direction, (x, y) in wss.iter_in_all_directions(
+                    target, self.find_word_in_direction):
+                added.add((each_word, direction, x, y))
+
+        for each_match in added:
+            self.add_match(each_match)
+
+        if new_words:
+            self.automaton = None
+
+        self.finish_operation('add_words', start_time)
+
+        return added, set()
+
+    def remove_words(self, words):
+        '''
+        Remove words from the word list, forgetting their matches, and
+        return a tuple of (added, removed) sets of the (word, direction,
+        x, y) matches which were found or lost. Nothing is ever found by
+        removing words, so added is always empty.
+        '''
+
+        start_time = time.time()
+
+        removed = set()
+        old_words = []
+
+        for each_word in words:
+
+            if each_word not in self.words:
+                continue
+
+            del self.words[each_word]
+            old_words.append(each_word)
+
+            removed.update(self.matches_by_word.get(each_word, ()))
+
+        for each_match in removed:
+            self.remove_match(each_match)
+
+        if old_words:
+            self.automaton = None
+            self.longest_word = max([len(wss.normalize_word(each_word))
+                                     for each_word in self.words] or [0])
+
+        self.finish_operation('remove_words', start_time)
+
+        return set(), removed
+
+    def find_word_in_direction(self, word, direction):
+        '''
+        Return a list of the (x, y) coordinates of every tile the
+        normalized word starts at when read in direction, searching
+        the grid as it is now. See word_search_solver.iter_word_locations.
+        '''
+
+        return list(wss.iter_word_locations(word, direction,
+                                            self.coordinates,
+                                            self.letters_by_coordinate,
+                                            self.reach[direction]))
+
+    def find_matches_through(self, tile_x, tile_y):
+        '''
+        Return a set of every (word, direction, x, y) match in the grid
+        which covers the tile at (tile_x, tile_y).
+        '''
+
+        found = set()
+
+        reach = max(0, self.longest_word - 1)
+
+        for direction in wss.WordSearchSolver.canonical_directions:
+
+            dy, dx = wss.WordSearchSolver.directions[direction]
+
+            # Step back to the start of the window, which is as far
+            # from the tile as the longest word allows, or the edge.
+            steps_back = 0
+
+            while (steps_back < reach and
+                   self.letter_at(tile_x - (steps_back + 1) * dx,
+                                  tile_y - (steps_back + 1) * dy)
+                   is not None):
+                steps_back += 1
+
+            x = tile_x - steps_back * dx
+            y = tile_y - steps_back * dy
+
+            letters = []
+
+            while len(letters) <= steps_back + reach:
+
+                letter = self.letter_at(x + len(letters) * dx,
+                                        y + len(letters) * dy)
+
+                if letter is None:
+                    break
+
+                letters.append(letter)
+
+            for index, pattern in self.automaton.search(''.join(letters)):
+
+                # Matches which don't cover the tile can't have changed.
+                if not index <= steps_back < index + len(pattern):
+                    continue
+
+                coords = lws.locate_match(x, y, direction, index)
+
+                for each_word in self.automaton.words_by_pattern.get(
+                        pattern, ()):
+                    found.add((each_word, direction) + coords)
+
+                # The same tiles, read backwards, spell any word whose
+                # reversal is this pattern.
+                for each_word in self.automaton.reversed_words_by_pattern.get(
+                        pattern, ()):
+                    flipped, opposite = wss.flip_match(coords, direction,
+                                                       len(pattern))
+                    found.add((each_word, opposite) + flipped)
+
+        return found
+
+    def graph(self):
+        '''
+        Return the grid as it is now, as a list of strings.
+        '''
+
+        return [''.join(each_row) for each_row in self.grid]
+
+    def results(self):
+        '''
+        Return the matches as they are now, in the same
+        {word: {direction: [(x, y), ...]}} dictionary as solve_puzzle.
+        '''
+
+        found_words = {}
+
+        for each_word, direction, x, y in self.matches:
+            found_directions = found_words.setdefault(each_word, {})
+            found_directions.setdefault(direction, []).append((x, y))
+
+        return wss.arrange_results(self.words, found_words)
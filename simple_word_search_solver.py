@@ -14,6 +14,9 @@
 # that doesn't preload the key list into a graph.
 
 
+import word_search_solver as wss
+
+
 # Directions are stored as (dy, dx) tuples in a class attribute.
 # They represent the change (ie delta, or d) in y and x coordinates
 # as the solver attempts to construct paths between nodes in the graph.
@@ -29,11 +32,24 @@ DIRECTIONS = {
 }
 
 
+# A word read backwards in one direction is the same word read forwards
+# in the opposite direction, starting from its other end. Walking each
+# of these four directions while checking for the word and its reversal
+# at the same time covers all eight directions in half as many walks.
+OPPOSITE_DIRECTIONS = {
+    'LR':  'RL',
+    'D':   'U',
+    'DDR': 'DUL',
+    'DDL': 'DUR'
+}
+
+
 def solve_puzzle(words, graph):
 
-    # Naively assume the graph is a rectangle:
-    graph_height = len(graph)    # y axis
-    graph_width = len(graph[0])  # x axis
+    # How many tiles there are from each tile to the edge of the graph
+    # in each direction, worked out once for the whole graph. Any start
+    # from which a word reaches at least that far can't step off the edge.
+    reach = wss.build_reach_table(graph)
 
     results = {}
 
@@ -43,13 +59,39 @@ def solve_puzzle(words, graph):
     # Sorry about that.
     for each_word in words:
 
-        each_word_upper = each_word.upper()
+        # A space isn't a letter.
+        # While there are some "words" with spaces
+        # in them in the WordList.txt file, there
+        # are none in the WordSearch.txt file.
+        # This program will assume words with spaces in
+        # the WordList.txt file are included in the
+        # WordSearch.txt file with spaces removed.
+        each_word_upper = each_word.upper().replace(' ', '')
+        each_word_reversed = each_word_upper[::-1]
+
+        word_length = len(each_word_upper)
 
-        for each_row_index in range(graph_height):
+        # An empty word would otherwise be "found" on every tile.
+        if word_length == 0:
+            results[each_word] = {}
+            continue
 
-            for each_column_index in range(graph_width):
+        for each_row_index, each_row in enumerate(graph):
+
+            for each_column_index in range(len(each_row)):
+
+                for each_direction in OPPOSITE_DIRECTIONS:
+
+                    # The word and its reversal cover the same tiles, so
+                    # if one would run off the edge, so would the other.
+                    # Dropping those starts here means there's no need
+                    # to check bounds while stepping through the word.
+                    tiles = reach[each_direction][each_row_index]
+                    if tiles[each_column_index] < word_length:
+                        continue
+
+                    dy, dx = DIRECTIONS[each_direction]
 
-                for each_direction in DIRECTIONS:
                     # Must reset the tracking index to copies
                     # of the current tile's coordinates at
                     # every new direction checked.
@@ -57,59 +99,44 @@ def solve_puzzle(words, graph):
                     this_step_x = each_column_index
 
                     word_is_not_here = False
+                    reversed_word_is_not_here = False
 
-                    for index, each_letter in enumerate(each_word_upper):
-
-                        # Splitting up the failure case for readability.
-                        bottom = (this_step_y >= graph_height)
-                        top = (this_step_y < 0)
-                        right = (this_step_x >= graph_width)
-                        left = (this_step_x < 0)
-
-                        # If ANY of these conditions are true, the step
-                        # is out_of_bounds. The OR comparison ensures it.
-                        out_of_bounds = (bottom or right or left or top)
-
-                        # # Out-of-bounds checking first, so nothing is raised.
-                        # if ((this_step_y >= graph_height) or
-                        #    (this_step_y < 0) or
-                        #    (this_step_x >= graph_width) or
-                        #    (this_step_x < 0)):
-                        #     continue
-                        if out_of_bounds:
-                            word_is_not_here = True
+                    for index in range(word_length):
+
+                        tile = graph[this_step_y][this_step_x]
 
-                        # A space isn't a letter.
-                        # While there are some "words" with spaces
-                        # in them in the WordList.txt file, there
-                        # are none in the WordSearch.txt file.
-                        # This program will assume words with spaces in
-                        # the WordList.txt file are included in the
-                        # WordSearch.txt file with spaces removed.
-                        elif each_letter == ' ':
-                            continue
-
-                        elif graph[this_step_y][this_step_x] == each_letter:
-
-                            # At the first step it checks the current tile
-                            # against the current letter. On subsequent steps
-                            # it properly applies the directional offset.
-                            this_step_y += DIRECTIONS[each_direction][0]
-                            this_step_x += DIRECTIONS[each_direction][1]
-
-                        else:
+                        if tile != each_word_upper[index]:
                             word_is_not_here = True
 
+                        if tile != each_word_reversed[index]:
+                            reversed_word_is_not_here = True
+
+                        if word_is_not_here and reversed_word_is_not_here:
+                            break
+
+                        # At the first step it checks the current tile
+                        # against the current letter. On subsequent steps
+                        # it properly applies the directional offset.
+                        this_step_y += dy
+                        this_step_x += dx
+
                     if word_is_not_here is False:
 
                         # The (x, y) ordering is intentional for readability.
                         coords = (each_column_index, each_row_index)
 
-                        try:
-                            results[each_word][each_direction].append(coords)
+                        add_result(results, each_word, each_direction, coords)
+
+                    if reversed_word_is_not_here is False:
 
-                        except KeyError:
-                            results[each_word] = {each_direction: [coords]}
+                        # The reversal ends where the word itself starts,
+                        # and the word reads in the opposite direction.
+                        coords = (each_column_index + (word_length - 1) * dx,
+                                  each_row_index + (word_length - 1) * dy)
+
+                        opposite = OPPOSITE_DIRECTIONS[each_direction]
+
+                        add_result(results, each_word, opposite, coords)
 
         if each_word not in results:
             results[each_word] = {}
@@ -117,6 +144,22 @@ def solve_puzzle(words, graph):
     return results
 
 
+def add_result(results, word, direction, coords):
+    '''
+    Add the (x, y) coords at which word was found in direction
+    to the results dictionary built by solve_puzzle.
+    '''
+
+    try:
+        results[word][direction].append(coords)
+
+    # The first match in a new direction must not
+    # discard the matches found in other directions.
+    except KeyError:
+        directions_found = results.setdefault(word, {})
+        directions_found[direction] = [coords]
+
+
 def load_list_from_text_file(file_name):
     '''
     Load file_name and return a list containing all lines from it.
@@ -0,0 +1,185 @@
+# On-disk cache of solved puzzles for the word search solvers by Ben Friedland
+
+# Solving the same grid with the same word list always gives the same
+# answer, so there's no need to solve it twice. A SolutionCache stores
+# each solution in a local directory, in the compact binary format from
+# solution_formats, under a name made from a SHA-256 hash of everything
+# which could change the answer: the grid, the word list, the engine
+# which solved it and the directions it was solved in. Word lists are
+# sorted and de-duplicated before hashing, since the order of the words
+# doesn't change which of them are found where.
+
+# The directory is kept under a size limit by deleting the solutions
+# which were least recently used. Reading a solution marks it as used by
+# updating its modification time.
+
+
+import os
+import hashlib
+
+import word_search_solver as wss
+import solution_formats
+
+
+# Change this whenever a change to the solvers changes their results,
+# so solutions cached by older versions are never used.
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIRECTORY = os.path.join('~', '.cache', 'word-search-solvers')
+
+
+class SolutionCache(object):
+    '''
+    Create a SolutionCache which keeps solutions in directory (defaults
+    to ~/.cache/word-search-solvers), deleting the least recently used
+    ones whenever they take up more than max_bytes (defaults to 256MB).
+    '''
+
+    def __init__(self, directory=None, max_bytes=256 * 1024 * 1024):
+
+        if directory is None:
+            directory = DEFAULT_CACHE_DIRECTORY
+
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+
+    def key_for(self, words, graph, engine=None):
+        '''
+        Return the hex digest naming the solution to graph (a list of
+        strings) for words, as solved by engine (an engine name, or None
+        for WordSearchSolver's own dictionary of coordinates).
+        '''
+
+        if engine is None:
+            engine = 'coordinates'
+        elif callable(engine):
+            # Functions without a name (eg partials) are named by their
+            # repr, which only matches within one run, but never wrongly.
+            engine = '{}.{}'.format(getattr(engine, '__module__', ''),
+                                    getattr(engine, '__name__',
+                                            repr(engine)))
+
+        directions = sorted(wss.WordSearchSolver.directions.items())
+
+        # Each part is hashed with its length in front of it, so
+        # that no two different puzzles can run together the same way.
+        parts = [
+            str(CACHE_VERSION),
+            engine,
+            repr(directions),
+            '\n'.join(graph),
+            '\n'.join(sorted(set(words)))
+        ]
+
+        digest = hashlib.sha256()
+
+        for each_part in parts:
+            encoded_part = each_part.encode('utf-8')
+            digest.update('{}:'.format(len(encoded_part)).encode('ascii'))
+            digest.update(encoded_part)
+
+        return digest.hexdigest()
+
+    def path_for(self, key):
+        '''
+        Return the path of the file holding the solution named key.
+        '''
+
+        return os.path.join(self.directory, '{}.bin'.format(key))
+
+    def get(self, words, graph, engine=None):
+        '''
+        Return the cached solution to graph for words, solved by engine,
+        in the same form solve_puzzle returns, or None if it isn't cached.
+        '''
+
+        path = self.path_for(self.key_for(words, graph, engine))
+
+        try:
+            results = solution_formats.read_binary_solution(path)
+        except (IOError, OSError, ValueError):
+            return None
+
+        # Mark this solution as recently used.
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        return wss.arrange_results(words, results)
+
+    def put(self, words, graph, engine, results):
+        '''
+        Store results, the solution to graph for words solved by engine,
+        and then delete old solutions if the cache has grown too large.
+        '''
+
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                # Another process may have just made it.
+                if not os.path.isdir(self.directory):
+                    raise
+
+        path = self.path_for(self.key_for(words, graph, engine))
+
+        # Write to a temporary file first, so that another process
+        # reading the cache never sees half of a solution.
+        temporary_path = '{}.{}.tmp'.format(path, os.getpid())
+
+        solution_formats.write_binary(results, temporary_path)
+
+        os.replace(temporary_path, path)
+
+        self.evict()
+
+    def evict(self):
+        '''
+        Delete the least recently used solutions until the
+        cache takes up no more than max_bytes.
+        '''
+
+        entries = []
+        total_bytes = 0
+
+        for file_name in os.listdir(self.directory):
+
+            if not file_name.endswith('.bin'):
+                continue
+
+            path = os.path.join(self.directory, file_name)
+
+            try:
+                status = os.stat(path)
+            except OSError:
+                continue  # Already evicted by another process.
+
+            entries.append((status.st_mtime, status.st_size, path))
+            total_bytes += status.st_size
+
+        for modified_time, size, path in sorted(entries):
+
+            if total_bytes <= self.max_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+            total_bytes -= size
+
+    def clear(self):
+        '''
+        Delete every solution in the cache.
+        '''
+
+        max_bytes = self.max_bytes
+
+        try:
+            self.max_bytes = 0
+            if os.path.isdir(self.directory):
+                self.evict()
+        finally:
+            self.max_bytes = max_bytes
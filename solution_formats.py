@@ -0,0 +1,214 @@
+# Solution file formats for the word search solvers by Ben Friedland
+
+# write_solution_to_file writes solutions for people to read. The writers
+# here are for other programs to read instead, and build each file in
+# memory so it can be written with a single call, rather than writing
+# every line separately:
+
+# 'jsonl'   JSON Lines, with one object per word:
+#               {"word": "Binary", "found": {"DUR": [[2, 11]]}}
+#           Words which weren't found have an empty "found" object.
+# 'csv'     Comma-separated values, with a header row and then one row
+#           per match: word,direction,x,y. Words which weren't found
+#           have no rows.
+# 'binary'  A compact format of fixed-size records, one per match, which
+#           read_binary_solution can load back quickly. See below.
+
+# The binary format is, with every number stored little-endian:
+#     4 bytes:    BINARY_MAGIC
+#     4 bytes:    the number of words, as an unsigned int
+#     per word:   its length in bytes, as an unsigned short, followed
+#                 by the word itself, encoded as UTF-8
+#     per match:  a BINARY_RECORD of the word's index in the list of
+#                 words, the direction's index in BINARY_DIRECTIONS,
+#                 and the x and y coordinates of the word's first letter
+# Matches run to the end of the file.
+
+
+import json
+import struct
+
+import word_search_solver as wss
+
+
+BINARY_MAGIC = b'WSS1'
+
+# The order of these must never change, or older files will be misread.
+BINARY_DIRECTIONS = ('LR', 'RL', 'U', 'D', 'DUL', 'DUR', 'DDL', 'DDR')
+
+# Word index, direction index, x, y.
+BINARY_RECORD = struct.Struct('<IBII')
+
+
+def write_json_lines(results, solution_file_path):
+    '''
+    Write the results of calling solve_puzzle to the file
+    at solution_file_path, as JSON Lines with one line per word.
+    '''
+
+    lines = []
+
+    for each_word in sorted(results):
+
+        record = {'word': each_word, 'found': results[each_word]}
+
+        lines.append(json.dumps(record))
+
+    with open(solution_file_path, 'w') as solution_file:
+        solution_file.write('\n'.join(lines) + '\n' if lines else '')
+
+
+def read_json_lines(solution_file_path):
+    '''
+    Load a file written by write_json_lines and return the
+    same results dictionary it was written from.
+    '''
+
+    found_words = {}
+
+    for line in wss.load_list_from_text_file(solution_file_path):
+
+        if not line:
+            continue
+
+        record = json.loads(line)
+
+        found_words[record['word']] = dict(
+            (direction, [tuple(each_location) for each_location in locations])
+            for direction, locations in record['found'].items())
+
+    return wss.arrange_results(sorted(found_words), found_words)
+
+
+def write_csv(results, solution_file_path):
+    '''
+    Write the results of calling solve_puzzle to the file at
+    solution_file_path, as CSV with one row per match.
+    '''
+
+    import csv
+    import io
+
+    buffer = io.StringIO()
+
+    writer = csv.writer(buffer, lineterminator='\n')
+
+    writer.writerow(('word', 'direction', 'x', 'y'))
+
+    for each_word in sorted(results):
+        for each_direction, locations in results[each_word].items():
+            writer.writerows((each_word, each_direction, x, y)
+                             for x, y in locations)
+
+    with open(solution_file_path, 'w') as solution_file:
+        solution_file.write(buffer.getvalue())
+
+
+def write_binary(results, solution_file_path):
+    '''
+    Write the results of calling solve_puzzle to the file at
+    solution_file_path, in the compact binary format described
+    at the top of this module.
+    '''
+
+    words = sorted(results)
+
+    data = bytearray(BINARY_MAGIC)
+    data += struct.pack('<I', len(words))
+
+    for each_word in words:
+        encoded_word = each_word.encode('utf-8')
+        data += struct.pack('<H', len(encoded_word))
+        data += encoded_word
+
+    direction_indices = dict((direction, index) for index, direction
+                             in enumerate(BINARY_DIRECTIONS))
+
+    pack = BINARY_RECORD.pack
+
+    for word_index, each_word in enumerate(words):
+        for each_direction, locations in results[each_word].items():
+
+            direction_index = direction_indices[each_direction]
+
+            for x, y in locations:
+                data += pack(word_index, direction_index, x, y)
+
+    with open(solution_file_path, 'wb') as solution_file:
+        solution_file.write(data)
+
+
+def iter_binary_matches(solution_file_path):
+    '''
+    Load a file written by write_binary and return a tuple of
+    (words, matches), where words is the list of words searched for
+    and matches is an iterator of (word, direction, x, y) tuples.
+    '''
+
+    with open(solution_file_path, 'rb') as solution_file:
+        data = solution_file.read()
+
+    if data[:4] != BINARY_MAGIC:
+        raise ValueError("{} is not a binary solution"
+                         " file.".format(solution_file_path))
+
+    word_count, = struct.unpack_from('<I', data, 4)
+
+    offset = 8
+    words = []
+
+    for _ in range(word_count):
+        length, = struct.unpack_from('<H', data, offset)
+        offset += 2
+        words.append(data[offset:offset + length].decode('utf-8'))
+        offset += length
+
+    if (len(data) - offset) % BINARY_RECORD.size:
+        raise ValueError("{} ends partway through a"
+                         " match.".format(solution_file_path))
+
+    records = BINARY_RECORD.iter_unpack(memoryview(data)[offset:])
+
+    matches = ((words[word_index], BINARY_DIRECTIONS[direction_index], x, y)
+               for word_index, direction_index, x, y in records)
+
+    return words, matches
+
+
+def read_binary_solution(solution_file_path):
+    '''
+    Load a file written by write_binary and return the
+    same results dictionary it was written from.
+    '''
+
+    words, matches = iter_binary_matches(solution_file_path)
+
+    found_words = {}
+
+    for each_word, direction, x, y in matches:
+        found_words.setdefault(each_word, {}).setdefault(direction,
+                                                         []).append((x, y))
+
+    return wss.arrange_results(words, found_words)
+
+
+# Every format a solution can be written in, by name.
+WRITERS = {
+    'text': wss.write_solution_to_file,
+    'jsonl': write_json_lines,
+    'csv': write_csv,
+    'binary': write_binary
+}
+
+
+def write_solution(results, solution_file_path, output_format='text'):
+    '''
+    Write the results of calling solve_puzzle to the file at
+    solution_file_path, in output_format (a key in WRITERS).
+    '''
+
+    if output_format not in WRITERS:
+        raise ValueError("Unknown format '{}'. Choose one of: {}".format(
+            output_format, ', '.join(sorted(WRITERS))))
+
+    WRITERS[output_format](results, solution_file_path)
@@ -0,0 +1,514 @@
+# Word Search Solve Server by Ben Friedland
+
+# Running word_search_solver.py pays for Python's startup, for reading
+# the word list and for compiling it (or indexing the grid) every time a
+# puzzle is solved. This server stays running instead, listening on a
+# local Unix socket or TCP port, and keeps that work around between
+# puzzles.
+
+# Clients send one JSON object per line, and get one back per line for
+# each, though not necessarily in the order they were sent:
+#     {"id": 1, "key_path": "word_list.txt", "grid_path": "word_search.txt"}
+#     {"id": 2, "words": ["CAT", "DOG"], "grid": ["CATX", "DOGX"],
+#      "engine": "coordinates"}
+#     {"id": 3, "command": "stats"}
+# Words come from a word list file (a plain list or an index saved by
+# word_index) or are given inline, and the grid from a file or inline,
+# as a list of rows or a single string. The engine defaults to the
+# server's. Each answer holds the request's id, the results dictionary
+# (with each (x, y) as an [x, y] list) and the seconds the request took,
+# or an error message. The stats command answers with the number of
+# puzzles waiting, and the 50th, 90th and 99th percentiles of the time
+# taken by recent requests.
+
+# Solving is done by a pool of worker processes, so the event loop is
+# free to accept more requests in the meantime. Each worker keeps the
+# word lists it has compiled, and for the dictionary of coordinates the
+# Puzzles it has built, for the grids it has seen recently.
+
+# Only so many batches are handed to the workers at once (one per worker),
+# and puzzles which arrive while the workers are busy wait their turn.
+# When a worker frees up, every waiting puzzle using the same word list
+# and engine as the oldest one is handed over together, in one batch, so
+# the word list is looked up once and the puzzles travel to the worker
+# together rather than one at a time.
+
+
+import os
+import json
+import time
+import asyncio
+import collections
+
+import word_search_solver as wss
+
+
+# How many word lists, and grids, each worker process keeps ready.
+WARM_WORD_LISTS = 32
+WARM_PUZZLES = 64
+
+# What each worker process keeps ready, most recently used last.
+WORD_INDEXES = collections.OrderedDict()
+COMPILED_WORD_LISTS = collections.OrderedDict()
+PUZZLES = collections.OrderedDict()
+
+# A puzzle waiting to be solved: the (word list, engine) pair it can
+# be batched with, its grid (a list of rows, or a path), the future to
+# answer with, and the time it arrived.
+PendingPuzzle = collections.namedtuple('PendingPuzzle',
+                                       'batch_key grid future arrived')
+
+
+def remember(cache, key, make, size):
+    '''
+    Return cache[key], calling make() to fill it in if it's missing,
+    and forgetting the least recently used entries beyond size.
+    '''
+
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    cache[key] = value = make()
+
+    while len(cache) > size:
+        cache.popitem(last=False)
+
+    return value
+
+
+def load_word_list(word_list):
+    '''
+    Return a word_index.WordIndex for word_list, which is either
+    ('path', key_path) or ('words', tuple of words), loading it only
+    the first time this process asks for it. A word list file is read
+    again if it has been changed since.
+    '''
+
+    import word_index
+
+    kind, source = word_list
+
+    if kind == 'words':
+        return remember(WORD_INDEXES, word_list,
+                        lambda: word_index.WordIndex(source),
+                        WARM_WORD_LISTS)
+
+    key = (word_list, os.stat(source).st_mtime_ns)
+
+    return remember(WORD_INDEXES, key,
+                    lambda: word_index.load_word_index(source),
+                    WARM_WORD_LISTS)
+
+
+def solve_grids(word_list, engine, grids):
+    '''
+    Solve every grid in grids (each a list of rows, or the path to a
+    grid file) for word_list (see load_word_list) with engine, and
+    return a list of each grid's results dictionary, encoded as JSON,
+    or of the exception raised while solving it.
+
+    The grids in a batch have nothing to do with each other besides
+    their word list, so one which can't be solved (such as a missing
+    file, or rows of different lengths) doesn't stop the others.
+
+    This runs inside the worker processes.
+    '''
+
+    index = load_word_list(word_list)
+
+    answers = []
+
+    for each_grid in grids:
+        try:
+            answers.append(solve_grid(index, engine, each_grid))
+        except Exception as error:
+            answers.append(error)
+
+    return answers
+
+
+def solve_grid(index, engine, grid):
+    '''
+    Solve grid (a list of rows, or the path to a grid file) for the
+    word_index.WordIndex index with engine, and return its results
+    dictionary, encoded as JSON.
+    '''
+
+    if isinstance(grid, str):
+        grid = wss.load_list_from_text_file(grid)
+
+    if engine == 'coordinates':
+        # Keep the grid's dictionary of coordinates
+        # too, in case it's searched again.
+        puzzle = remember(PUZZLES, tuple(grid),
+                          lambda: wss.Puzzle(grid), WARM_PUZZLES)
+        results = puzzle.find_words(index.words, index.normalize)
+
+    else:
+        solve = remember(COMPILED_WORD_LISTS, (index, engine),
+                         lambda: wss.compile_engine(engine, index),
+                         WARM_WORD_LISTS)
+        results = solve(grid)
+
+    return json.dumps(results)
+
+
+def percentile(values, percent):
+    '''
+    Return the nearest-rank percent percentile of the
+    sorted list values, or None if it is empty.
+    '''
+
+    import math
+
+    if not values:
+        return None
+
+    rank = int(math.ceil(percent / 100.0 * len(values)))
+
+    return values[max(rank, 1) - 1]
+
+
+class SolveServer(object):
+    '''
+    Create a SolveServer which solves puzzles across workers worker
+    processes (defaults to one per CPU) with engine (a key in
+    word_search_solver.ENGINES, defaults to 'aho_corasick') unless
+    a request asks for another, handing at most max_batch puzzles
+    to a worker at a time.
+
+    The times taken by the latest latency_window requests are kept,
+    for the percentiles reported by statistics.
+
+    Call start_unix or start_tcp from inside a running event loop to
+    begin serving, and close when done.
+    '''
+
+    def __init__(self, workers=None, engine='aho_corasick', max_batch=64,
+                 latency_window=1000):
+
+        wss.load_engine(engine)
+
+        self.workers = workers or os.cpu_count() or 1
+        self.engine = engine
+        self.max_batch = max_batch
+
+        self.pending = collections.deque()
+        self.latencies = collections.deque(maxlen=latency_window)
+
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        self.in_flight = 0
+
+        # Set up once the event loop is running, by start.
+        self.pool = None
+        self.server = None
+        self.arrived = None
+        self.free_workers = None
+        self.dispatcher = None
+
+    async def start(self):
+        '''
+        Start the worker processes and the task which hands them puzzles.
+        '''
+
+        import concurrent.futures
+
+        self.pool = concurrent.futures.ProcessPoolExecutor(self.workers)
+        self.arrived = asyncio.Event()
+        self.free_workers = asyncio.Semaphore(self.workers)
+        self.dispatcher = asyncio.ensure_future(self.dispatch())
+
+    async def start_unix(self, socket_path):
+        '''
+        Start serving on a Unix socket at socket_path.
+        '''
+
+        await self.start()
+        self.server = await asyncio.start_unix_server(self.handle_connection,
+                                                      socket_path)
+
+    async def start_tcp(self, host='127.0.0.1', port=0):
+        '''
+        Start serving on a TCP port of host, and return the port (if port
+        is 0, the operating system picks one which is free).
+        '''
+
+        await self.start()
+        self.server = await asyncio.start_server(self.handle_connection,
+                                                 host, port)
+
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        '''
+        Stop serving, and stop the worker processes.
+        '''
+
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+        if self.dispatcher is not None:
+            self.dispatcher.cancel()
+
+        if self.pool is not None:
+            self.pool.shutdown()
+
+    async def handle_connection(self, reader, writer):
+        '''
+        Answer each line read from a client as it is solved.
+        '''
+
+        answers = set()
+
+        async def answer(line):
+            writer.write((await self.answer(line)).encode('utf-8') + b'\n')
+
+        try:
+            while True:
+                line = await reader.readline()
+
+                if not line:
+                    break
+
+                if not line.strip():
+                    continue
+
+                # Each line is answered on its own, so a slow
+                # puzzle doesn't hold up the lines after it.
+                task = asyncio.ensure_future(answer(line))
+                answers.add(task)
+                task.add_done_callback(answers.discard)
+
+            if answers:
+                await asyncio.wait(answers)
+
+            await writer.drain()
+
+        finally:
+            writer.close()
+
+    async def answer(self, line):
+        '''
+        Return the line of JSON answering the request in line.
+        '''
+
+        request_id = None
+
+        try:
+            request = json.loads(line)
+
+            if not isinstance(request, dict):
+                raise ValueError("Each request must be a JSON object.")
+
+            request_id = request.get('id')
+
+            if request.get('command') == 'stats':
+                return json.dumps(dict(self.statistics(), id=request_id))
+
+            start_time = time.perf_counter()
+
+            results = await self.submit(request)
+
+            return '{{"id": {}, "seconds": {}, "results": {}}}'.format(
+                json.dumps(request_id), time.perf_counter() - start_time,
+                results)
+
+        except Exception as error:
+            self.errors += 1
+            return json.dumps({'id': request_id, 'error': str(error)})
+
+    async def submit(self, request):
+        '''
+        Queue the puzzle described by the request dictionary (see the top
+        of this module), and return its results dictionary, encoded as
+        JSON, once it has been solved.
+        '''
+
+        engine = request.get('engine', self.engine)
+
+        wss.load_engine(engine)
+
+        if 'words' in request:
+            word_list = ('words', tuple(request['words']))
+        elif 'key_path' in request:
+            word_list = ('path', os.path.abspath(request['key_path']))
+        else:
+            raise ValueError("A request needs words or a key_path.")
+
+        if 'grid' in request:
+            grid = request['grid']
+            if isinstance(grid, str):
+                grid = grid.splitlines()
+            grid = list(grid)
+        elif 'grid_path' in request:
+            grid = os.path.abspath(request['grid_path'])
+        else:
+            raise ValueError("A request needs a grid or a grid_path.")
+
+        arrived = time.perf_counter()
+
+        future = asyncio.get_running_loop().create_future()
+
+        self.pending.append(PendingPuzzle((word_list, engine), grid,
+                                          future, arrived))
+        self.arrived.set()
+
+        try:
+            return await future
+        finally:
+            self.requests += 1
+            self.latencies.append(time.perf_counter() - arrived)
+
+    async def dispatch(self):
+        '''
+        Hand the oldest waiting puzzle, along with every other waiting
+        puzzle which shares its word list and engine, to a worker as soon
+        as one is free, for as long as the server is running.
+        '''
+
+        while True:
+
+            await self.free_workers.acquire()
+
+            while not self.pending:
+                self.arrived.clear()
+                await self.arrived.wait()
+
+            batch = [self.pending.popleft()]
+
+            waiting = collections.deque()
+
+            while self.pending:
+
+                puzzle = self.pending.popleft()
+
+                if (puzzle.batch_key == batch[0].batch_key and
+                        len(batch) < self.max_batch):
+                    batch.append(puzzle)
+                else:
+                    waiting.append(puzzle)
+
+            self.pending = waiting
+
+            asyncio.ensure_future(self.solve_batch(batch))
+
+    async def solve_batch(self, batch):
+        '''
+        Solve every puzzle in batch in a worker process,
+        answering each puzzle's future with its results.
+        '''
+
+        word_list, engine = batch[0].batch_key
+
+        self.batches += 1
+        self.in_flight += len(batch)
+
+        try:
+            answers = await asyncio.get_running_loop().run_in_executor(
+                self.pool, solve_grids, word_list, engine,
+                [puzzle.grid for puzzle in batch])
+
+        # Only a problem every puzzle in the batch shares,
+        # such as its word list, fails all of them.
+        except Exception as error:
+            for puzzle in batch:
+                if not puzzle.future.done():
+                    puzzle.future.set_exception(error)
+
+        else:
+            for puzzle, results in zip(batch, answers):
+                if puzzle.future.done():
+                    continue
+
+                if isinstance(results, Exception):
+                    puzzle.future.set_exception(results)
+                else:
+                    puzzle.future.set_result(results)
+
+        finally:
+            self.in_flight -= len(batch)
+            self.free_workers.release()
+
+    def statistics(self):
+        '''
+        Return a dictionary describing the work waiting, the work done,
+        and how long recent requests took, in seconds.
+        '''
+
+        latencies = sorted(self.latencies)
+
+        return {
+            'queue_depth': len(self.pending),
+            'in_flight': self.in_flight,
+            'requests': self.requests,
+            'batches': self.batches,
+            'errors': self.errors,
+            'latency': {
+                'p50': percentile(latencies, 50),
+                'p90': percentile(latencies, 90),
+                'p99': percentile(latencies, 99),
+                'max': latencies[-1] if latencies else None
+            }
+        }
+
+
+async def serve(server, socket_path=None, host='127.0.0.1', port=8765):
+    '''
+    Start server on a Unix socket at socket_path if one is given,
+    or on port of host if not, and serve until cancelled.
+    '''
+
+    if socket_path is not None:
+        await server.start_unix(socket_path)
+        print("Serving on {}.".format(socket_path))
+    else:
+        port = await server.start_tcp(host, port)
+        print("Serving on {}:{}.".format(host, port))
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def handle_cli_arguments():
+    '''
+    Handle command line interface arguments for starting the server.
+    '''
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Serve word search solutions from warm worker processes.")
+    parser.add_argument('--socket', default=None,
+                        help="path to a Unix socket to listen on")
+    parser.add_argument('--host', default='127.0.0.1',
+                        help="address to listen on, without --socket")
+    parser.add_argument('--port', type=int, default=8765,
+                        help="port to listen on, without --socket")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="number of worker processes (one per CPU)")
+    parser.add_argument('--engine', default='aho_corasick',
+                        choices=sorted(wss.ENGINES),
+                        help="solver used unless a request asks for another")
+    parser.add_argument('--max-batch', type=int, default=64,
+                        help="most puzzles handed to a worker at once")
+
+    arguments = parser.parse_args()
+
+    server = SolveServer(arguments.workers, arguments.engine,
+                         arguments.max_batch)
+
+    try:
+        asyncio.run(serve(server, arguments.socket, arguments.host,
+                          arguments.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    handle_cli_arguments()
@@ -0,0 +1,181 @@
+# Instrumentation for the word search solvers by Ben Friedland
+
+# A slow solve could be spending its time reading files, building the
+# dictionary of coordinates, probing the grid for words, or writing the
+# solution. A SolveStats records how long each of those phases took, and,
+# for the dictionary of coordinates, how much probing each word needed.
+# One can be passed to WordSearchSolver.solve_puzzle, to compile_engine
+# (for every engine), to word_search_solver.solve_puzzle, or to
+# Puzzle.find_words, and collects the phases of every solve it's given to.
+
+# Counting probes one at a time would slow down every solve, so
+# Puzzle.find_word_in_direction is given a ProbeCounts to add to only
+# when stats are being collected, and works out the probes once per
+# start, from how far along the word it got. A WordSearchSolver which
+# isn't collecting stats does no extra work beyond checking, once per
+# start and once per word, that it isn't.
+
+# Two things are counted for each word: starts, every occurrence of a
+# word's first letter which was looked at, and probes, every letter
+# which was looked up at the tile where it was expected. Words are
+# searched for forwards and backwards, so both are counted for each.
+
+
+import time
+import collections
+import contextlib
+
+import word_search_solver as wss
+
+
+# A word's search cost: how long it took, and how many starts and probes.
+WordCost = collections.namedtuple('WordCost', 'seconds starts probes')
+
+
+class ProbeCounts(object):
+    '''
+    Create a running count of starts and probes, for
+    Puzzle.find_word_in_direction to add to.
+    '''
+
+    __slots__ = ('starts', 'probes')
+
+    def __init__(self):
+        self.starts = 0
+        self.probes = 0
+
+
+class SolveStats(object):
+    '''
+    Create an empty record of the time each phase of a solve takes and,
+    if the dictionary of coordinates is used, of the work done searching
+    for each word. See WordSearchSolver's collect_stats argument.
+    '''
+
+    def __init__(self):
+
+        # Phase names, in the order they were first
+        # started, mapped to their total seconds.
+        self.phases = collections.OrderedDict()
+
+        self.starts = 0
+        self.probes = 0
+
+        # Every word searched for, mapped to its WordCost.
+        self.word_costs = {}
+
+    @contextlib.contextmanager
+    def time_phase(self, name):
+        '''
+        Return a context manager which adds the time
+        spent inside it to the phase called name.
+        '''
+
+        start_time = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.phases[name] = (self.phases.get(name, 0.0) +
+                                 time.perf_counter() - start_time)
+
+    def total_seconds(self):
+        '''
+        Return the total time spent in every phase.
+        '''
+
+        return sum(self.phases.values())
+
+    def find_word(self, puzzle, word, target):
+        '''
+        Find target (word, normalized) in puzzle in every direction, as
+        find_in_all_directions does with puzzle.find_word_in_direction,
+        and return the same dictionary, adding what it cost to word's
+        entry in word_costs.
+        '''
+
+        import functools
+
+        counts = ProbeCounts()
+
+        find = functools.partial(puzzle.find_word_in_direction,
+                                 counts=counts)
+
+        start_time = time.perf_counter()
+
+        directions_found = wss.find_in_all_directions(target, find)
+
+        seconds = time.perf_counter() - start_time
+
+        starts, probes = counts.starts, counts.probes
+
+        self.starts += starts
+        self.probes += probes
+
+        # A word listed more than once costs the sum of every search.
+        cost = self.word_costs.get(word, WordCost(0.0, 0, 0))
+        self.word_costs[word] = WordCost(cost.seconds + seconds,
+                                         cost.starts + starts,
+                                         cost.probes + probes)
+
+        return directions_found
+
+    def slowest_words(self, count=10):
+        '''
+        Return a list of (word, WordCost) tuples for the count words
+        which took the longest to search for, slowest first.
+        '''
+
+        import heapq
+
+        return heapq.nlargest(count, self.word_costs.items(),
+                              key=lambda item: item[1].seconds)
+
+    def as_dict(self, slowest=10):
+        '''
+        Return the stats as a dictionary of plain values, suitable for
+        converting to JSON, including the slowest words.
+        '''
+
+        return {
+            'phases': dict(self.phases),
+            'total_seconds': self.total_seconds(),
+            'words': len(self.word_costs),
+            'starts': self.starts,
+            'probes': self.probes,
+            'slowest_words': [dict(cost._asdict(), word=word)
+                              for word, cost in self.slowest_words(slowest)]
+        }
+
+    def report(self, slowest=10):
+        '''
+        Return the stats as a human readable, multi-line string.
+        '''
+
+        total_seconds = self.total_seconds()
+
+        lines = ['Phases:']
+
+        for name, seconds in self.phases.items():
+            lines.append('    {:<8} {:.6f}s ({:.1f}%)'.format(
+                name, seconds,
+                100.0 * seconds / total_seconds if total_seconds else 0.0))
+
+        lines.append('    {:<8} {:.6f}s'.format('total', total_seconds))
+
+        # Engines other than the dictionary of
+        # coordinates don't count their work.
+        if self.word_costs:
+
+            lines.append('{} words searched for: {} starts, {}'
+                         ' probes.'.format(len(self.word_costs),
+                                           self.starts, self.probes))
+
+            lines.append('Slowest words:')
+
+            for word, cost in self.slowest_words(slowest):
+                lines.append('    {}: {:.6f}s, {} starts, {}'
+                             ' probes'.format(word, cost.seconds,
+                                              cost.starts, cost.probes))
+
+        return '\n'.join(lines)
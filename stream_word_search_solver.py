@@ -0,0 +1,190 @@
+# Stream Word Search Solver by Ben Friedland
+
+# The goal of this program is to solve a stream of puzzles which are
+# made on the fly, without writing each one to a file first.
+
+# WordSearchSolver reads its words and grid from files, so a program
+# which makes puzzles has to write them out, and start a new process to
+# solve each one. This reads puzzles from a stream instead (stdin, when
+# run as 'word_search_solver.py --stream'), one JSON object per line,
+# and writes each solution as a line of JSON as soon as it is solved:
+#     {"id": "a", "words": ["CAT", "DOG"], "grid": ["CATX", "DOGX"]}
+#     {"id": "b", "grid": "DOGX\nCATX"}
+#     {"words": ["BIRD"]}
+#     {"id": "c", "grid": ["BIRD"]}
+# writes:
+#     {"id": "a", "results": {"CAT": {"LR": [[0, 0]]}, "DOG": ...}}
+#     {"id": "b", "results": ...}
+#     {"id": "c", "results": {"BIRD": {"LR": [[0, 0]]}}}
+
+# A grid is a list of rows, or a single string with one row per line.
+# A puzzle without words is solved for the most recent word list in the
+# stream, so a word list only has to be sent (and compiled) once, and a
+# line with words but no grid just changes the word list. Until a word
+# list is sent, the word list file given on the command line is used.
+# A puzzle without an id is given its position in the stream (starting
+# from 1), and a line which can't be solved is answered with an error
+# message in place of results, without stopping the stream.
+
+
+import json
+
+import word_search_solver as wss
+
+
+class PuzzleStream(object):
+    '''
+    Create a PuzzleStream which solves puzzles with engine (a key in
+    word_search_solver.ENGINES, defaults to the dictionary of coordinates)
+    for the most recent word list it has been given, which starts as the
+    words in the file at key_path, if there is one.
+
+    An optional mode and limit ask a cheaper question about each word
+    (see word_search_solver.QUERY_MODES).
+    '''
+
+    def __init__(self, key_path=None, engine=None, mode='all', limit=None):
+
+        if engine is None:
+            engine = 'coordinates'
+
+        # Fail before reading anything if the engine or query is wrong.
+        wss.load_engine(engine)
+        wss.query_limit(mode, limit)
+
+        self.key_path = key_path
+        self.engine = engine
+        self.mode = mode
+        self.limit = limit
+
+        # The current word list, and the function which
+        # solves a grid for it, once one is needed.
+        self.words = None
+        self.solve = None
+
+        self.puzzles = 0
+
+    def use_words(self, words):
+        '''
+        Solve every following puzzle for words, compiling
+        them now, so the work isn't repeated for each puzzle.
+        '''
+
+        import word_index
+
+        if isinstance(words, str) or not all(isinstance(each_word, str)
+                                             for each_word in words):
+            raise ValueError("A word list must be a list of strings.")
+
+        self.words = word_index.WordIndex(words)
+        self.solve = wss.compile_engine(self.engine, self.words)
+
+    def solve_line(self, line):
+        '''
+        Return a dictionary answering the puzzle in one line of the
+        stream, or None if the line only changes the word list.
+        '''
+
+        try:
+            puzzle = json.loads(line)
+        except ValueError as error:
+            return {'id': None, 'error': str(error)}
+
+        if not isinstance(puzzle, dict):
+            return {'id': None, 'error': "Each line must be a JSON object."}
+
+        puzzle_id = None
+
+        # Every grid is counted, even one which can't be solved,
+        # so the ids of those after it don't depend on it.
+        if 'grid' in puzzle:
+            self.puzzles += 1
+            puzzle_id = puzzle.get('id', self.puzzles)
+
+        # Whatever goes wrong with one puzzle, the
+        # stream carries on with the next one.
+        try:
+            results = self.solve_puzzle(puzzle)
+        except Exception as error:
+            return {'id': puzzle_id, 'error': str(error)}
+
+        if results is None:
+            return None
+
+        return {'id': puzzle_id, 'results': results}
+
+    def solve_puzzle(self, puzzle):
+        '''
+        Return the results for the puzzle dictionary read from one
+        line of the stream, or None if it only changes the word list.
+        '''
+
+        if 'words' in puzzle:
+            self.use_words(puzzle['words'])
+
+        if 'grid' not in puzzle:
+            if 'words' not in puzzle:
+                raise ValueError("A line needs a grid, words, or both.")
+            return None
+
+        grid = puzzle['grid']
+
+        if isinstance(grid, str):
+            grid = grid.splitlines()
+
+        grid = list(grid)
+
+        if not all(isinstance(each_row, str) for each_row in grid):
+            raise ValueError("A grid must be a list of strings.")
+
+        if self.solve is None:
+
+            if self.key_path is None:
+                raise ValueError("No word list has been given yet.")
+
+            self.use_words(wss.load_list_from_text_file(self.key_path))
+
+        return wss.summarize_results(self.solve(grid), self.mode,
+                                     self.limit)
+
+    def solve_stream(self, input_file, output_file):
+        '''
+        Solve every puzzle in input_file, an open file of JSON lines,
+        writing each answer to output_file as soon as it is solved.
+        Return the number of lines answered with an error.
+        '''
+
+        errors = 0
+
+        for line in input_file:
+
+            if not line.strip():
+                continue
+
+            answer = self.solve_line(line)
+
+            if answer is None:
+                continue
+
+            if 'error' in answer:
+                errors += 1
+
+            output_file.write(json.dumps(answer) + '\n')
+
+            # Whatever is reading the output gets
+            # each solution as soon as it's ready.
+            output_file.flush()
+
+        return errors
+
+
+def solve_stream(input_file, output_file, key_path=None, engine=None,
+                 mode='all', limit=None):
+    '''
+    Solve every puzzle in input_file, writing each solution to output_file
+    as a line of JSON as soon as it is solved. See PuzzleStream.
+    '''
+
+    stream = PuzzleStream(key_path, engine, mode, limit)
+
+    return stream.solve_stream(input_file, output_file)
@@ -0,0 +1,80 @@
+import unittest
+import word_search_solver as wss
+import line_word_search_solver as lws
+import aho_corasick_word_search_solver as acws
+
+TEST_KEYS = ['AAOA', 'OOOO', 'AOA', 'ZZZ', 'aa oa']
+TEST_GRAPH = [
+    'AAAO',
+    'AAOA',
+    'AOAA',
+    'OAAA'
+]
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+
+class TestAhoCorasickWordSearchSolver(unittest.TestCase):
+
+    def test_automaton_search(self):
+
+        automaton = acws.Automaton(['he', 'She', 'HIS', 'hers', ''])
+
+        matches = sorted(automaton.search('USHERS'))
+
+        # 'HE' ends inside 'SHE', and 'HERS' overlaps both of them.
+        assert matches == [(1, 'SHE'), (2, 'HE'), (2, 'HERS')]
+
+        # The reversal of every word is compiled in as well.
+        assert sorted(automaton.search('SREHS')) == [(0, 'SREH'),
+                                                     (2, 'EH'),
+                                                     (2, 'EHS')]
+
+        assert list(automaton.search('XYZ')) == []
+        assert '' not in automaton.words_by_pattern
+
+    def test_automaton_words_by_pattern(self):
+
+        automaton = acws.Automaton(['Save As', 'SAVEAS', 'Save As'])
+
+        assert automaton.words_by_pattern['SAVEAS'] == ['Save As', 'SAVEAS']
+        assert automaton.reversed_words_by_pattern['SAEVAS'] == ['Save As',
+                                                                'SAVEAS']
+        assert list(automaton.search('SAVEAS')) == [(0, 'SAVEAS')]
+
+    def test_solve_puzzle_matches_line_solver(self):
+
+        result = acws.solve_puzzle(TEST_KEYS, TEST_GRAPH)
+        assert result == lws.solve_puzzle(TEST_KEYS, TEST_GRAPH)
+        assert result['aa oa'] == result['AAOA']
+        assert result['ZZZ'] == {}
+
+        words = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        automaton = acws.Automaton(words)
+
+        result = acws.solve_puzzle(words, graph, automaton=automaton)
+        assert result == lws.solve_puzzle(words, graph)
+        assert result['Binary'] == {'DUR': [(2, 11)]}
+
+    def test_ragged_grids(self):
+
+        words = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        # A grid file ending with a blank line gives an empty last row.
+        assert (acws.solve_puzzle(words, graph + ['']) ==
+                acws.solve_puzzle(words, graph))
+
+        graph = ['AAOA', 'O', 'AOAA', 'OAA']
+
+        result = acws.solve_puzzle(TEST_KEYS, graph)
+        assert result == wss.solve_puzzle(TEST_KEYS, graph)
+        assert result['AOA'] == {'LR': [(1, 0), (0, 2)],
+                                 'RL': [(3, 0), (2, 2)],
+                                 'U': [(0, 2)], 'D': [(0, 0)]}
+
+
+unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+import word_search_solver as wss
+import batch_word_search_solver as bws
+
+# os, shutil and tempfile are used to build a directory of puzzles
+# which can be thrown away, along with the solutions, after each test.
+import os
+import shutil
+import tempfile
+
+TEST_KEYS = ['AAOA', 'OOOO']
+TEST_GRAPH = [
+    'AAAO',
+    'AAOA',
+    'AOAA',
+    'OAAA'
+]
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+
+def write_list_to_txt_file(file_name, what_to_write):
+    with open(file_name, 'w+') as the_file:
+        for each_line in what_to_write:
+            the_file.write('{}\n'.format(each_line))
+
+
+class TestBatchWordSearchSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+        self.key_path = os.path.join(self.directory, 'keys.txt')
+        write_list_to_txt_file(self.key_path, TEST_KEYS)
+
+        for name in ('first', 'second', 'third'):
+            write_list_to_txt_file(os.path.join(self.directory,
+                                                '{}.txt'.format(name)),
+                                   TEST_GRAPH)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_read_directory(self):
+
+        puzzles = bws.read_directory(self.directory, self.key_path)
+
+        # The word list isn't mistaken for a grid.
+        assert len(puzzles) == 3
+
+        key_path, grid_path, solution_path = puzzles[0]
+        assert key_path == self.key_path
+        assert grid_path == os.path.join(self.directory, 'first.txt')
+        assert solution_path == os.path.join(self.directory, 'solutions',
+                                             'first_solution.txt')
+
+    def test_read_manifest(self):
+
+        manifest_path = os.path.join(self.directory, 'manifest.tsv')
+        write_list_to_txt_file(manifest_path, [
+            '# keys\tgrid\tsolution',
+            'keys.txt\tfirst.txt\tout.txt',
+            '',
+            'keys.txt\tsecond.txt'
+        ])
+
+        puzzles = bws.read_manifest(manifest_path)
+
+        assert puzzles == [
+            (self.key_path,
+             os.path.join(self.directory, 'first.txt'),
+             os.path.join(self.directory, 'out.txt')),
+            (self.key_path,
+             os.path.join(self.directory, 'second.txt'),
+             os.path.join(self.directory, 'second_solution.txt'))
+        ]
+
+        write_list_to_txt_file(manifest_path, ['keys.txt'])
+        self.assertRaises(ValueError, bws.read_manifest, manifest_path)
+
+    def test_solve_batch(self):
+
+        puzzles = bws.read_directory(self.directory, self.key_path)
+        puzzles.append((os.path.abspath(KEY_FILE_PATH),
+                        os.path.abspath(GRAPH_FILE_PATH),
+                        os.path.join(self.directory, 'real.txt')))
+
+        solution_paths, elapsed = bws.solve_batch(puzzles, workers=2)
+
+        assert solution_paths == [each_puzzle[2] for each_puzzle in puzzles]
+        assert elapsed >= 0
+
+        expected_path = os.path.join(self.directory, 'expected.txt')
+
+        for key_path, grid_path, solution_path in puzzles:
+
+            solver = wss.WordSearchSolver(key_path, grid_path, expected_path)
+            solver.solve_puzzle()
+
+            assert (wss.load_list_from_text_file(solution_path) ==
+                    wss.load_list_from_text_file(expected_path))
+
+    def test_bad_puzzle_in_a_batch(self):
+
+        puzzles = bws.read_directory(self.directory, self.key_path)
+        puzzles.insert(1, (self.key_path,
+                           os.path.join(self.directory, 'missing.txt'),
+                           os.path.join(self.directory, 'missing_out.txt')))
+
+        solution_paths, elapsed = bws.solve_batch(puzzles, workers=2)
+
+        # Only the missing grid failed, and the rest were still written.
+        assert isinstance(solution_paths[1], IOError)
+
+        del solution_paths[1]
+        del puzzles[1]
+
+        assert solution_paths == [each_puzzle[2] for each_puzzle in puzzles]
+
+        for each_path in solution_paths:
+            assert os.path.isfile(each_path)
+
+        assert not os.path.exists(os.path.join(self.directory,
+                                               'missing_out.txt'))
+
+
+unittest.main()
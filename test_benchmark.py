@@ -0,0 +1,74 @@
+import unittest
+import word_search_solver as wss
+import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_generate_puzzle(self):
+
+        words, graph = benchmark.generate_puzzle(30, 40, 20, 6, skew=1.5,
+                                                 seed=5)
+
+        assert len(graph) == 30
+        assert set(len(each_row) for each_row in graph) == set([40])
+        assert len(set(words)) == 20
+        assert set(len(each_word) for each_word in words) == set([6])
+
+        # The same seed makes the same puzzle, and another seed doesn't.
+        assert benchmark.generate_puzzle(30, 40, 20, 6, skew=1.5,
+                                         seed=5) == (words, graph)
+        assert benchmark.generate_puzzle(30, 40, 20, 6, skew=1.5,
+                                         seed=6) != (words, graph)
+
+        # Every planted word can be found, unless a later one was
+        # planted over it.
+        results = wss.load_engine('coordinates')(words, graph)
+        found = [each_word for each_word in words if results[each_word]]
+        assert len(found) >= len(words) * 0.8
+
+        # Skewed grids use the first letters of the alphabet the most.
+        letters = ''.join(graph)
+        assert letters.count('A') > letters.count('Z')
+
+    def test_words_fit_small_grids(self):
+
+        words, graph = benchmark.generate_puzzle(3, 5, 4, 10, alphabet='AB')
+
+        assert set(len(each_word) for each_word in words) == set([3])
+
+        # Only 8 words of 3 letters can be made of A and B.
+        words, graph = benchmark.generate_puzzle(3, 3, 20, 3, alphabet='AB')
+        assert len(words) == 8
+
+    def test_run_sweep(self):
+
+        solver_paths = [benchmark.SOLVER_PATH, 'coordinates', 'simple']
+
+        results = list(benchmark.run_sweep(sizes=[10, 20], word_counts=[5],
+                                           word_lengths=[4], skews=[0.0],
+                                           solver_paths=solver_paths,
+                                           repeat=1))
+
+        assert len(results) == 6
+        assert [result['solver'] for result in results] == solver_paths * 2
+
+        for result in results:
+            assert result['seconds'] > 0
+            assert result['matches'] >= 1
+            assert result['peak_bytes'] > 0
+            assert result['matches_per_second'] == (result['matches'] /
+                                                    result['seconds'])
+
+        # Every path finds the same matches in the same puzzle.
+        assert len(set(result['matches'] for result in results[:3])) == 1
+
+        results = list(benchmark.run_sweep(sizes=[10], word_counts=[5],
+                                           word_lengths=[4], skews=[0.0],
+                                           solver_paths=['simple'],
+                                           repeat=1, memory=False))
+
+        assert results[0]['peak_bytes'] is None
+
+
+unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import word_search_solver as wss
+import line_word_search_solver as lws
+import bitboard_word_search_solver as bws
+
+# random is used to make a large grid to check every tile's bit in.
+import random
+
+TEST_KEYS = ['AAOA', 'OOOO', 'AOA', 'ZZZ', 'A', 'OA', 'AO']
+TEST_GRAPH = [
+    'AAAO',
+    'AAOA',
+    'AOAA',
+    'OAAA'
+]
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+
+class TestBitboardWordSearchSolver(unittest.TestCase):
+
+    def test_build_bitboards(self):
+
+        bitboards, stride = bws.build_bitboards(TEST_GRAPH)
+
+        assert stride == 5
+        assert sorted(bitboards) == ['A', 'O']
+
+        # One bit per tile, and none of them on a guard bit.
+        assert bin(bitboards['A']).count('1') == 12
+        assert bin(bitboards['O']).count('1') == 4
+        assert bitboards['A'] & bitboards['O'] == 0
+
+        guard_bits = sum(1 << (y * stride + 4) for y in range(4))
+        assert (bitboards['A'] | bitboards['O']) & guard_bits == 0
+
+        # A longer row would run into the next one.
+        self.assertRaises(ValueError, bws.build_bitboards, ['A', 'ABC'])
+        self.assertRaises(ValueError, bws.solve_puzzle, ['CA'], ['A', 'ABC'])
+
+    def test_build_bitboards_for_a_large_grid(self):
+
+        generator = random.Random(5)
+
+        graph = [''.join(generator.choice('ABCD') for _ in range(300))
+                 for _ in range(200)]
+
+        bitboards, stride = bws.build_bitboards(graph)
+
+        assert stride == 301
+
+        # Every tile's bit is set in its own letter's bitboard, and
+        # no bit is set anywhere else.
+        for each_letter, each_bitboard in bitboards.items():
+
+            positions = set(y * stride + x
+                            for y, each_row in enumerate(graph)
+                            for x, letter in enumerate(each_row)
+                            if letter == each_letter)
+
+            assert bin(each_bitboard).count('1') == len(positions)
+            assert all(each_bitboard >> position & 1
+                       for position in positions)
+
+        words = ['ABCD', 'AAAA', 'DCBA', 'BAD']
+
+        assert (bws.solve_puzzle(words, graph) ==
+                lws.solve_puzzle(words, graph))
+
+    def test_find_word_in_direction(self):
+
+        bitboards, stride = bws.build_bitboards(TEST_GRAPH)
+
+        def find(word, direction):
+            return bws.find_word_in_direction(bitboards, stride,
+                                              word, direction)
+
+        assert find('AAOA', 'LR') == [(0, 1)]
+        assert find('OOOO', 'DDL') == [(3, 0)]
+        assert find('OOOO', 'DUR') == [(0, 3)]
+
+        # 'OA' can't wrap from the end of row 0 onto the start of row 1,
+        # and 'AO' can't wrap from the start of row 1 back onto row 0.
+        assert find('OA', 'LR') == [(2, 1), (1, 2), (0, 3)]
+        assert find('AO', 'RL') == [(3, 1), (2, 2), (1, 3)]
+        assert find('ZZZ', 'LR') == []
+
+    def test_solve_puzzle_matches_line_solver(self):
+
+        result = bws.solve_puzzle(TEST_KEYS, TEST_GRAPH)
+        assert result == lws.solve_puzzle(TEST_KEYS, TEST_GRAPH)
+
+        words = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        result = bws.solve_puzzle(words, graph)
+        assert result == lws.solve_puzzle(words, graph)
+        assert result['Binary'] == {'DUR': [(2, 11)]}
+
+
+unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import word_search_solver as wss
+import engine_selection as es
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+
+class TestEngineSelection(unittest.TestCase):
+
+    def setUp(self):
+        self.keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        self.graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+    def test_gather_statistics(self):
+
+        statistics = es.gather_statistics(['AAOA', 'Z Z', ''],
+                                          ['AAAO', 'AAOA', 'AOAA', 'OAAA'])
+
+        assert statistics['tiles'] == 16
+        assert statistics['words'] == 2
+        assert statistics['word_letters'] == 6
+        assert statistics['first_letter_tiles'] == 24
+        assert statistics['repeat_chance'] == 0.75 ** 2 + 0.25 ** 2
+        assert statistics['rectangular']
+
+        # AAOA: 8 directions * 16 tiles * 0.75 * 0.75 * 0.25 * 0.75,
+        # and no Zs at all.
+        assert abs(statistics['expected_matches'] - 13.5) < 1e-9
+
+    def test_estimate_costs(self):
+
+        costs = es.estimate_costs(self.keys, self.graph)
+
+        assert 'auto' not in costs
+        assert set(costs) <= set(wss.ENGINES)
+
+        for each_cost in costs.values():
+            assert each_cost > 0
+
+        # Only some engines can solve rows of different lengths...
+        costs = es.estimate_costs(self.keys, ['ABC', 'A', 'AB'])
+        assert sorted(costs) == ['aho_corasick', 'coordinates', 'lines',
+                                 'simple']
+
+        # ...or letters which don't fit in a byte.
+        costs = es.estimate_costs(self.keys, [u'一丁', u'AB'])
+        assert 'numpy' not in costs
+        assert 'tiled' not in costs
+
+    def test_choose_engine(self):
+
+        engine, reason = es.choose_engine(self.keys, self.graph)
+
+        assert engine in wss.ENGINES
+        assert engine in reason
+        assert '53 words' in reason
+
+        # Starting worker processes is never worth it for a tiny grid.
+        assert engine != 'tiled'
+
+    def test_solve_puzzle(self):
+
+        expected = wss.load_engine('coordinates')(self.keys, self.graph)
+
+        with self.assertLogs('engine_selection', level='INFO') as logs:
+            assert es.solve_puzzle(self.keys, self.graph) == expected
+
+        assert 'Chose the' in logs.output[0]
+
+        with self.assertLogs('engine_selection', level='INFO'):
+            assert es.solve_puzzle(['ABC'], ['ABC', 'A', 'AB']) == {
+                'ABC': {'LR': [(0, 0)]}}
+
+
+unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import word_search_solver as wss
+import simple_word_search_solver as sws
+import line_word_search_solver as lws
+
+TEST_KEYS = ['AAOA', 'OOOO', 'AOA', 'ZZZ']
+TEST_GRAPH = [
+    'AAAO',
+    'AAOA',
+    'AOAA',
+    'OAAA'
+]
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+
+class TestLineWordSearchSolver(unittest.TestCase):
+
+    def test_extract_lines(self):
+
+        lines = lws.extract_lines(TEST_GRAPH)
+
+        # Four rows, four columns and seven diagonals each way.
+        assert len(lines) == 22
+
+        directions = [each_line[3] for each_line in lines]
+        assert directions.count('LR') == 4
+        assert directions.count('D') == 4
+        assert directions.count('DDR') == 7
+        assert directions.count('DDL') == 7
+
+        assert ('AAOA', 0, 1, 'LR') in lines
+        assert ('OOOO', 3, 0, 'DDL') in lines
+        assert ('O', 3, 0, 'DDR') in lines
+
+        # Every tile appears once in each of the four directions.
+        assert sum(len(each_line[0]) for each_line in lines) == 16 * 4
+
+    def test_find_all(self):
+
+        assert lws.find_all('AAAA', 'AA') == [0, 1, 2]
+        assert lws.find_all('AOAOA', 'AOA') == [0, 2]
+        assert lws.find_all('AOAOA', 'OO') == []
+
+    def test_solve_puzzle_matches_simple_solver(self):
+
+        result = lws.solve_puzzle(TEST_KEYS, TEST_GRAPH)
+        assert result == sws.solve_puzzle(TEST_KEYS, TEST_GRAPH)
+
+        assert result['AAOA'] == {'LR': [(0, 1)], 'RL': [(3, 2)],
+                                  'U': [(2, 3)], 'D': [(1, 0)]}
+        assert result['OOOO'] == {'DUR': [(0, 3)], 'DDL': [(3, 0)]}
+        assert result['ZZZ'] == {}
+
+        words = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        result = lws.solve_puzzle(words, graph)
+        assert result == sws.solve_puzzle(words, graph)
+
+        assert result['Binary'] == {'DUR': [(2, 11)]}
+        assert result['Disk drive'] == {'DUR': [(2, 17)]}
+        assert result['Wireless'] == {}
+
+    def test_ragged_grids(self):
+
+        # A grid file ending with a blank line gives an empty last row.
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH) + ['']
+        words = wss.load_list_from_text_file(KEY_FILE_PATH)
+
+        assert (lws.solve_puzzle(words, graph) ==
+                wss.solve_puzzle(words, graph[:-1]))
+
+        # Columns and diagonals are cut where a row is too short.
+        graph = ['AAOA', 'O', 'AOAA', 'OAA']
+        lines = lws.extract_lines(graph)
+
+        assert ('A', 1, 0, 'D') in lines
+        assert ('OA', 1, 2, 'D') in lines
+        assert ('A', 3, 2, 'D') in lines
+        assert sum(len(each_line[0]) for each_line in lines) == 12 * 4
+
+        result = lws.solve_puzzle(TEST_KEYS, graph)
+        assert result == sws.solve_puzzle(TEST_KEYS, graph)
+        assert result['AOA'] == {'LR': [(1, 0), (0, 2)],
+                                 'RL': [(3, 0), (2, 2)],
+                                 'U': [(0, 2)], 'D': [(0, 0)]}
+
+
+unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import word_search_solver as wss
+import line_word_search_solver as lws
+import mapped_word_search_solver as mws
+
+# os is used to create test grid files, so they
+# can easily be altered as part of testing.
+import os
+
+TEST_KEYS = ['AAOA', 'OOOO', 'AOA', 'ZZZ']
+TEST_GRAPH = [
+    'AAAO',
+    'AAOA',
+    'AOAA',
+    'OAAA'
+]
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+TEST_GRAPH_PATH = 'test_mapped_graph_file.txt'
+
+
+def write_bytes_to_file(file_name, what_to_write):
+    with open(file_name, 'wb') as the_file:
+        the_file.write(what_to_write)
+
+
+class TestMappedWordSearchSolver(unittest.TestCase):
+
+    def tearDown(self):
+        if os.path.exists(TEST_GRAPH_PATH):
+            os.remove(TEST_GRAPH_PATH)
+
+    def test_mapped_grid(self):
+
+        for line_ending in (b'\n', b'\r\n'):
+            for last_line_ending in (line_ending, b''):
+
+                rows = [each_row.encode('ascii') for each_row in TEST_GRAPH]
+                write_bytes_to_file(TEST_GRAPH_PATH,
+                                    line_ending.join(rows) + last_line_ending)
+
+                with mws.MappedGrid(TEST_GRAPH_PATH) as grid:
+                    assert len(grid) == 4
+                    assert grid.width == 4
+                    assert list(grid) == TEST_GRAPH
+                    assert grid[1] == 'AAOA'
+                    assert grid[-1] == 'OAAA'
+                    assert grid[1:3] == ['AAOA', 'AOAA']
+                    assert grid[2][1] == 'O'
+
+                # Blank lines at the end of the file aren't rows.
+                write_bytes_to_file(TEST_GRAPH_PATH,
+                                    line_ending.join(rows) + line_ending * 3)
+
+                with mws.MappedGrid(TEST_GRAPH_PATH) as grid:
+                    assert list(grid) == TEST_GRAPH
+
+        write_bytes_to_file(TEST_GRAPH_PATH, b'AAA\nAA\nAAA\nA\n')
+        self.assertRaises(ValueError, mws.MappedGrid, TEST_GRAPH_PATH)
+
+        # Rows are checked as they are read.
+        write_bytes_to_file(TEST_GRAPH_PATH, b'AAA\nAA\nAAA\n')
+        with mws.MappedGrid(TEST_GRAPH_PATH) as grid:
+            assert grid[0] == 'AAA'
+            self.assertRaises(ValueError, grid.__getitem__, 1)
+
+        write_bytes_to_file(TEST_GRAPH_PATH, b'')
+        with mws.MappedGrid(TEST_GRAPH_PATH) as grid:
+            assert len(grid) == 0
+
+    def test_solve_in_bands(self):
+
+        with mws.MappedGrid(GRAPH_FILE_PATH) as grid:
+            assert list(grid) == wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        words = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        expected = lws.solve_puzzle(words, graph)
+
+        # Bands of one row, so almost every match crosses a band.
+        for band_height in (1, 5, None):
+            result = mws.solve_puzzle_file(words, GRAPH_FILE_PATH,
+                                           engine='lines',
+                                           band_height=band_height)
+            assert result == expected
+
+        assert (mws.solve_in_bands(TEST_KEYS, TEST_GRAPH, band_height=3) ==
+                lws.solve_puzzle(TEST_KEYS, TEST_GRAPH))
+
+
+unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import word_search_solver as wss
+import line_word_search_solver as lws
+import numpy_word_search_solver as nws
+
+TEST_KEYS = ['AAOA', 'OOOO', 'AOA', 'ZZZ', 'A', 'AAAAA']
+TEST_GRAPH = [
+    'AAAO',
+    'AAOA',
+    'AOAA',
+    'OAAA'
+]
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+
+class TestNumpyWordSearchSolver(unittest.TestCase):
+
+    @unittest.skipIf(nws.numpy is None, 'NumPy is not installed.')
+    def test_find_word_in_direction(self):
+
+        array = nws.build_array(TEST_GRAPH)
+        assert array.shape == (4, 4)
+
+        assert nws.find_word_in_direction(array, 'AAOA', 'LR') == [(0, 1)]
+        assert nws.find_word_in_direction(array, 'OOOO', 'DDL') == [(3, 0)]
+        assert nws.find_word_in_direction(array, 'AAAAA', 'LR') == []
+        assert nws.find_word_in_direction(array, 'AOA', 'DUL') == [(3, 2),
+                                                                   (2, 3)]
+
+        self.assertRaises(ValueError, nws.build_array, ['AAA', 'AA'])
+
+    def test_solve_puzzle_matches_line_solver(self):
+
+        result = nws.solve_puzzle(TEST_KEYS, TEST_GRAPH)
+        assert result == lws.solve_puzzle(TEST_KEYS, TEST_GRAPH)
+
+        words = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        result = nws.solve_puzzle(words, graph)
+        assert result == lws.solve_puzzle(words, graph)
+        assert result['Binary'] == {'DUR': [(2, 11)]}
+
+    def test_solve_puzzle_without_numpy(self):
+
+        numpy = nws.numpy
+
+        try:
+            nws.numpy = None
+            result = nws.solve_puzzle(TEST_KEYS, TEST_GRAPH)
+        finally:
+            nws.numpy = numpy
+
+        assert result == lws.solve_puzzle(TEST_KEYS, TEST_GRAPH)
+
+    def test_solve_puzzle_with_ragged_rows(self):
+
+        words = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        # A grid file ending with a blank line gives an empty last row.
+        assert (nws.solve_puzzle(words, graph + ['']) ==
+                wss.solve_puzzle(words, graph))
+
+        # Grids which can't be loaded into an array fall back to the
+        # line solver, which handles rows of different lengths.
+        graph = ['AAOA', 'O', 'AOAA', 'OAA']
+
+        result = nws.solve_puzzle(TEST_KEYS, graph)
+        assert result == wss.solve_puzzle(TEST_KEYS, graph)
+        assert result['AOA'] == {'LR': [(1, 0), (0, 2)],
+                                 'RL': [(3, 0), (2, 2)],
+                                 'U': [(0, 2)], 'D': [(0, 0)]}
+
+
+unittest.main()
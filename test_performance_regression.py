@@ -0,0 +1,80 @@
+import unittest
+import performance_regression as pr
+
+# os is used to remove the baseline file written by a test.
+import os
+
+TINY_CORPUS = (
+    {'height': 12, 'width': 10, 'word_count': 8, 'word_length': 4,
+     'skew': 0.0, 'seed': 1},
+    {'height': 10, 'width': 10, 'word_count': 8, 'word_length': 3,
+     'alphabet': 'AB', 'skew': 0.0, 'seed': 2}
+)
+
+
+class TestPerformanceRegression(unittest.TestCase):
+
+    def test_replay_corpus(self):
+
+        solver_paths = ['WordSearchSolver', 'coordinates', 'simple', 'lines']
+
+        timings, mismatches = pr.replay_corpus(TINY_CORPUS, solver_paths,
+                                               repeat=1)
+
+        assert not mismatches
+        assert sorted(timings) == sorted(pr.puzzle_name(each_puzzle)
+                                         for each_puzzle in TINY_CORPUS)
+
+        for each_timing in timings.values():
+            assert sorted(each_timing) == sorted(solver_paths)
+
+    def test_puzzle_names_differ(self):
+
+        names = set(pr.puzzle_name(each_puzzle)
+                    for each_puzzle in pr.CORPUS + TINY_CORPUS)
+
+        assert len(names) == len(pr.CORPUS + TINY_CORPUS)
+
+    def test_find_slowdowns(self):
+
+        baseline = {'puzzle': {'fast': 0.001, 'slow': 1.0, 'steady': 1.0}}
+
+        timings = {'puzzle': {'fast': 0.004, 'slow': 1.6, 'steady': 1.2,
+                              'new': 5.0},
+                   'new puzzle': {'slow': 5.0}}
+
+        # The fast solver got 4 times slower, but by less than the
+        # tolerance, and there's nothing to compare new solvers against.
+        assert pr.find_slowdowns(timings, baseline) == [
+            ('puzzle', 'slow', 1.0, 1.6)]
+
+        assert pr.find_slowdowns(timings, baseline, threshold=2) == []
+
+        assert len(pr.find_slowdowns(timings, baseline, threshold=1,
+                                     tolerance=0)) == 3
+
+    def test_baseline_file(self):
+
+        baseline_path = 'test_performance_baseline.json'
+
+        timings = {'puzzle': {'simple': 0.5}}
+
+        try:
+            pr.save_baseline(timings, baseline_path)
+
+            assert pr.load_baseline(baseline_path) == (
+                timings, pr.describe_environment())
+
+        finally:
+            os.remove(baseline_path)
+
+    def test_available_solver_paths(self):
+
+        solver_paths = pr.available_solver_paths()
+
+        assert solver_paths[0] == 'WordSearchSolver'
+        assert 'simple' in solver_paths
+        assert 'coordinates' in solver_paths
+
+
+unittest.main()
@@ -0,0 +1,214 @@
+import unittest
+import word_search_solver as wss
+import puzzle_session as ps
+
+# random is used to make many edits to a grid, checking each against
+# a full solve of the edited grid, and os to remove solution files.
+import random
+import os
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+TEST_KEYS = ['AAOA', 'OOOO', 'ZZZ']
+TEST_GRAPH = [
+    'AAAO',
+    'AAOA',
+    'AOAA',
+    'OAAA'
+]
+
+
+def solve(words, graph):
+    return wss.load_engine('simple')(words, graph)
+
+
+class TestPuzzleSession(unittest.TestCase):
+
+    def test_solves_puzzle(self):
+
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        session = ps.PuzzleSession(keys, graph)
+
+        assert session.results() == solve(keys, graph)
+        assert session.graph() == graph
+
+    def test_ragged_grids(self):
+
+        grid_path = 'test_graph_file.txt'
+
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        # A grid file ending with a blank line.
+        try:
+            with open(grid_path, 'w') as grid_file:
+                grid_file.write('\n'.join(graph) + '\n\n')
+
+            session = ps.PuzzleSession.from_files(KEY_FILE_PATH, grid_path)
+
+        finally:
+            os.remove(grid_path)
+
+        assert session.graph() == graph
+        assert session.results() == solve(keys, graph)
+
+        # Rows of different lengths.
+        graph = ['AAOA', 'O', 'AOAA', 'OAA']
+
+        session = ps.PuzzleSession(TEST_KEYS, graph)
+        assert session.results() == solve(TEST_KEYS, graph)
+
+        session.edit_cells({(0, 1): 'A'})
+        assert session.results() == solve(TEST_KEYS, session.graph())
+
+    def test_edit_cells(self):
+
+        session = ps.PuzzleSession(TEST_KEYS, TEST_GRAPH)
+
+        # Breaking the anti-diagonal of Os breaks both readings of
+        # OOOO, and the AAOAs down the second column and along the
+        # third row, which also cross it.
+        added, removed = session.edit_cells({(1, 2): 'A'})
+
+        assert removed == set([('OOOO', 'DUR', 0, 3),
+                               ('OOOO', 'DDL', 3, 0),
+                               ('AAOA', 'D', 1, 0),
+                               ('AAOA', 'RL', 3, 2)])
+        assert session.results()['OOOO'] == {}
+
+        # Putting it back makes them again.
+        added, removed_again = session.edit_cells([((1, 2), 'O')])
+
+        assert added == removed
+        assert not removed_again
+
+        assert session.results() == solve(TEST_KEYS, TEST_GRAPH)
+
+        # Setting a letter to itself changes nothing.
+        assert session.edit_cells({(0, 0): 'A'}) == (set(), set())
+
+        # Making the bottom row ZZZA adds ZZZ both ways.
+        added, removed = session.edit_cells({(0, 3): 'Z', (1, 3): 'Z',
+                                             (2, 3): 'Z'})
+        assert ('ZZZ', 'LR', 0, 3) in added
+        assert ('ZZZ', 'RL', 2, 3) in added
+        assert ('OOOO', 'DUR', 0, 3) in removed
+
+        with self.assertRaises(IndexError):
+            session.edit_cells({(4, 0): 'A'})
+
+        with self.assertRaises(ValueError):
+            session.edit_cells({(0, 0): 'AB'})
+
+    def test_add_and_remove_words(self):
+
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        session = ps.PuzzleSession(keys[5:], graph)
+
+        # Words already in the session aren't searched for again.
+        added, removed = session.add_words(keys[:5] + keys[10:15])
+
+        assert not removed
+        assert ('Binary', 'DUR', 2, 11) in added
+        assert session.results() == solve(keys, graph)
+
+        added, removed = session.remove_words(['Binary', 'not a key'])
+
+        assert not added
+        assert removed == set([('Binary', 'DUR', 2, 11)])
+        assert 'Binary' not in session.results()
+
+        # Edits after changing the words use the new word list.
+        session.add_words(['AAA'])
+        session.edit_cells({(0, 0): 'A', (1, 0): 'A', (2, 0): 'A'})
+
+        words = [each_word for each_word in keys if each_word != 'Binary']
+        assert session.results() == solve(words + ['AAA'], session.graph())
+
+        operations = [operation for operation, seconds in session.latencies]
+        assert operations == ['solve', 'add_words', 'remove_words',
+                              'add_words', 'edit_cells']
+
+    def test_add_words_after_edits(self):
+
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        session = ps.PuzzleSession(keys[5:], graph)
+
+        def rebuild(*arguments, **keyword_arguments):
+            raise AssertionError("The whole grid was indexed again.")
+
+        build_reach_table, puzzle = wss.build_reach_table, wss.Puzzle
+
+        # Only the edited tiles are indexed again, not the whole grid.
+        try:
+            wss.build_reach_table = wss.Puzzle = rebuild
+
+            # Spell AAA along the top row, then look for it.
+            session.edit_cells({(0, 0): 'A', (1, 0): 'A', (2, 0): 'A'})
+            added, removed = session.add_words(keys[:5] + ['AAA'])
+
+        finally:
+            wss.build_reach_table, wss.Puzzle = build_reach_table, puzzle
+
+        assert ('AAA', 'LR', 0, 0) in added
+        assert session.results() == solve(keys + ['AAA'], session.graph())
+
+    def test_solution_file_kept_up_to_date(self):
+
+        solution_path = 'test_solution_file.txt'
+
+        try:
+            session = ps.PuzzleSession(TEST_KEYS, TEST_GRAPH, solution_path)
+
+            assert '    Not found.' in wss.load_list_from_text_file(
+                solution_path)
+
+            session.edit_cells({(0, 3): 'Z', (1, 3): 'Z', (2, 3): 'Z'})
+            session.remove_words(['OOOO'])
+
+            expected_path = 'test_expected_solution_file.txt'
+            wss.write_solution_to_file(session.results(), expected_path)
+
+            try:
+                assert (wss.load_list_from_text_file(solution_path) ==
+                        wss.load_list_from_text_file(expected_path))
+            finally:
+                os.remove(expected_path)
+
+        finally:
+            if os.path.exists(solution_path):
+                os.remove(solution_path)
+
+    def test_edits_match_full_solve(self):
+
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        session = ps.PuzzleSession(keys, graph)
+
+        generator = random.Random(17)
+
+        # Copy letters from elsewhere in the grid, so words are made as
+        # well as broken, sometimes several tiles at a time.
+        for _ in range(50):
+
+            edits = {}
+
+            for _ in range(generator.randint(1, 3)):
+                x = generator.randrange(len(graph[0]))
+                y = generator.randrange(len(graph))
+                edits[(x, y)] = generator.choice(generator.choice(graph))
+
+            session.edit_cells(edits)
+
+            assert session.results() == solve(keys, session.graph())
+
+
+unittest.main()
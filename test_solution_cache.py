@@ -0,0 +1,124 @@
+import unittest
+import word_search_solver as wss
+import solution_cache as sc
+
+# os and shutil are used to remove the cache directories made while testing.
+import os
+import shutil
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+TEST_CACHE_DIRECTORY = 'test_solution_cache'
+TEST_SOLUTION_PATH = 'test_solution_file.txt'
+
+TEST_GRAPH = ['AAOA', 'AOAO', 'OAOA', 'AOAO']
+
+
+class TestSolutionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = sc.SolutionCache(TEST_CACHE_DIRECTORY)
+
+    def tearDown(self):
+        if os.path.isdir(TEST_CACHE_DIRECTORY):
+            shutil.rmtree(TEST_CACHE_DIRECTORY)
+        if os.path.exists(TEST_SOLUTION_PATH):
+            os.remove(TEST_SOLUTION_PATH)
+
+    def test_keys(self):
+
+        words = ['AAOA', 'OOOO', 'ZZZ']
+        key = self.cache.key_for(words, TEST_GRAPH)
+
+        assert len(key) == 64
+
+        # The order and repetition of words don't change the answer...
+        assert self.cache.key_for(['ZZZ', 'AAOA', 'OOOO', 'ZZZ'],
+                                  TEST_GRAPH) == key
+
+        # ...but the words, grid and engine all do.
+        assert self.cache.key_for(words[:2], TEST_GRAPH) != key
+        assert self.cache.key_for(words, TEST_GRAPH[:3]) != key
+        assert self.cache.key_for(words, TEST_GRAPH, 'simple') != key
+
+        # Rows can't run together into a different grid.
+        assert (self.cache.key_for(words, ['AB', 'C']) !=
+                self.cache.key_for(words, ['A', 'BC']))
+
+    def test_get_and_put(self):
+
+        words = ['AAOA', 'OOOO', 'ZZZ']
+        results = wss.load_engine('simple')(words, TEST_GRAPH)
+
+        assert self.cache.get(words, TEST_GRAPH) is None
+
+        self.cache.put(words, TEST_GRAPH, None, results)
+
+        assert self.cache.get(words, TEST_GRAPH) == results
+        assert list(self.cache.get(words[::-1], TEST_GRAPH)) == words[::-1]
+        assert self.cache.get(words, TEST_GRAPH, 'simple') is None
+
+        self.cache.clear()
+
+        assert self.cache.get(words, TEST_GRAPH) is None
+
+    def test_least_recently_used_are_evicted(self):
+
+        solutions = []
+
+        for each_word in ('AAOA', 'OOOO', 'AOAO'):
+            words = [each_word]
+            results = wss.load_engine('simple')(words, TEST_GRAPH)
+            solutions.append((words, results))
+            self.cache.put(words, TEST_GRAPH, None, results)
+
+        sizes = [os.path.getsize(self.cache.path_for(
+            self.cache.key_for(words, TEST_GRAPH)))
+            for words, results in solutions]
+
+        # Make the order they were used in unambiguous.
+        for age, (words, results) in zip((30, 20, 10), solutions):
+            path = self.cache.path_for(self.cache.key_for(words, TEST_GRAPH))
+            used_time = os.path.getmtime(path) - age
+            os.utime(path, (used_time, used_time))
+
+        # Using the oldest solution makes the second one the oldest.
+        assert self.cache.get(solutions[0][0], TEST_GRAPH) is not None
+
+        self.cache.max_bytes = sizes[0] + sizes[2]
+        self.cache.evict()
+
+        assert self.cache.get(solutions[0][0], TEST_GRAPH) is not None
+        assert self.cache.get(solutions[1][0], TEST_GRAPH) is None
+        assert self.cache.get(solutions[2][0], TEST_GRAPH) is not None
+
+    def test_solver_uses_cache(self):
+
+        solver = wss.WordSearchSolver(KEY_FILE_PATH, GRAPH_FILE_PATH,
+                                      TEST_SOLUTION_PATH, no_output=True,
+                                      cache=self.cache)
+        results = solver.solve_puzzle()
+
+        assert solver.coordinates
+
+        solver = wss.WordSearchSolver(KEY_FILE_PATH, GRAPH_FILE_PATH,
+                                      TEST_SOLUTION_PATH, no_output=True,
+                                      cache=self.cache)
+
+        assert solver.solve_puzzle() == results
+
+        # The cached solution was used, so nothing was indexed.
+        assert not solver.coordinates
+
+        for each_engine in ('simple', 'aho_corasick'):
+            solver = wss.WordSearchSolver(KEY_FILE_PATH, GRAPH_FILE_PATH,
+                                          TEST_SOLUTION_PATH, no_output=True,
+                                          engine=each_engine,
+                                          cache=self.cache)
+            assert solver.solve_puzzle() == results
+
+        assert len(os.listdir(TEST_CACHE_DIRECTORY)) == 3
+
+
+unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import word_search_solver as wss
+import solution_formats as sf
+
+# os is used to remove the solution files written while testing.
+import os
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+TEST_SOLUTION_PATH = 'test_solution_file.txt'
+
+TEST_RESULTS = {
+    'AAOA': {'LR': [(0, 1)], 'RL': [(3, 2)], 'U': [(2, 3)], 'D': [(1, 0)]},
+    'OOOO': {'DUR': [(0, 3)], 'DDL': [(3, 0)]},
+    'ZZZ': {},
+    'Save, "As"': {'DDR': [(100000, 70000)]}
+}
+
+
+class TestSolutionFormats(unittest.TestCase):
+
+    def setUp(self):
+        solver = wss.WordSearchSolver(KEY_FILE_PATH, GRAPH_FILE_PATH,
+                                      TEST_SOLUTION_PATH, no_output=True)
+        self.real_results = solver.solve_puzzle()
+
+    def tearDown(self):
+        if os.path.exists(TEST_SOLUTION_PATH):
+            os.remove(TEST_SOLUTION_PATH)
+
+    def test_json_lines(self):
+
+        for results in (TEST_RESULTS, self.real_results):
+            sf.write_solution(results, TEST_SOLUTION_PATH, 'jsonl')
+            assert sf.read_json_lines(TEST_SOLUTION_PATH) == results
+
+        lines = wss.load_list_from_text_file(TEST_SOLUTION_PATH)
+        assert len(lines) == 53
+        assert '{"word": "Binary", "found": {"DUR": [[2, 11]]}}' in lines
+        assert '{"word": "Wireless", "found": {}}' in lines
+
+    def test_csv(self):
+
+        sf.write_solution(TEST_RESULTS, TEST_SOLUTION_PATH, 'csv')
+
+        lines = wss.load_list_from_text_file(TEST_SOLUTION_PATH)
+        assert lines == ['word,direction,x,y',
+                         'AAOA,LR,0,1',
+                         'AAOA,RL,3,2',
+                         'AAOA,U,2,3',
+                         'AAOA,D,1,0',
+                         'OOOO,DUR,0,3',
+                         'OOOO,DDL,3,0',
+                         '"Save, ""As""",DDR,100000,70000']
+
+    def test_binary(self):
+
+        for results in (TEST_RESULTS, self.real_results):
+            sf.write_solution(results, TEST_SOLUTION_PATH, 'binary')
+            assert sf.read_binary_solution(TEST_SOLUTION_PATH) == results
+
+        words, matches = sf.iter_binary_matches(TEST_SOLUTION_PATH)
+        assert len(words) == 53
+        assert ('Binary', 'DUR', 2, 11) in list(matches)
+
+        # Every match is one fixed-size record.
+        sf.write_solution({'A': {}}, TEST_SOLUTION_PATH, 'binary')
+        empty_size = os.path.getsize(TEST_SOLUTION_PATH)
+        sf.write_solution({'A': {'LR': [(0, 0), (1, 0)]}},
+                          TEST_SOLUTION_PATH, 'binary')
+        assert (os.path.getsize(TEST_SOLUTION_PATH) - empty_size ==
+                2 * sf.BINARY_RECORD.size)
+
+        with open(TEST_SOLUTION_PATH, 'ab') as solution_file:
+            solution_file.write(b'\x00')
+        self.assertRaises(ValueError, sf.read_binary_solution,
+                          TEST_SOLUTION_PATH)
+
+    def test_text_is_default(self):
+
+        sf.write_solution(self.real_results, TEST_SOLUTION_PATH)
+
+        written_file = wss.load_list_from_text_file(TEST_SOLUTION_PATH)
+        assert 'Binary:' in written_file
+        assert '        (2, 11)' in written_file
+
+        self.assertRaises(ValueError, sf.write_solution, TEST_RESULTS,
+                          TEST_SOLUTION_PATH, 'xml')
+
+
+unittest.main()
@@ -0,0 +1,222 @@
+import unittest
+import word_search_solver as wss
+import solve_server
+
+# asyncio runs the server inside each test, json encodes requests and
+# decodes answers, os and tempfile give the Unix socket somewhere to
+# live which is thrown away after each test, and collections makes
+# caches to test remember with.
+import os
+import json
+import asyncio
+import tempfile
+import collections
+
+TEST_KEYS = ['AAOA', 'OOOO', 'ZZZ']
+TEST_GRAPH = [
+    'AAAO',
+    'AAOA',
+    'AOAA',
+    'OAAA'
+]
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+
+def as_json(results):
+    '''
+    Return results as they look once sent as JSON and read back.
+    '''
+
+    return json.loads(json.dumps(results))
+
+
+class TestSolveServer(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.directory.name, 'solver.sock')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_with_server(self, test, **options):
+        '''
+        Start a SolveServer with options on a Unix socket, run the
+        coroutine function test with it, and stop the server.
+        '''
+
+        async def run():
+
+            server = solve_server.SolveServer(**options)
+            await server.start_unix(self.socket_path)
+
+            try:
+                await test(server)
+            finally:
+                await server.close()
+
+        asyncio.run(run())
+
+    def test_answers_over_socket(self):
+
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        requests = [
+            {'id': 1, 'key_path': KEY_FILE_PATH,
+             'grid_path': GRAPH_FILE_PATH},
+            {'id': 'two', 'words': TEST_KEYS, 'grid': '\n'.join(TEST_GRAPH),
+             'engine': 'coordinates'},
+            {'id': 3, 'words': TEST_KEYS, 'grid': TEST_GRAPH,
+             'engine': 'no such engine'},
+            {'id': 4, 'key_path': 'no such file', 'grid': TEST_GRAPH},
+            {'id': 5, 'command': 'stats'}
+        ]
+
+        async def test(server):
+
+            reader, writer = await asyncio.open_unix_connection(
+                self.socket_path)
+
+            for each_request in requests:
+                writer.write(json.dumps(each_request).encode() + b'\n')
+
+            writer.write(b'not json\n')
+            writer.write_eof()
+
+            for _ in range(len(requests) + 1):
+                answer = json.loads(await reader.readline())
+                answers[answer['id']] = answer
+
+            writer.close()
+
+        answers = {}
+
+        self.run_with_server(test, workers=1)
+
+        assert answers[1]['results'] == as_json(wss.solve_puzzle(keys, graph))
+        assert answers[1]['seconds'] > 0
+
+        assert answers['two']['results'] == as_json(
+            wss.solve_puzzle(TEST_KEYS, TEST_GRAPH))
+
+        assert 'no such engine' in answers[3]['error']
+        assert 'no such file' in answers[4]['error']
+        assert 'error' in answers[None]
+
+        assert answers[5]['latency']['p50'] is None or (
+            answers[5]['latency']['p50'] <= answers[5]['latency']['max'])
+
+    def test_batches_puzzles_sharing_a_word_list(self):
+
+        statistics = {}
+
+        async def test(server):
+
+            # With only one worker, puzzles sent while it's busy
+            # wait for it, and are then handed over together.
+            answers = await asyncio.gather(*[
+                server.submit({'words': TEST_KEYS, 'grid': TEST_GRAPH})
+                for _ in range(6)])
+
+            other = await server.submit({'words': ['OOOO'],
+                                         'grid': TEST_GRAPH})
+
+            expected = json.dumps(wss.solve_puzzle(TEST_KEYS, TEST_GRAPH))
+
+            assert [json.loads(each_answer) for each_answer in answers] == [
+                json.loads(expected)] * 6
+            assert list(json.loads(other)) == ['OOOO']
+
+            statistics.update(server.statistics())
+
+        self.run_with_server(test, workers=1)
+
+        assert statistics['requests'] == 7
+        assert statistics['batches'] <= 3
+        assert statistics['queue_depth'] == 0
+        assert statistics['in_flight'] == 0
+        assert statistics['errors'] == 0
+
+        latency = statistics['latency']
+        assert 0 < latency['p50'] <= latency['p90'] <= latency['p99']
+        assert latency['p99'] <= latency['max']
+
+    def test_bad_puzzle_in_a_batch(self):
+
+        answers = []
+
+        async def test(server):
+
+            good = {'words': TEST_KEYS, 'grid': TEST_GRAPH}
+
+            # Sent together, these all share a word list and engine, so
+            # they're batched together, but only the bad ones fail.
+            answers.extend(await asyncio.gather(
+                server.submit(good),
+                server.submit({'words': TEST_KEYS,
+                               'grid_path': 'no such grid'}),
+                server.submit(good),
+                server.submit({'words': TEST_KEYS, 'grid': ['AAAO', 3]}),
+                server.submit(good),
+                return_exceptions=True))
+
+            # At least some of the five went to the worker together.
+            assert server.batches < 5
+
+        self.run_with_server(test, workers=1, engine='aho_corasick')
+
+        expected = as_json(wss.solve_puzzle(TEST_KEYS, TEST_GRAPH))
+
+        assert isinstance(answers[1], IOError)
+        assert isinstance(answers[3], Exception)
+
+        for each_answer in answers[0::2]:
+            assert json.loads(each_answer) == expected
+
+        # The same goes for a batch solved outside the server.
+        answers = solve_server.solve_grids(('words', tuple(TEST_KEYS)),
+                                           'lines', [['AAAO', 3],
+                                                     TEST_GRAPH])
+
+        assert isinstance(answers[0], Exception)
+        assert json.loads(answers[1]) == expected
+
+    def test_solve_grids(self):
+
+        word_list = ('words', tuple(TEST_KEYS))
+
+        for engine in ('coordinates', 'aho_corasick', 'simple'):
+            answers = solve_server.solve_grids(word_list, engine,
+                                               [TEST_GRAPH, GRAPH_FILE_PATH])
+
+            assert json.loads(answers[0]) == as_json(
+                wss.solve_puzzle(TEST_KEYS, TEST_GRAPH))
+            assert len(answers) == 2
+
+        # Word lists and grids are kept for the next puzzle.
+        assert word_list in solve_server.WORD_INDEXES
+        assert tuple(TEST_GRAPH) in solve_server.PUZZLES
+
+    def test_percentile(self):
+
+        values = list(range(1, 101))
+
+        assert solve_server.percentile(values, 50) == 50
+        assert solve_server.percentile(values, 99) == 99
+        assert solve_server.percentile([7], 90) == 7
+        assert solve_server.percentile([], 50) is None
+
+    def test_remember(self):
+
+        cache = collections.OrderedDict()
+
+        for key in 'abcab':
+            solve_server.remember(cache, key, lambda: key.upper(), 2)
+
+        assert list(cache.items()) == [('a', 'A'), ('b', 'B')]
+
+
+unittest.main()
@@ -0,0 +1,165 @@
+import unittest
+import word_search_solver as wss
+import solve_stats
+
+# os is used to remove the solution file written by a test.
+import os
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+TEST_SOLUTION_PATH = 'test_solution_file.txt'
+
+TEST_GRAPH = [
+    'AAAO',
+    'AAOA',
+    'AOAA',
+    'OAAA'
+]
+
+
+class TestSolveStats(unittest.TestCase):
+
+    def test_counts_starts_and_probes(self):
+
+        stats = solve_stats.SolveStats()
+
+        results = wss.Puzzle(TEST_GRAPH).find_words(['OOOO', 'ZZZ'],
+                                                    stats=stats)
+
+        assert results == wss.solve_puzzle(['OOOO', 'ZZZ'], TEST_GRAPH)
+
+        # Each of the four Os is looked at in four directions (OOOO
+        # backwards is the same word, so it isn't searched for again).
+        # Only three have room for OOOO: two across and down the grid's
+        # edges, which stop at their second letter, and one down the
+        # anti-diagonal, which takes four probes.
+        assert stats.starts == 16
+        assert stats.probes == 8
+        assert stats.word_costs['OOOO'].probes == 8
+
+        # ZZZ can't be in the grid, so it was never searched for.
+        assert 'ZZZ' not in stats.word_costs
+
+    def test_finds_the_same_locations(self):
+
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        puzzle = wss.Puzzle.from_file(GRAPH_FILE_PATH)
+
+        stats = solve_stats.SolveStats()
+
+        for word in keys:
+
+            target = wss.normalize_word(word)
+
+            for direction in wss.WordSearchSolver.directions:
+
+                counts = solve_stats.ProbeCounts()
+
+                assert (puzzle.find_word_in_direction(target, direction,
+                                                      counts=counts) ==
+                        puzzle.find_word_in_direction(target, direction))
+
+                # Every match took a probe for each of its letters.
+                assert counts.starts >= 1
+                assert counts.probes >= len(puzzle.find_word_in_direction(
+                    target, direction)) * len(target)
+
+        assert puzzle.find_words(keys, stats=stats) == puzzle.find_words(keys)
+
+        slowest = stats.slowest_words(5)
+
+        assert len(slowest) == 5
+        assert slowest[0][1].seconds >= slowest[-1][1].seconds
+
+    def test_solve_puzzle_collects_stats(self):
+
+        solver = wss.WordSearchSolver(KEY_FILE_PATH, GRAPH_FILE_PATH,
+                                      TEST_SOLUTION_PATH)
+
+        try:
+            solver.solve_puzzle()
+        finally:
+            os.remove(TEST_SOLUTION_PATH)
+
+        # Nothing is collected unless it's asked for.
+        assert solver.stats is None
+
+        solver = wss.WordSearchSolver(KEY_FILE_PATH, GRAPH_FILE_PATH,
+                                      TEST_SOLUTION_PATH, collect_stats=True)
+
+        try:
+            expected = solver.solve_puzzle()
+        finally:
+            os.remove(TEST_SOLUTION_PATH)
+
+        stats = solver.stats
+
+        assert list(stats.phases) == ['load', 'index', 'search', 'write']
+        assert stats.total_seconds() == sum(stats.phases.values())
+        assert len(stats.word_costs) == len(set(expected))
+        assert stats.probes > 0
+
+        summary = stats.as_dict(slowest=3)
+        assert len(summary['slowest_words']) == 3
+        assert summary['probes'] == stats.probes
+
+        report = stats.report(slowest=3)
+        assert 'search' in report
+        assert summary['slowest_words'][0]['word'] in report
+
+        # Other engines only have their phases timed.
+        solver = wss.WordSearchSolver(KEY_FILE_PATH, GRAPH_FILE_PATH,
+                                      TEST_SOLUTION_PATH, no_output=True,
+                                      engine='lines', collect_stats=True)
+
+        assert solver.solve_puzzle() == expected
+        assert list(solver.stats.phases) == ['load', 'search']
+        assert not solver.stats.word_costs
+        assert 'probes' not in solver.stats.report()
+
+        # A SolveStats can be handed in instead, and is filled in too.
+        stats = solve_stats.SolveStats()
+
+        solver = wss.WordSearchSolver(KEY_FILE_PATH, GRAPH_FILE_PATH,
+                                      TEST_SOLUTION_PATH, no_output=True)
+
+        assert solver.solve_puzzle(stats=stats) == expected
+        assert solver.stats is stats
+        assert list(stats.phases) == ['load', 'index', 'search']
+        assert stats.probes > 0
+
+    def test_compile_engine_collects_stats(self):
+
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        expected = wss.solve_puzzle(keys, graph)
+
+        stats = solve_stats.SolveStats()
+
+        assert wss.solve_puzzle(keys, graph, stats) == expected
+        assert list(stats.phases) == ['index', 'search']
+        assert len(stats.word_costs) == len(set(keys))
+
+        for engine in sorted(wss.ENGINES):
+
+            stats = solve_stats.SolveStats()
+
+            solve = wss.compile_engine(engine, keys, stats)
+
+            # Every graph solved is added to the same phases.
+            assert solve(graph) == expected
+            assert solve(graph) == expected
+
+            assert stats.phases['search'] > 0
+
+            if engine == 'coordinates':
+                assert list(stats.phases) == ['index', 'search']
+                assert stats.probes > 0
+            elif engine == 'aho_corasick':
+                assert list(stats.phases) == ['compile', 'search']
+            else:
+                assert list(stats.phases) == ['search']
+
+
+unittest.main()
@@ -0,0 +1,164 @@
+import unittest
+import word_search_solver as wss
+import stream_word_search_solver as sws
+
+# io stands in for stdin and stdout, json builds and reads the lines
+# passing through them, and subprocess and sys run the command line.
+import io
+import sys
+import json
+import subprocess
+
+TEST_KEYS = ['AAOA', 'OOOO', 'ZZZ']
+TEST_GRAPH = [
+    'AAAO',
+    'AAOA',
+    'AOAA',
+    'OAAA'
+]
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+
+def as_json(results):
+    '''
+    Return results as they look once written as JSON and read back.
+    '''
+
+    return json.loads(json.dumps(results))
+
+
+def run_stream(lines, **options):
+    '''
+    Solve the puzzles in lines (each a dictionary or a string) as a
+    stream, and return a tuple of (answers, errors).
+    '''
+
+    input_file = io.StringIO(''.join(
+        (each_line if isinstance(each_line, str) else json.dumps(each_line))
+        + '\n' for each_line in lines))
+    output_file = io.StringIO()
+
+    errors = sws.solve_stream(input_file, output_file, **options)
+
+    return [json.loads(each_line)
+            for each_line in output_file.getvalue().splitlines()], errors
+
+
+class TestStreamWordSearchSolver(unittest.TestCase):
+
+    def test_reuses_word_lists(self):
+
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        answers, errors = run_stream([
+            {'grid': graph},
+            {'id': 'test', 'words': TEST_KEYS, 'grid': TEST_GRAPH},
+            {'grid': '\n'.join(TEST_GRAPH)},
+            '',
+            {'words': ['OOOO']},
+            {'grid': TEST_GRAPH}
+        ], key_path=KEY_FILE_PATH)
+
+        assert not errors
+
+        expected = as_json(wss.solve_puzzle(TEST_KEYS, TEST_GRAPH))
+
+        assert answers == [
+            {'id': 1, 'results': as_json(wss.solve_puzzle(keys, graph))},
+            {'id': 'test', 'results': expected},
+            {'id': 3, 'results': expected},
+            {'id': 4, 'results': {'OOOO': expected['OOOO']}}]
+
+    def test_every_engine(self):
+
+        expected = as_json(wss.solve_puzzle(TEST_KEYS, TEST_GRAPH))
+
+        for engine in sorted(wss.ENGINES):
+            answers, errors = run_stream([{'words': TEST_KEYS,
+                                           'grid': TEST_GRAPH}],
+                                         engine=engine)
+            assert answers[0]['results'] == expected
+
+        answers, errors = run_stream([{'words': TEST_KEYS,
+                                       'grid': TEST_GRAPH}], mode='count')
+        assert answers[0]['results'] == {'AAOA': 4, 'OOOO': 2, 'ZZZ': 0}
+
+    def test_errors_do_not_stop_the_stream(self):
+
+        answers, errors = run_stream([
+            {'grid': TEST_GRAPH},
+            'not json',
+            {'id': 'words', 'words': 'AAOA'},
+            {'id': 'bad', 'words': TEST_KEYS, 'grid': ['AB', 3]},
+            {'id': 'neither'},
+            {'grid': TEST_GRAPH}
+        ])
+
+        assert errors == 5
+        assert len(answers) == 6
+
+        # Nothing says which words to look for yet.
+        assert answers[0] == {'id': 1,
+                              'error': "No word list has been given yet."}
+        assert answers[1]['id'] is None
+        assert answers[2]['id'] is None
+        assert answers[3]['id'] == 'bad'
+        assert 'error' in answers[4]
+
+        # The puzzle which failed still counted.
+        assert answers[5]['id'] == 3
+        assert answers[5]['results']['OOOO']
+
+    def test_ragged_grids(self):
+
+        expected = as_json(wss.solve_puzzle(TEST_KEYS, TEST_GRAPH))
+
+        for engine in sorted(wss.ENGINES):
+
+            answers, errors = run_stream([
+                {'id': 'ragged', 'words': TEST_KEYS, 'grid': ['AAOA', 'O']},
+                {'id': 'square', 'grid': TEST_GRAPH}
+            ], engine=engine)
+
+            # Engines which can't solve it say so, and carry on.
+            if engine in ('bitboard', 'tiled'):
+                assert errors == 1
+                assert 'same length' in answers[0]['error']
+            else:
+                assert not errors
+                assert answers[0]['results']['AAOA'] == {'LR': [[0, 0]]}
+
+            assert answers[1] == {'id': 'square', 'results': expected}
+
+    def test_command_line(self):
+
+        lines = [json.dumps({'id': each_id, 'grid': TEST_GRAPH})
+                 for each_id in range(3)]
+
+        process = subprocess.run(
+            [sys.executable, 'word_search_solver.py', '--stream',
+             '--engine', 'lines', KEY_FILE_PATH],
+            input='\n'.join(lines) + '\n', capture_output=True, text=True)
+
+        assert process.returncode == 0
+
+        answers = [json.loads(each_line)
+                   for each_line in process.stdout.splitlines()]
+
+        assert [answer['id'] for answer in answers] == [0, 1, 2]
+
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        assert answers[0]['results'] == as_json(wss.solve_puzzle(
+            keys, TEST_GRAPH))
+
+        process = subprocess.run(
+            [sys.executable, 'word_search_solver.py', '--stream'],
+            input='not json\n', capture_output=True, text=True)
+
+        assert process.returncode == 1
+
+
+unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import word_search_solver as wss
+import line_word_search_solver as lws
+import tiled_word_search_solver as tws
+
+# os is used to remove the solution files written while testing.
+import os
+
+TEST_KEYS = ['AAOA', 'OOOO', 'AOA', 'ZZZ', 'A']
+TEST_GRAPH = [
+    'AAAO',
+    'AAOA',
+    'AOAA',
+    'OAAA'
+]
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+TEST_SOLUTION_PATH = 'test_solution_file.txt'
+TEST_TILED_SOLUTION_PATH = 'test_tiled_solution_file.txt'
+
+
+class TestTiledWordSearchSolver(unittest.TestCase):
+
+    def test_split_into_tiles(self):
+
+        tiles = tws.split_into_tiles(5, 7, 3)
+
+        assert tiles == [(0, 0, 3, 3), (0, 3, 3, 6), (0, 6, 3, 7),
+                         (3, 0, 5, 3), (3, 3, 5, 6), (3, 6, 5, 7)]
+
+        # Every tile in the grid is covered exactly once.
+        covered = [(y, x) for top, left, bottom, right in tiles
+                   for y in range(top, bottom) for x in range(left, right)]
+        assert sorted(covered) == [(y, x) for y in range(5) for x in range(7)]
+
+    def test_solve_puzzle_matches_line_solver(self):
+
+        # Tiles of one letter each, so almost every match crosses a tile.
+        result = tws.solve_puzzle(TEST_KEYS, TEST_GRAPH, engine='lines',
+                                  tile_size=1, workers=2)
+        assert result == lws.solve_puzzle(TEST_KEYS, TEST_GRAPH)
+
+        self.assertRaises(ValueError, tws.solve_puzzle, TEST_KEYS,
+                          TEST_GRAPH, engine='tiled')
+
+    def test_solution_file_is_identical(self):
+
+        solver = wss.WordSearchSolver(KEY_FILE_PATH, GRAPH_FILE_PATH,
+                                      TEST_SOLUTION_PATH)
+
+        words = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        try:
+            solver.solve_puzzle()
+
+            result = tws.solve_puzzle(words, graph, tile_size=5, workers=2)
+            wss.write_solution_to_file(result, TEST_TILED_SOLUTION_PATH)
+
+            with open(TEST_SOLUTION_PATH, 'rb') as expected_file:
+                with open(TEST_TILED_SOLUTION_PATH, 'rb') as tiled_file:
+                    assert expected_file.read() == tiled_file.read()
+
+        finally:
+            os.remove(TEST_SOLUTION_PATH)
+            os.remove(TEST_TILED_SOLUTION_PATH)
+
+
+unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import word_search_solver as wss
+import word_index as wi
+
+# os is used to remove the index files written while testing.
+import os
+
+KEY_FILE_PATH = 'word_list.txt'
+GRAPH_FILE_PATH = 'word_search.txt'
+
+TEST_INDEX_PATH = 'test_word_index.wsi'
+TEST_SOLUTION_PATH = 'test_solution_file.txt'
+
+
+class TestWordIndex(unittest.TestCase):
+
+    def tearDown(self):
+        for each_path in (TEST_INDEX_PATH, TEST_SOLUTION_PATH):
+            if os.path.exists(each_path):
+                os.remove(each_path)
+
+    def test_compile(self):
+
+        word_index = wi.WordIndex(['Disk drive', 'DISKDRIVE', 'Save, "As"',
+                                   'Disk drive', 'Zoë'])
+
+        assert word_index.words == ('Disk drive', 'DISKDRIVE', 'Save, "As"',
+                                    'Zoë')
+        assert word_index.normalized == ('DISKDRIVE', 'DISKDRIVE',
+                                         'SAVE,"AS"', 'ZOË')
+        assert list(word_index.lengths) == [9, 9, 9, 3]
+        assert word_index.spellings['DISKDRIVE'] == ('Disk drive',
+                                                     'DISKDRIVE')
+        assert word_index.longest_word == 9
+
+        assert word_index.normalize('Zoë') == 'ZOË'
+        assert word_index.normalize('not indexed') == 'NOTINDEXED'
+
+        # The automaton is only compiled once.
+        assert word_index.automaton() is word_index.automaton()
+
+    def test_save_and_load(self):
+
+        for words in ([], [''], ['Disk drive', '', 'Zoë', 'DISKDRIVE']):
+
+            word_index = wi.WordIndex(words)
+            word_index.save(TEST_INDEX_PATH)
+
+            loaded_index = wi.WordIndex.load(TEST_INDEX_PATH)
+
+            assert loaded_index.words == word_index.words
+            assert loaded_index.normalized == word_index.normalized
+            assert loaded_index.lengths == word_index.lengths
+            assert loaded_index.spellings == word_index.spellings
+
+            assert (wi.load_word_index(TEST_INDEX_PATH).words ==
+                    word_index.words)
+
+        with self.assertRaises(ValueError):
+            wi.WordIndex(['one\ntwo']).save(TEST_INDEX_PATH)
+
+        # A plain word list is compiled as it's loaded.
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        assert wi.load_word_index(KEY_FILE_PATH).words == tuple(keys)
+
+        # A truncated index isn't mistaken for a complete one.
+        wi.WordIndex(keys).save(TEST_INDEX_PATH)
+
+        with open(TEST_INDEX_PATH, 'rb') as index_file:
+            data = index_file.read()
+
+        with self.assertRaises(ValueError):
+            wi.WordIndex.from_bytes(data[:-1])
+
+        with self.assertRaises(ValueError):
+            wi.WordIndex.from_bytes(b'')
+
+    def test_solvers_share_index(self):
+
+        solver = wss.WordSearchSolver(KEY_FILE_PATH, GRAPH_FILE_PATH,
+                                      TEST_SOLUTION_PATH, no_output=True)
+        expected_results = solver.solve_puzzle()
+
+        wi.WordIndex(wss.load_list_from_text_file(KEY_FILE_PATH)).save(
+            TEST_INDEX_PATH)
+
+        word_index = wi.WordIndex.load(TEST_INDEX_PATH)
+
+        for each_engine in (None, 'aho_corasick', 'lines'):
+            solver = wss.WordSearchSolver(None, GRAPH_FILE_PATH,
+                                          TEST_SOLUTION_PATH, no_output=True,
+                                          engine=each_engine,
+                                          word_index=word_index)
+            assert solver.solve_puzzle() == expected_results
+
+        automaton = word_index.automaton()
+
+        solve = wss.compile_engine('aho_corasick', word_index)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+        assert solve(graph) == expected_results
+        assert solve.keywords['automaton'] is automaton
+
+
+unittest.main()
@@ -90,6 +90,11 @@ class TestWordSearchSolver(unittest.TestCase):
         assert len(self.test_solver.coordinates['A']) == 12
         assert len(self.test_solver.coordinates['O']) == 4
 
+        assert len(self.test_solver.letters_by_coordinate) == 16
+        assert self.test_solver.letters_by_coordinate[(0, 3)] == 'O'
+        assert self.test_solver.letters_by_coordinate[(1, 1)] == 'A'
+        assert (4, 0) not in self.test_solver.letters_by_coordinate
+
         self.real_solver.build_dictionary_of_coordinates()
         # The alphabet, minus Q and Z:
         assert len(self.real_solver.coordinates.keys()) == 24
@@ -144,6 +149,247 @@ class TestWordSearchSolver(unittest.TestCase):
         assert result['Disk drive'] == {'DUR': [(2, 17)]}
         assert result['Wireless'] == {}  # but 'WIRELESC' is {'DUR': [(3, 12)]}
 
+    def test_build_reach_table(self):
+
+        reach = wss.build_reach_table(TEST_GRAPH)
+
+        assert sorted(reach) == sorted(wss.WordSearchSolver.directions)
+
+        assert list(reach['LR'][1]) == [4, 3, 2, 1]
+        assert list(reach['RL'][1]) == [1, 2, 3, 4]
+        assert [row[2] for row in reach['U']] == [1, 2, 3, 4]
+        assert list(reach['DDR'][1]) == [3, 3, 2, 1]
+        assert list(reach['DUR'][3]) == [4, 3, 2, 1]
+
+        # Rows don't need to be the same length.
+        reach = wss.build_reach_table(['AAA', 'A', 'AA'])
+        assert list(reach['D'][0]) == [3, 1, 1]
+        assert list(reach['DDR'][1]) == [2]
+        assert list(reach['U'][2]) == [3, 1]
+
+    def test_build_ngram_index(self):
+
+        bigrams = wss.build_ngram_index(TEST_GRAPH)
+        assert bigrams == frozenset(['AA', 'AO', 'OA', 'OO'])
+
+        trigrams = wss.build_ngram_index(TEST_GRAPH, 3)
+        assert 'OOO' in trigrams
+        assert 'OAO' not in trigrams
+
+        assert wss.could_contain('AAOA', bigrams)
+        assert wss.could_contain('A', bigrams)
+        assert not wss.could_contain('AAZA', bigrams)
+        assert wss.could_contain('OAO', bigrams)
+        assert not wss.could_contain('OAO', trigrams, 3)
+
+    @uses_test_files
+    def test_find_words_with_ngram_index(self):
+
+        self.setUp()
+
+        self.test_solver.build_dictionary_of_coordinates()
+
+        assert self.test_solver.could_contain('AOA')
+        assert not self.test_solver.could_contain('AZA')
+
+        # The same index can be reused for any list of words.
+        result = self.test_solver.find_words(['AZA', 'OOOO'])
+        assert result == {'AZA': {}, 'OOOO': {'DUR': [(0, 3)],
+                                              'DDL': [(3, 0)]}}
+
+    @uses_test_files
+    def test_check_for_word_that_does_not_fit(self):
+
+        self.setUp()
+
+        self.test_solver.build_dictionary_of_coordinates()
+
+        assert self.test_solver.check_for_word_in_direction('AAAAA', 'D') == []
+        assert self.test_solver.check_for_word_in_direction('A A A', 'D') != []
+
+    @uses_test_files
+    def test_solve_puzzle_in_opposite_directions(self):
+
+        self.setUp()
+
+        result = self.test_solver.solve_puzzle()
+
+        assert result['AAOA'] == {'LR': [(0, 1)], 'RL': [(3, 2)],
+                                  'U': [(2, 3)], 'D': [(1, 0)]}
+
+        # A palindrome is found once in each of two opposite directions.
+        assert result['OOOO'] == {'DUR': [(0, 3)], 'DDL': [(3, 0)]}
+
+    def test_flip_match(self):
+
+        assert wss.flip_match((0, 1), 'LR', 4) == ((3, 1), 'RL')
+        assert wss.flip_match((1, 0), 'D', 4) == ((1, 3), 'U')
+        assert wss.flip_match((0, 0), 'DDR', 3) == ((2, 2), 'DUL')
+        assert wss.flip_match((3, 0), 'DDL', 4) == ((0, 3), 'DUR')
+
+        opposite_directions = wss.WordSearchSolver.opposite_directions
+
+        for direction, opposite in opposite_directions.items():
+            assert opposite_directions[opposite] == direction
+
+    def test_solve_puzzle_with_engine(self):
+
+        expected = self.real_solver.solve_puzzle()
+
+        for engine in sorted(wss.ENGINES):
+            solver = wss.WordSearchSolver(KEY_FILE_PATH, GRAPH_FILE_PATH,
+                                          TEST_SOLUTION_PATH, no_output=True,
+                                          engine=engine)
+            assert solver.solve_puzzle() == expected
+
+        self.assertRaises(ValueError, wss.load_engine, 'no such engine')
+
+    @uses_test_files
+    def test_iter_matches(self):
+
+        self.setUp()
+
+        matches = self.test_solver.iter_matches()
+
+        # Matches are yielded as they are found, before the search is done.
+        assert next(matches)[0] == 'AAOA'
+
+        matches = list(self.test_solver.iter_matches(['OOOO', 'ZZZ']))
+        assert sorted(matches) == [('OOOO', 'DDL', 3, 0),
+                                   ('OOOO', 'DUR', 0, 3)]
+
+    def test_stream_solution_to_file(self):
+
+        expected_path = 'test_expected_solution_file.txt'
+
+        try:
+            self.real_solver.write_solution_to_file(
+                self.real_solver.solve_puzzle())
+            os.rename(TEST_SOLUTION_PATH, expected_path)
+
+            self.real_solver.stream_solution_to_file()
+
+            assert (wss.load_list_from_text_file(TEST_SOLUTION_PATH) ==
+                    wss.load_list_from_text_file(expected_path))
+        finally:
+            os.remove(TEST_SOLUTION_PATH)
+            os.remove(expected_path)
+
+    def test_puzzle(self):
+
+        expected = self.real_solver.solve_puzzle()
+
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        graph = wss.load_list_from_text_file(GRAPH_FILE_PATH)
+
+        with open(GRAPH_FILE_PATH, 'rb') as graph_file:
+            graph_data = graph_file.read()
+
+        for each_grid in (graph, '\n'.join(graph), graph_data):
+            assert wss.Puzzle(each_grid).find_words(keys) == expected
+
+        puzzle = wss.Puzzle.from_file(GRAPH_FILE_PATH)
+
+        assert puzzle.grid == tuple(graph)
+        assert puzzle.find_word_in_direction('WIRE', 'DUR')[0] == (3, 12)
+
+        # Looking up a letter which isn't in the grid doesn't add it.
+        assert puzzle.find_word_in_direction('#', 'LR') == []
+        assert '#' not in puzzle.coordinates
+
+        with self.assertRaises(AttributeError):
+            puzzle.grid = []
+
+        with self.assertRaises(TypeError):
+            puzzle.coordinates['#'] = ()
+
+    def test_puzzle_shared_between_threads(self):
+
+        import concurrent.futures
+
+        expected = self.real_solver.solve_puzzle()
+
+        keys = wss.load_list_from_text_file(KEY_FILE_PATH)
+        puzzle = wss.Puzzle.from_file(GRAPH_FILE_PATH)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(puzzle.find_words, [keys] * 8))
+
+        for each_result in results:
+            assert each_result == expected
+
+    def test_query_modes(self):
+
+        results = self.real_solver.solve_puzzle()
+
+        counts = dict((word, sum(len(locations)
+                                 for locations in directions_found.values()))
+                      for word, directions_found in results.items())
+
+        for engine in (None, 'lines'):
+
+            solver = wss.WordSearchSolver(KEY_FILE_PATH, GRAPH_FILE_PATH,
+                                          TEST_SOLUTION_PATH, no_output=True,
+                                          engine=engine)
+
+            assert solver.solve_puzzle('count') == counts
+            assert solver.solve_puzzle('exists') == dict(
+                (word, count > 0) for word, count in counts.items())
+
+            for mode, limit in (('first', None), ('all', 1), ('all', 2)):
+
+                answers = solver.solve_puzzle(mode, limit)
+
+                assert sorted(answers) == sorted(results)
+
+                for word, directions_found in answers.items():
+
+                    matches = [(direction, location)
+                               for direction, locations
+                               in directions_found.items()
+                               for location in locations]
+
+                    assert len(matches) == min(counts[word], limit or 1)
+
+                    for direction, location in matches:
+                        assert location in results[word][direction]
+
+            assert solver.solve_puzzle('count', 1) == dict(
+                (word, min(count, 1)) for word, count in counts.items())
+
+        self.assertRaises(ValueError, self.real_solver.solve_puzzle, 'most')
+        self.assertRaises(ValueError, self.real_solver.solve_puzzle, 'all', 0)
+
+    @uses_test_files
+    def test_query_stops_early(self):
+
+        self.setUp()
+
+        self.test_solver.build_dictionary_of_coordinates()
+
+        puzzle = self.test_solver.puzzle
+
+        # Twelve As, each starting an A in every direction.
+        assert len(puzzle.find_word_in_direction('A', 'LR')) == 12
+        assert len(puzzle.find_word_in_direction('A', 'LR', limit=3)) == 3
+
+        assert puzzle.query_words(['A', 'OOOO', 'ZZZ'], 'count') == {
+            'A': 96, 'OOOO': 2, 'ZZZ': 0}
+        assert puzzle.query_words(['A'], 'all', 5)['A'] == {
+            'LR': [(0, 0), (1, 0), (2, 0), (0, 1), (1, 1)]}
+
+        # Counting agrees with the lists it doesn't make.
+        for direction in wss.WordSearchSolver.directions:
+            for word in ('A', 'AAOA', 'OOOO'):
+                assert (puzzle.count_word_in_direction(word, direction) ==
+                        len(puzzle.find_word_in_direction(word, direction)))
+
+        assert puzzle.count_word_in_direction('A', 'LR', limit=3) == 3
+        assert puzzle.query_words(['A', 'OOOO'], 'count', 50) == {
+            'A': 50, 'OOOO': 2}
+        assert wss.count_in_all_directions(
+            'OOOO', puzzle.count_word_in_direction, 1) == 1
+
     def test_write_solution_to_file(self):
 
         self.setUp()
@@ -0,0 +1,224 @@
+# Tiled Word Search Solver by Ben Friedland
+
+# The goal of this program is to solve very large word search puzzles.
+
+# Every other solver works through the whole grid in one process, which
+# leaves all but one CPU idle on a huge grid. This version cuts the grid
+# into square tiles and solves each tile in a pool of worker processes,
+# using any of the other solvers registered in word_search_solver.ENGINES.
+
+# A word starting near the edge of a tile can run into its neighbours,
+# so each worker also reads a "halo" around its tile, as wide as the
+# longest word minus one letter. Every word starting inside the tile
+# fits inside the tile plus its halo. Workers only keep the matches
+# which start inside their own tile, so matches found in the halo (which
+# belong to a neighbouring tile) are dropped rather than reported twice.
+
+# The grid is copied once into shared memory, where every worker reads
+# the rows of its tile straight out of it instead of being sent its own
+# pickled copy. This needs Python 3.8 or later, and a grid made only of
+# single-byte (Latin-1) characters.
+
+
+import word_search_solver as wss
+
+
+# Set in each worker process by start_worker, so the shared memory and
+# compiled word list are only set up once per worker, not once per tile.
+WORKER_STATE = {}
+
+
+def split_into_tiles(height, width, tile_size):
+    '''
+    Return a list of (top, left, bottom, right) tuples, one for each
+    square tile of at most tile_size by tile_size letters needed to cover
+    a grid of the given height and width. Bottom and right are exclusive.
+    '''
+
+    tiles = []
+
+    for top in range(0, height, tile_size):
+        for left in range(0, width, tile_size):
+            tiles.append((top, left,
+                          min(top + tile_size, height),
+                          min(left + tile_size, width)))
+
+    return tiles
+
+
+def start_worker(memory_name, height, width, words, engine, halo):
+    '''
+    Attach this worker process to the shared memory holding the grid
+    and compile the word list, ready for solve_tile to be called.
+    '''
+
+    from multiprocessing import shared_memory
+
+    WORKER_STATE['memory'] = shared_memory.SharedMemory(name=memory_name)
+    WORKER_STATE['shape'] = (height, width)
+    WORKER_STATE['solve'] = wss.compile_engine(engine, words)
+    WORKER_STATE['halo'] = halo
+
+
+def solve_tile(tile):
+    '''
+    Solve the (top, left, bottom, right) tile of the grid in shared
+    memory, along with its halo, and return a dictionary mapping the
+    words found to dictionaries of directions and lists of the (x, y)
+    coordinates, within the whole grid, of each match starting in the tile.
+
+    This runs inside the worker processes.
+    '''
+
+    top, left, bottom, right = tile
+
+    height, width = WORKER_STATE['shape']
+    halo = WORKER_STATE['halo']
+    buffer = WORKER_STATE['memory'].buf
+
+    # The tile and its halo, cut off at the edges of the grid:
+    region_top = max(0, top - halo)
+    region_left = max(0, left - halo)
+    region_bottom = min(height, bottom + halo)
+    region_right = min(width, right + halo)
+
+    graph = []
+
+    for y in range(region_top, region_bottom):
+        start = y * width
+        row = buffer[start + region_left:start + region_right]
+        graph.append(bytes(row).decode('latin-1'))
+
+    results = WORKER_STATE['solve'](graph)
+
+    found_words = {}
+
+    for each_word, directions_found in results.items():
+        for each_direction, locations in directions_found.items():
+            for x, y in locations:
+
+                # Move from the region's coordinates to the grid's.
+                x += region_left
+                y += region_top
+
+                # Matches starting in the halo belong to another tile.
+                if top <= y < bottom and left <= x < right:
+                    found_directions = found_words.setdefault(each_word, {})
+                    found_directions.setdefault(each_direction,
+                                                []).append((x, y))
+
+    return found_words
+
+
+def solve_puzzle(words, graph, engine='aho_corasick', tile_size=512,
+                 workers=None):
+    '''
+    Find every word in words inside graph (a list of equal-length strings)
+    by solving tiles of up to tile_size by tile_size letters with engine
+    (a key in word_search_solver.ENGINES) across a pool of worker
+    processes (defaults to one per CPU), and return the same
+    {word: {direction: [(x, y), ...]}} dictionary as the other solvers.
+    '''
+
+    import concurrent.futures
+    from multiprocessing import shared_memory
+
+    if engine == 'tiled':
+        raise ValueError("Tiles can't be solved in tiles.")
+
+    # Fail before starting any processes if the engine doesn't exist.
+    wss.load_engine(engine)
+
+    height = len(graph)
+    width = len(graph[0]) if graph else 0
+
+    try:
+        data = ''.join(graph).encode('latin-1')
+    except UnicodeEncodeError:
+        raise ValueError("Grid contains characters outside of Latin-1.")
+
+    if len(data) != height * width:
+        raise ValueError("Grid rows must all be the same length.")
+
+    # Every word starting in a tile ends within this many letters of it.
+    longest_word = max([len(wss.normalize_word(each_word))
+                        for each_word in words] or [0])
+    halo = max(0, longest_word - 1)
+
+    found_words = {}
+
+    if not data:
+        return wss.arrange_results(words, found_words)
+
+    memory = shared_memory.SharedMemory(create=True, size=len(data))
+
+    try:
+        memory.buf[:len(data)] = data
+
+        initial_arguments = (memory.name, height, width, words, engine, halo)
+
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, initializer=start_worker,
+                initargs=initial_arguments) as pool:
+
+            tiles = split_into_tiles(height, width, tile_size)
+
+            for tile_results in pool.map(solve_tile, tiles):
+                for each_word, directions_found in tile_results.items():
+                    found_directions = found_words.setdefault(each_word, {})
+                    for each_direction, locations in directions_found.items():
+                        found_directions.setdefault(each_direction,
+                                                    []).extend(locations)
+
+    finally:
+        memory.close()
+        memory.unlink()
+
+    # arrange_results also drops any repeated matches, and puts them
+    # in the same order the single-process solvers would have.
+    return wss.arrange_results(words, found_words)
+
+
+def handle_cli_arguments():
+    '''
+    Handle command line interface arguments for solving one large
+    puzzle in tiles, across several processes.
+    '''
+
+    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Solve a large word search puzzle in parallel tiles.")
+    parser.add_argument('keys', help="path to keys")
+    parser.add_argument('grid', help="path to grid")
+    parser.add_argument('solution', nargs='?', default='tiled_solution.txt',
+                        help="(optional) path to output")
+    parser.add_argument('--engine', default='aho_corasick',
+                        choices=sorted(wss.ENGINES),
+                        help="solver used for each tile")
+    parser.add_argument('--tile-size', type=int, default=512,
+                        help="height and width of each tile")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="number of worker processes (one per CPU)")
+
+    arguments = parser.parse_args()
+
+    try:
+        words = wss.load_list_from_text_file(arguments.keys)
+        graph = wss.load_list_from_text_file(arguments.grid)
+
+        results = solve_puzzle(words, graph, arguments.engine,
+                               arguments.tile_size, arguments.workers)
+
+        wss.write_solution_to_file(results, arguments.solution)
+
+    except (IOError, ValueError):
+        print("\n{}\n".format(sys.exc_info()[1]))
+        sys.exit(1)
+
+    print("{} file written.".format(arguments.solution))
+
+
+if __name__ == '__main__':
+    handle_cli_arguments()
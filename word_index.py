@@ -0,0 +1,256 @@
+# Compiled word lists for the word search solvers by Ben Friedland
+
+# Every solver starts by reading its word list and normalizing each word
+# (upper-casing it and removing any spaces) before it can search for it.
+# A WordIndex does that once: it holds the original spellings, their
+# normalized forms and lengths, and a map from each normalized form back
+# to every spelling which produced it (so 'Disk drive' can be reported
+# for DISKDRIVE). Its Aho-Corasick automaton is built the first time a
+# solver asks for it, and then kept for every later puzzle.
+
+# A WordIndex can be saved to a compact file and loaded back without
+# normalizing anything again. The file is, with every number stored
+# little-endian:
+#     4 bytes:    INDEX_MAGIC
+#     4 bytes:    the number of words, as an unsigned int
+#     4 bytes:    the length in bytes of the original words
+#     4 bytes:    the length in bytes of the normalized words
+#     per word:   the length of its normalized form, as an unsigned int
+#     the original words, encoded as UTF-8 and separated by newlines
+#     the normalized words, encoded as UTF-8 and separated by newlines
+# Loading it memory-maps the file and decodes each block of words
+# with a single call, rather than a word at a time.
+
+# The automaton itself isn't saved, since rebuilding its dictionaries
+# from a file would cost about as much as compiling the words again.
+
+
+import sys
+import array
+import mmap
+import struct
+
+import word_search_solver as wss
+
+
+INDEX_MAGIC = b'WSI1'
+
+# Word count, original words' size, normalized words' size.
+INDEX_HEADER = struct.Struct('<4sIII')
+
+
+class WordIndex(object):
+    '''
+    Create a WordIndex from a list of words. Repeated words are only
+    kept once, in the order they first appear.
+
+    Contains a words tuple of the original spellings, a matching
+    normalized tuple of the way each is searched for, an array of the
+    lengths of the normalized words, and a spellings dictionary mapping
+    each normalized word to a tuple of the original words which produced it.
+    '''
+
+    def __init__(self, words, normalized=None, lengths=None):
+
+        # dict keeps the first of any repeated words, in order.
+        self.words = tuple(dict.fromkeys(words))
+
+        # Loading a saved index passes these in, since they are
+        # already known and don't need to be worked out again.
+        if normalized is None:
+            normalized = [wss.normalize_word(each_word)
+                          for each_word in self.words]
+
+        if lengths is None:
+            lengths = array.array('I', [len(each_normalized_word)
+                                        for each_normalized_word
+                                        in normalized])
+
+        self.normalized = tuple(normalized)
+        self.lengths = lengths
+
+        if not len(self.words) == len(self.normalized) == len(self.lengths):
+            raise ValueError("Every word needs one normalized form"
+                             " and one length.")
+
+        spellings = {}
+
+        for each_word, each_normalized_word in zip(self.words,
+                                                   self.normalized):
+            spellings.setdefault(each_normalized_word, []).append(each_word)
+
+        self.spellings = dict((normalized_word, tuple(original_words))
+                              for normalized_word, original_words
+                              in spellings.items())
+
+        self.normalized_by_word = dict(zip(self.words, self.normalized))
+
+        self.longest_word = max(self.lengths) if self.lengths else 0
+
+        self.compiled_automaton = None
+
+    def __len__(self):
+        return len(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def normalize(self, word):
+        '''
+        Return the normalized form of word, without
+        normalizing it again if it is in this index.
+        '''
+
+        normalized_word = self.normalized_by_word.get(word)
+
+        if normalized_word is None:
+            normalized_word = wss.normalize_word(word)
+
+        return normalized_word
+
+    def automaton(self):
+        '''
+        Return an Aho-Corasick automaton of every word in this index,
+        compiling it the first time it is asked for.
+        '''
+
+        if self.compiled_automaton is None:
+            import aho_corasick_word_search_solver as acws
+            self.compiled_automaton = acws.Automaton(self.words)
+
+        return self.compiled_automaton
+
+    def save(self, index_path):
+        '''
+        Write this index to the file at index_path, in the format
+        described at the top of this module.
+        '''
+
+        if any('\n' in each_word for each_word in self.words):
+            raise ValueError("Words can't contain line breaks.")
+
+        original_data = '\n'.join(self.words).encode('utf-8')
+        normalized_data = '\n'.join(self.normalized).encode('utf-8')
+
+        lengths = array.array('I', self.lengths)
+
+        if sys.byteorder == 'big':
+            lengths.byteswap()
+
+        with open(index_path, 'wb') as index_file:
+            index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, len(self.words),
+                                               len(original_data),
+                                               len(normalized_data)))
+            index_file.write(lengths.tobytes())
+            index_file.write(original_data)
+            index_file.write(normalized_data)
+
+    @classmethod
+    def load(cls, index_path):
+        '''
+        Load an index written by save from the file at index_path.
+        '''
+
+        with open(index_path, 'rb') as index_file:
+
+            try:
+                mapping = mmap.mmap(index_file.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
+            except ValueError:
+                # An empty file can't be mapped.
+                mapping = b''
+
+            try:
+                return cls.from_bytes(mapping, index_path)
+            finally:
+                if isinstance(mapping, mmap.mmap):
+                    mapping.close()
+
+    @classmethod
+    def from_bytes(cls, data, index_path='data'):
+        '''
+        Load an index from data, the contents of a file written by save.
+        '''
+
+        if len(data) < INDEX_HEADER.size:
+            raise ValueError("{} is not a word index.".format(index_path))
+
+        magic, word_count, original_size, normalized_size = (
+            INDEX_HEADER.unpack_from(data))
+
+        lengths_size = word_count * 4
+
+        if (magic != INDEX_MAGIC or len(data) != INDEX_HEADER.size +
+                lengths_size + original_size + normalized_size):
+            raise ValueError("{} is not a word index.".format(index_path))
+
+        offset = INDEX_HEADER.size
+
+        lengths = array.array('I')
+        lengths.frombytes(data[offset:offset + lengths_size])
+
+        if sys.byteorder == 'big':
+            lengths.byteswap()
+
+        offset += lengths_size
+
+        original_data = data[offset:offset + original_size]
+        offset += original_size
+        normalized_data = data[offset:offset + normalized_size]
+
+        # Splitting an empty string gives one empty word, not none.
+        if word_count:
+            words = original_data.decode('utf-8').split('\n')
+            normalized = normalized_data.decode('utf-8').split('\n')
+        else:
+            words = []
+            normalized = []
+
+        return cls(words, normalized, lengths)
+
+
+def load_word_index(key_path):
+    '''
+    Return a WordIndex of the words at key_path, which may be either a
+    saved index or a plain word list with one word on each line.
+    '''
+
+    with open(key_path, 'rb') as key_file:
+        is_index = key_file.read(len(INDEX_MAGIC)) == INDEX_MAGIC
+
+    if is_index:
+        return WordIndex.load(key_path)
+
+    return WordIndex(wss.load_list_from_text_file(key_path))
+
+
+def handle_cli_arguments():
+    '''
+    Handle command line interface arguments for compiling
+    a word list into a saved index.
+    '''
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Compile a word list into a word index file.")
+    parser.add_argument('keys', help="path to keys")
+    parser.add_argument('index', nargs='?', default='word_list.wsi',
+                        help="(optional) path to output")
+
+    arguments = parser.parse_args()
+
+    try:
+        word_index = WordIndex(wss.load_list_from_text_file(arguments.keys))
+        word_index.save(arguments.index)
+
+    except (IOError, ValueError):
+        print("\n{}\n".format(sys.exc_info()[1]))
+        sys.exit(1)
+
+    print("{} file written, indexing {} words.".format(arguments.index,
+                                                       len(word_index)))
+
+
+if __name__ == '__main__':
+    handle_cli_arguments()
@@ -71,6 +71,9 @@
 
 import os
 import sys
+import array
+import types
+import itertools
 import collections
 
 
@@ -80,8 +83,30 @@ class WordSearchSolver(object):  # Subclassing object is a Py2 best practice.
     grid_file_path, accepting an optional no_output boolean to disable
     writing the solution to a file if True (defaults to False).
 
+    An optional ngram_length (defaults to 2) sets the length of the runs
+    of letters stored in the ngram_index used to skip words which can't
+    be in the grid.
+
+    An optional engine may be given to hand the search off to one of the
+    other solvers, either by name (any key in the ENGINES dictionary) or
+    as a solve_puzzle(words, graph) function. By default, the puzzle is
+    solved using this class's dictionary of letter coordinates.
+
+    An optional cache (a solution_cache.SolutionCache) lets solve_puzzle
+    return a solution saved by an earlier run instead of solving again.
+
+    An optional word_index (a word_index.WordIndex) is used instead of
+    reading and normalizing the words at key_path, which may then be None,
+    so one compiled word list can be shared by any number of solvers.
+
+    If collect_stats is True (defaults to False), each call to solve_puzzle
+    leaves a solve_stats.SolveStats in the stats attribute, recording how
+    long each phase of solving took and how much searching each word took.
+
     Contains a class attribute named directions, which contains
-    a dictionary mapping direction code strings to step increments.
+    a dictionary mapping direction code strings to step increments,
+    and another named opposite_directions, which maps each direction
+    code to the code for the direction pointing the opposite way.
     '''
 
     # Directions are stored as (dy, dx) tuples in a class attribute.
@@ -98,19 +123,48 @@ class WordSearchSolver(object):  # Subclassing object is a Py2 best practice.
         'DDR': (1,   1)   # Diagonal down right
     }
 
-    def __init__(self, key_path, grid_path, solution_path, no_output=False):
+    # A word read backwards in one direction is the same word read
+    # forwards in the opposite direction, starting from its other end.
+    # So searching for each word and its reversal in only the four
+    # canonical directions finds every match in all eight.
+    canonical_directions = ('LR', 'D', 'DDR', 'DDL')
+
+    opposite_directions = {
+        'LR':  'RL',
+        'RL':  'LR',
+        'U':   'D',
+        'D':   'U',
+        'DUL': 'DDR',
+        'DUR': 'DDL',
+        'DDL': 'DUR',
+        'DDR': 'DUL'
+    }
+
+    def __init__(self, key_path, grid_path, solution_path, no_output=False,
+                 engine=None, ngram_length=2, cache=None, word_index=None,
+                 collect_stats=False):
 
         self.key_file_path = key_path
         self.grid_file_path = grid_path
         self.solution_file_path = solution_path
         self.no_output = no_output
+        self.engine = engine
+        self.ngram_length = ngram_length
+        self.cache = cache
+        self.word_index = word_index
+        self.collect_stats = collect_stats
 
         # Instance state variables, to hold the results of calling
         # build_dictionary_of_coordinates and load_list_from_text_file
         # during the execution of solve_puzzle.
         self.coordinates = {}
+        self.letters_by_coordinate = {}
+        self.reach = {}
+        self.ngram_index = frozenset()
         self.keys = []
         self.grid = []
+        self.puzzle = None
+        self.stats = None
 
     def build_dictionary_of_coordinates(self):
         '''
@@ -123,151 +177,244 @@ class WordSearchSolver(object):  # Subclassing object is a Py2 best practice.
         any type of element that supports the equality operator
         and assignment as a dictionary key. It also works for
         arbitrary lengths of both top-level lists and sub-lists.
-        '''
 
-        self.coordinates = collections.defaultdict(list)
+        The work is done by compiling a Puzzle, which is kept in this
+        WordSearchSolver instance's puzzle attribute. The grid already
+        loaded by solve_puzzle is used rather than reading it again.
+        '''
 
-        grid = load_list_from_text_file(self.grid_file_path)
+        if not self.grid:
+            self.grid = load_list_from_text_file(self.grid_file_path)
 
-        for y_coordinate, each_row in enumerate(grid):
-            for x_coordinate, each_column in enumerate(each_row):
-                key = grid[y_coordinate][x_coordinate]
+        self.puzzle = Puzzle(self.grid, self.ngram_length)
 
-                # Using a tuple implies the data is immutable.
-                coords = (y_coordinate, x_coordinate)
-                self.coordinates[key].append(coords)
+        # The Puzzle's lookup tables, kept here as well
+        # for code which used them before Puzzles existed.
+        self.coordinates = self.puzzle.coordinates
+        self.letters_by_coordinate = self.puzzle.letters_by_coordinate
+        self.reach = self.puzzle.reach
+        self.ngram_index = self.puzzle.ngram_index
 
     def check_for_word_in_direction(self, word, direction):
         '''
-        Uses this WordSearchSolver instance's coordinates dictionary
-        to check every occurrence of the first letter in the word in the
-        dictionary for matching subsequent letters in the word in the
-        dictionary in the supplied direction.
+        Uses this WordSearchSolver instance's puzzle to find every
+        location the word starts at in the supplied direction.
+        See Puzzle.find_word_in_direction.
+        '''
 
-        The word parameter must be a string, and the direction parameter
-        must be a key in the WordSearchSolver.directions dictionary.
+        return self.puzzle.find_word_in_direction(word, direction)
+
+    def solve_puzzle(self, mode='all', limit=None, stats=None):
         '''
+        Solve the word search puzzle found at this WordSearchSolver
+        instance's grid_file_path and key_file_path by building
+        a dictionary of letter coordinates and and finding words
+        with it. Faster than iterating over every tile for every
+        new word.
 
-        dy, dx = WordSearchSolver.directions[direction]
+        An optional mode (a key in QUERY_MODES) and limit ask a cheaper
+        question about each word instead, such as whether it is in the
+        grid at all, and return the answers as summarize_results does.
+        The dictionary of coordinates stops searching for each word as
+        soon as it has the answer, while other engines solve the whole
+        puzzle and then summarize it.
 
-        # We care about the first letter because words aren't supposed to
-        # change direction after we've started finding matching letters.
-        first_letter = word[0]
+        If this WordSearchSolver instance's no_output tag is
+        False (defaults to False), the output will be passed
+        to the write_solution_to_file function.
 
-        locations_for_first_letter = self.coordinates[first_letter]
+        If this WordSearchSolver instance has a cache, a solution already
+        in it is returned without solving anything (and so without
+        building the dictionary of coordinates), and a new solution
+        is added to it. Answers to cheaper questions aren't added,
+        since they aren't whole solutions.
+
+        If stats (a solve_stats.SolveStats) is given, or this
+        WordSearchSolver instance's collect_stats is True, the time taken
+        to load, index, search, cache and write is recorded in stats (or
+        a new SolveStats), along with the cost of searching for each word
+        when finding every match with the dictionary of coordinates. It
+        is kept in this instance's stats attribute either way.
+        '''
 
-        results_list = []
+        # Fail before loading anything if the query makes no sense.
+        partial_query = not (query_limit(mode, limit) is None and
+                             mode == 'all')
 
-        # We need to check each instance of the first letter, so
-        # iterate over all the locations where that letter can be found:
-        for each_location in locations_for_first_letter:
+        if stats is None and self.collect_stats:
+            import solve_stats
+            stats = solve_stats.SolveStats()
 
-            y, x = initial_y, initial_x = each_location
+        self.stats = stats
 
-            letters_match = True
+        with time_phase(stats, 'load'):
+            # Because Python allows me to treat strings as lists,
+            # a depth-one list is all we need to model this grid.
+            self.grid = load_list_from_text_file(self.grid_file_path)
+            self.keys = self.load_keys()
 
-            # Next, for each letter (including the first), retrieve
-            # a list of all coordinates where that letter can be found
-            # and see if the current letter were're looking at's location
-            # matches up with the expected location:
-            for each_letter in word:
+        found_words = None
 
-                if letters_match is True:
+        if self.cache is not None:
+            with time_phase(stats, 'cache'):
+                found_words = self.cache.get(self.keys, self.grid,
+                                             self.engine)
 
-                    # A space isn't a letter.
-                    # While there are some "words" with spaces
-                    # in them in the WordList.txt file, there
-                    # are none in the WordSearch.txt file.
-                    # This program will assume words with spaces in
-                    # the WordList.txt file are included in the
-                    # WordSearch.txt file with spaces removed.
-                    if each_letter == ' ':
-                        continue
+        if found_words is not None:
+            found_words = summarize_results(found_words, mode, limit)
 
-                    letter_as_key = each_letter.upper()
+        elif self.engine is None and partial_query:
+            with time_phase(stats, 'index'):
+                self.build_dictionary_of_coordinates()
+            with time_phase(stats, 'search'):
+                found_words = self.puzzle.query_words(self.keys, mode, limit,
+                                                      self.normalize)
 
-                    all_coords_of_this_letter = self.coordinates[letter_as_key]
+        else:
+            if self.engine is not None:
+                with time_phase(stats, 'search'):
+                    found_words = self.solve_puzzle_with_engine()
+            else:
+                with time_phase(stats, 'index'):
+                    self.build_dictionary_of_coordinates()
+                with time_phase(stats, 'search'):
+                    found_words = self.find_words(self.keys, stats)
 
-                    # The following will iterate over every letter
-                    # coordinate, which is actually not as good as
-                    # checking the letters in each direction around
-                    # the first letter (which still benefits from
-                    # using a lookup table) and verifying letters by
-                    # directly checking list indices in the grid rather
-                    # than the lookup table. But that would take more
-                    # time to implement, and this is already pretty fast.
-                    if (y, x) in all_coords_of_this_letter:
-                        # If a match has been found, take
-                        # another step in this direction:
-                        y += dy
-                        x += dx
+            if self.cache is not None:
+                with time_phase(stats, 'cache'):
+                    self.cache.put(self.keys, self.grid, self.engine,
+                                   found_words)
 
-                        # Note that, because we're not checking grid
-                        # indices but instead looking for tuple presence
-                        # in a dictionary, there will never be an IndexError
-                        # due to iterating outside the grid's boundaries.
+            found_words = summarize_results(found_words, mode, limit)
 
-                    else:
-                        letters_match = False
+        if self.no_output is False:
+            with time_phase(stats, 'write'):
+                if mode in ('exists', 'count'):
+                    write_summary_to_file(found_words,
+                                          self.solution_file_path)
+                else:
+                    self.write_solution_to_file(found_words)
 
-            if letters_match is True:
+        return found_words
+
+    def find_words(self, words, stats=None):
+        '''
+        Find every word in words using this WordSearchSolver instance's
+        dictionary of coordinates, and return the same results dictionary
+        as solve_puzzle, recording the cost of each word in stats (a
+        solve_stats.SolveStats) if one is given.
+
+        Once build_dictionary_of_coordinates has been called (which
+        solve_puzzle does), this may be called with any number of
+        word lists without reloading the grid.
+        '''
+
+        return self.puzzle.find_words(words, self.normalize, stats)
 
-                # The (x, y) ordering is intentional for readability.
-                word_location = (initial_x, initial_y)
+    def load_keys(self):
+        '''
+        Return the list of words in this WordSearchSolver
+        instance's word_index, or at its key_file_path if it
+        has no word_index.
+        '''
 
-                results_list.append(word_location)
+        if self.word_index is not None:
+            return list(self.word_index.words)
 
-        return results_list
+        return load_list_from_text_file(self.key_file_path)
 
-    def solve_puzzle(self):
+    def normalize(self, word):
+        '''
+        Return word normalized the way normalize_word does, using
+        the form already in this WordSearchSolver instance's
+        word_index if it has one.
         '''
-        Solve the word search puzzle found at this WordSearchSolver
-        instance's grid_file_path and key_file_path by building
-        a dictionary of letter coordinates and and finding words
-        with it. Faster than iterating over every tile for every
-        new word.
 
-        If this WordSearchSolver instance's no_output tag is
-        False (defaults to False), the output will be passed
-        to the write_solution_to_file function.
+        if self.word_index is not None:
+            return self.word_index.normalize(word)
+
+        return normalize_word(word)
+
+    def could_contain(self, word):
+        '''
+        Return False if the normalized word can't be in this
+        WordSearchSolver instance's grid because some run of
+        ngram_length letters in it is never found in a line
+        in the grid, or True if the word might be there.
+        '''
+
+        return self.puzzle.could_contain(word)
+
+    def iter_matches(self, words=None):
+        '''
+        Solve the word search puzzle like solve_puzzle does, but yield
+        a (word, direction, x, y) tuple for each match as it is found,
+        rather than returning them all at once when every word is done.
+
+        words defaults to the keys in this instance's key_file_path. The
+        matches for each word are yielded together, a word at a time, in
+        the order of words, and words which aren't found yield nothing.
+
+        Only the default dictionary of coordinates yields matches while
+        searching. Other engines solve the puzzle first.
         '''
 
-        # Because Python allows me to treat strings as lists,
-        # a depth-one list is all we need to model this grid.
         self.grid = load_list_from_text_file(self.grid_file_path)
-        self.keys = load_list_from_text_file(self.key_file_path)
+        self.keys = self.load_keys()
+
+        if words is None:
+            words = self.keys
+
+        seen_words = set()
+
+        if self.engine is not None:
+            results = self.solve_puzzle_with_engine(words)
+
+            for word in words:
+                if word not in seen_words:
+                    seen_words.add(word)
+                    for direction, locations in results[word].items():
+                        for x, y in locations:
+                            yield word, direction, x, y
+
+            return
 
         self.build_dictionary_of_coordinates()
 
-        # Subdicts for directions, since one word could conceivably
-        # have multiple directions and/or locations.
-        found_words = collections.defaultdict(dict)
+        for match in self.puzzle.iter_matches(words, self.normalize):
+            yield match
 
-        for word in self.keys:
+    def stream_solution_to_file(self):
+        '''
+        Solve the word search puzzle and write the same solution file as
+        solve_puzzle, a word at a time as each is found, without building
+        the whole results dictionary.
+        '''
 
-            # Using collections.defaultdict this waymeans that keys
-            # that are not found in the graph are not actually given
-            # their own empty directions sub-dictionary, which is
-            # important for demonstrating that a key was not found
-            # in the graph. This flag is used to compensate.
-            found_this_word = False
+        words = sorted(set(self.load_keys()))
 
-            for direction in WordSearchSolver.directions.keys():
+        write_matches_to_file(self.iter_matches(words), words,
+                              self.solution_file_path)
 
-                results = self.check_for_word_in_direction(word, direction)
+    def solve_puzzle_with_engine(self, words=None):
+        '''
+        Solve the already-loaded grid for words (defaults to the loaded
+        keys) with this WordSearchSolver instance's engine, rather than
+        its dictionary of coordinates.
+        '''
 
-                if results:
-                    # {'LCD': {D: [(1, 0) ...] ...}, }
-                    found_words[word][direction] = results
-                    found_this_word = True
+        if words is None:
+            words = self.keys
 
-            if found_this_word is False:
-                found_words[word] = {}
+        if callable(self.engine):
+            return self.engine(words, self.grid)
 
-        if self.no_output is False:
-            self.write_solution_to_file(found_words)
+        # Solving for the whole word index lets the engine reuse
+        # the work already done on it, such as its automaton.
+        if self.word_index is not None and words is self.keys:
+            return compile_engine(self.engine, self.word_index)(self.grid)
 
-        return found_words
+        return load_engine(self.engine)(words, self.grid)
 
     def write_solution_to_file(self, results):
         '''
@@ -275,37 +422,960 @@ class WordSearchSolver(object):  # Subclassing object is a Py2 best practice.
         to a text file, with pretty printing.
         '''
 
-        explanation = ('\nFormat of this file:'
-                       '\n\nEach word found:'
-                       '\n    Each direction the word was found in:'
-                       '\n        (X, Y) coordinates of first letter in the word.'
-                       '\n\n')
+        write_solution_to_file(results, self.solution_file_path)
+
+
+class Puzzle(object):
+    '''
+    Create a Puzzle from a word search grid: a list of strings with one
+    string per row, or a single string or bytes object with one row per
+    line. An optional ngram_length (defaults to 2) is used as it is by
+    WordSearchSolver.
+
+    A Puzzle builds the same lookup tables as a WordSearchSolver (its
+    coordinates, letters_by_coordinate, reach and ngram_index) once, when
+    it is created, and can then be searched for any number of word lists.
+    Nothing about a Puzzle changes after it is created, and searching it
+    has no side effects, so one Puzzle can be searched by any number of
+    threads at once without locking.
+    '''
+
+    __slots__ = ('grid', 'ngram_length', 'coordinates',
+                 'letters_by_coordinate', 'reach', 'ngram_index')
+
+    def __init__(self, grid, ngram_length=2):
+
+        if isinstance(grid, bytes):
+            grid = grid.decode('utf-8')
+
+        if isinstance(grid, str):
+            grid = grid.splitlines()
+
+        grid = tuple(grid)
+
+        coordinates = collections.defaultdict(list)
+
+        # The reverse of the coordinates dictionary: every (y, x) tuple
+        # maps to the letter found there. Probing a tuple in here costs
+        # the same no matter how large the grid or how common the letter,
+        # unlike scanning the list of coordinates filed under that letter.
+        letters_by_coordinate = {}
+
+        for y_coordinate, each_row in enumerate(grid):
+            for x_coordinate, key in enumerate(each_row):
+
+                # Using a tuple implies the data is immutable.
+                coords = (y_coordinate, x_coordinate)
+                coordinates[key].append(coords)
+                letters_by_coordinate[coords] = key
+
+        # How far each tile is from the edge of the grid in each
+        # direction, so words which can't fit are never probed for.
+        reach = build_reach_table(grid)
+
+        # Read-only views, so no thread can change
+        # the tables out from under another.
+        set_attribute = object.__setattr__
+
+        set_attribute(self, 'grid', grid)
+        set_attribute(self, 'ngram_length', ngram_length)
+        set_attribute(self, 'coordinates', types.MappingProxyType(dict(
+            (letter, tuple(locations))
+            for letter, locations in coordinates.items())))
+        set_attribute(self, 'letters_by_coordinate',
+                      types.MappingProxyType(letters_by_coordinate))
+        set_attribute(self, 'reach', types.MappingProxyType(dict(
+            (direction, tuple(rows)) for direction, rows in reach.items())))
+
+        # Every run of letters found in a line in the grid, so words
+        # which can't possibly be in it are rejected without probing.
+        set_attribute(self, 'ngram_index',
+                      build_ngram_index(grid, ngram_length))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Puzzles can't be changed once created.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Puzzles can't be changed once created.")
+
+    @classmethod
+    def from_file(cls, grid_path, ngram_length=2):
+        '''
+        Create a Puzzle from the grid file at grid_path.
+        '''
+
+        return cls(load_list_from_text_file(grid_path), ngram_length)
+
+    def find_word_in_direction(self, word, direction, limit=None,
+                               counts=None):
+        '''
+        Uses this Puzzle's coordinates dictionary to check every
+        occurrence of the first letter in the word in the dictionary
+        for matching subsequent letters in the word in the dictionary
+        in the supplied direction, and return a list of the (x, y)
+        coordinates of every match, or of only the first limit matches
+        if limit is given.
+
+        The word parameter must be a string, and the direction parameter
+        must be a key in the WordSearchSolver.directions dictionary.
+
+        If counts (a solve_stats.ProbeCounts) is given, the work done is
+        added to it. See iter_word_in_direction.
+        '''
+
+        return list(itertools.islice(
+            self.iter_word_in_direction(word, direction, counts), limit))
+
+    def count_word_in_direction(self, word, direction, limit=None):
+        '''
+        Return the number of matches find_word_in_direction would find
+        (no more than limit, if it is given), without making a list of
+        their coordinates.
+        '''
+
+        return sum(1 for _ in itertools.islice(
+            self.iter_word_in_direction(word, direction), limit))
+
+    def iter_word_in_direction(self, word, direction, counts=None):
+        '''
+        Yield the (x, y) coordinates of every match of word in direction
+        as it is found (see find_word_in_direction), searching no further
+        than the matches are read. See iter_word_locations, which does
+        the searching, for what is added to counts if it is given.
+        '''
+
+        return iter_word_locations(word, direction, self.coordinates,
+                                   self.letters_by_coordinate,
+                                   self.reach[direction], counts)
+
+    def could_contain(self, word):
+        '''
+        Return False if the normalized word can't be in this Puzzle's
+        grid because some run of ngram_length letters in it is never
+        found in a line in the grid, or True if the word might be there.
+        '''
+
+        return could_contain(word, self.ngram_index, self.ngram_length)
+
+    def find_words(self, words, normalize=None, stats=None):
+        '''
+        Find every word in words, and return the same results dictionary
+        as WordSearchSolver.solve_puzzle. Words are normalized with the
+        normalize function, which defaults to normalize_word.
+
+        If stats (a solve_stats.SolveStats) is given, the time, starts
+        and probes each word takes are recorded in it.
+        '''
+
+        if normalize is None:
+            normalize = normalize_word
+
+        # Subdicts for directions, since one word could conceivably
+        # have multiple directions and/or locations.
+        found_words = {}
+
+        for word in words:
+
+            target = normalize(word)
+
+            # An empty word has no first letter to look up, and a word
+            # containing letters which are never next to each other in
+            # the grid can't be in it, so there's no need to look.
+            if not target or not self.could_contain(target):
+                continue
+
+            # Counting is kept out of find_word_in_direction,
+            # so it costs nothing unless it was asked for.
+            if stats is not None:
+                found_words[word] = stats.find_word(self, word, target)
+            else:
+                found_words[word] = find_in_all_directions(
+                    target, self.find_word_in_direction)
+
+        # Using arrange_results means that keys that are not found in
+        # the graph are given their own empty directions sub-dictionary,
+        # which is important for demonstrating that a key was not found,
+        # and puts the flipped matches back in the usual order.
+        return arrange_results(words, found_words)
+
+    def query_words(self, words, mode='all', limit=None, normalize=None):
+        '''
+        Answer a query (see QUERY_MODES) about every word in words, and
+        return the same dictionary summarize_results would make from the
+        results of find_words, but stopping each word's search as soon as
+        the answer is known. Counting matches never makes lists of them.
+        '''
+
+        limit = query_limit(mode, limit)
+
+        if mode == 'all' and limit is None:
+            return self.find_words(words, normalize)
+
+        if mode == 'count':
+            return self.count_words(words, limit, normalize)
+
+        answers = {}
+
+        for word, matches in self.iter_word_matches(words, limit, normalize):
+
+            if limit is not None:
+                matches = itertools.islice(matches, limit)
+
+            if mode == 'exists':
+                answers[word] = next(matches, None) is not None
+
+            else:
+                directions_found = answers.setdefault(word, {})
+
+                for direction, location in matches:
+                    directions_found.setdefault(direction,
+                                                []).append(location)
+
+        if mode == 'exists':
+            return answers
+
+        return arrange_results(words, answers)
+
+    def count_words(self, words, limit=None, normalize=None):
+        '''
+        Return a dictionary mapping every word in words to the number of
+        times it is found (no more than limit, if it is given), counting
+        the matches as they're found rather than listing them.
+        '''
+
+        if normalize is None:
+            normalize = normalize_word
+
+        counts = {}
+
+        for word in words:
+
+            target = normalize(word)
+
+            if not target or not self.could_contain(target):
+                counts[word] = 0
+            else:
+                counts[word] = count_in_all_directions(
+                    target, self.count_word_in_direction, limit)
+
+        return counts
+
+    def iter_word_matches(self, words, limit=None, normalize=None):
+        '''
+        Yield a (word, matches) tuple for every word in words, where
+        matches lazily yields the (direction, (x, y)) tuples for each
+        match of the word, and searches no further than it is read.
+        '''
+
+        import functools
+
+        if normalize is None:
+            normalize = normalize_word
+
+        find = self.find_word_in_direction
+
+        if limit is not None:
+            find = functools.partial(find, limit=limit)
+
+        for word in words:
+
+            target = normalize(word)
+
+            if not target or not self.could_contain(target):
+                yield word, iter(())
+            else:
+                yield word, iter_in_all_directions(target, find)
+
+    def iter_matches(self, words, normalize=None):
+        '''
+        Yield a (word, direction, x, y) tuple for each match of each word
+        in words as it is found, a word at a time. Repeated words are only
+        searched for once. See find_words.
+        '''
+
+        if normalize is None:
+            normalize = normalize_word
+
+        seen_words = set()
+
+        for word in words:
+
+            target = normalize(word)
+
+            if word in seen_words or not target:
+                continue
+
+            seen_words.add(word)
+
+            if not self.could_contain(target):
+                continue
+
+            for direction, (x, y) in iter_in_all_directions(
+                    target, self.find_word_in_direction):
+                yield word, direction, x, y
+
+
+# Other solvers WordSearchSolver can hand a puzzle off to, by name.
+# Each is a module with a solve_puzzle(words, graph) function returning
+# the same results dictionary as WordSearchSolver.solve_puzzle, and is
+# only imported once it has been selected. 'coordinates' is this module's
+# own dictionary of coordinates, and 'auto' picks whichever of the others
+# is expected to be fastest for each puzzle (see engine_selection).
+ENGINES = {
+    'coordinates': 'word_search_solver',
+    'auto': 'engine_selection',
+    'simple': 'simple_word_search_solver',
+    'lines': 'line_word_search_solver',
+    'aho_corasick': 'aho_corasick_word_search_solver',
+    'numpy': 'numpy_word_search_solver',
+    'bitboard': 'bitboard_word_search_solver',
+    'tiled': 'tiled_word_search_solver'
+}
+
+
+def solve_puzzle(words, graph, stats=None):
+    '''
+    Find every word in words inside graph (a list of strings) using
+    a Puzzle's dictionary of coordinates, and return the same
+    {word: {direction: [(x, y), ...]}} dictionary as the other solvers.
+
+    If stats (a solve_stats.SolveStats) is given, the time taken to
+    build the Puzzle and to search it, and the cost of searching for
+    each word, are recorded in it.
+    '''
+
+    with time_phase(stats, 'index'):
+        puzzle = Puzzle(graph)
+
+    with time_phase(stats, 'search'):
+        return puzzle.find_words(words, stats=stats)
+
+
+def time_phase(stats, name):
+    '''
+    Return a context manager which adds the time spent inside it to the
+    phase called name in stats (a solve_stats.SolveStats), or which does
+    nothing if stats is None.
+    '''
+
+    import contextlib
+
+    if stats is None:
+        return contextlib.nullcontext()
+
+    return stats.time_phase(name)
+
+
+def load_engine(name):
+    '''
+    Import the solver registered under name in the ENGINES dictionary
+    and return its solve_puzzle function.
+    '''
+
+    import importlib
+
+    if name not in ENGINES:
+        raise ValueError("Unknown engine '{}'. Choose one of: {}".format(
+            name, ', '.join(sorted(ENGINES))))
+
+    return importlib.import_module(ENGINES[name]).solve_puzzle
+
+
+def compile_engine(name, words, stats=None):
+    '''
+    Return a function which takes a graph and solves it for words with
+    the engine registered under name in the ENGINES dictionary.
+
+    Any work the engine can do on the word list ahead of time (such as
+    building an Aho-Corasick automaton) is done once, here, so the
+    returned function can be reused for any number of graphs.
+
+    words may also be a word_index.WordIndex, in which case any of that
+    work it has already done (or does now) is kept in the index.
+
+    If stats (a solve_stats.SolveStats) is given, the time spent
+    compiling, and then solving every graph, is added to it. The
+    dictionary of coordinates also records how long it spends building
+    each Puzzle, and the cost of searching for each word.
+    '''
+
+    import functools
 
-        with open(self.solution_file_path, 'w+') as solution_file:
+    import word_index
 
-            solution_file.write(explanation)
+    solve_puzzle = load_engine(name)
 
-            sorted_keys = sorted(results)
+    compiled_words = None
 
-            for each_key in sorted_keys:
+    if isinstance(words, word_index.WordIndex):
+        compiled_words = words
+        words = list(words.words)
 
-                solution_file.write('\n\n{}:'.format(each_key))
+    if name == 'coordinates':
+        return functools.partial(solve_puzzle, words, stats=stats)
 
-                if not results[each_key]:
-                        solution_file.write('\n    Not found.'.format(each_key))
+    if name == 'aho_corasick':
+        import aho_corasick_word_search_solver as acws
 
-                for each_direction in results[each_key].keys():
+        with time_phase(stats, 'compile'):
+            if compiled_words is not None:
+                automaton = compiled_words.automaton()
+            else:
+                automaton = acws.Automaton(words)
 
-                    solution_file.write('\n    {}:'.format(each_direction))
+        solve_puzzle = functools.partial(solve_puzzle, automaton=automaton)
 
-                    for each_result in results[each_key][each_direction]:
+    if stats is None:
+        return functools.partial(solve_puzzle, words)
 
-                        x = each_result[0]
-                        y = each_result[1]
+    return functools.partial(solve_and_time_puzzle, solve_puzzle, words,
+                             stats=stats)
 
-                        solution_file.write('\n        ({}, {})'.format(x, y))
 
-            solution_file.write('\n')
+def solve_and_time_puzzle(solve_puzzle, words, graph, stats):
+    '''
+    Return solve_puzzle(words, graph), adding the time it took to the
+    'search' phase in stats (a solve_stats.SolveStats).
+    '''
+
+    with time_phase(stats, 'search'):
+        return solve_puzzle(words, graph)
+
+
+# Every kind of question solve_puzzle can answer about each word:
+# 'all'     every match, as {direction: [(x, y), ...]}
+# 'first'   a single match, in the same form
+# 'exists'  True if the word is in the grid, or False
+# 'count'   the number of matches, without building any lists of them
+# Any of them can be given a limit, to stop after that many matches.
+QUERY_MODES = ('all', 'first', 'exists', 'count')
+
+
+def query_limit(mode, limit=None):
+    '''
+    Return the most matches for each word a query in mode (a key in
+    QUERY_MODES) needs, given its limit, or None if there's no limit.
+    '''
+
+    if mode not in QUERY_MODES:
+        raise ValueError("Unknown query mode '{}'. Choose one of: {}".format(
+            mode, ', '.join(QUERY_MODES)))
+
+    if limit is not None and limit < 1:
+        raise ValueError("A query's limit must be at least 1.")
+
+    if mode in ('first', 'exists'):
+        return 1
+
+    return limit
+
+
+def summarize_results(results, mode='all', limit=None):
+    '''
+    Take in the results of solving a puzzle and return the answer to
+    a query (see QUERY_MODES) about each word, as if the query had been
+    asked instead. Which of a word's matches are kept under a limit
+    depends on the engine which found them.
+    '''
+
+    limit = query_limit(mode, limit)
+
+    if mode == 'all' and limit is None:
+        return results
+
+    answers = {}
+
+    for word, directions_found in results.items():
+
+        matches = [(direction, location)
+                   for direction, locations in directions_found.items()
+                   for location in locations]
+
+        if limit is not None:
+            matches = matches[:limit]
+
+        if mode == 'exists':
+            answers[word] = bool(matches)
+
+        elif mode == 'count':
+            answers[word] = len(matches)
+
+        else:
+            answers[word] = {}
+
+            for direction, location in matches:
+                answers[word].setdefault(direction, []).append(location)
+
+    return answers
+
+
+def normalize_word(word):
+    '''
+    Return word the way it is expected to appear in a grid: upper-cased,
+    with any spaces removed (so 'Disk drive' is searched for as 'DISKDRIVE').
+    '''
+
+    return word.replace(' ', '').upper()
+
+
+def arrange_results(words, found_words):
+    '''
+    Take in the list of words that were searched for and a dictionary
+    mapping some of those words to dictionaries of direction codes and
+    (x, y) coordinate lists, in any order, and return a dictionary with
+    the same shape and ordering as WordSearchSolver.solve_puzzle output.
+
+    Directions are ordered as in WordSearchSolver.directions, coordinates
+    are ordered top to bottom and then left to right, and words which
+    were not found are given an empty dictionary.
+    '''
+
+    results = collections.defaultdict(dict)
+
+    for word in words:
+
+        directions_found = found_words.get(word, {})
+
+        results[word] = {}
+
+        for direction in WordSearchSolver.directions:
+
+            if directions_found.get(direction):
+                # Sorting on (y, x) matches the order in which
+                # build_dictionary_of_coordinates files locations.
+                locations = sorted(set(directions_found[direction]),
+                                   key=lambda location: (location[1],
+                                                         location[0]))
+                results[word][direction] = locations
+
+    return results
+
+
+def flip_match(location, direction, length):
+    '''
+    Take in the (x, y) location at which the reversal of a word of the
+    given length starts when read in direction, and return a tuple of
+    the (x, y) location at which the word itself starts and the direction
+    code it reads in, which is the opposite direction.
+    '''
+
+    dy, dx = WordSearchSolver.directions[direction]
+
+    x, y = location
+
+    # The last letter of the reversal is the first letter of the word.
+    steps = length - 1
+
+    return ((x + steps * dx, y + steps * dy),
+            WordSearchSolver.opposite_directions[direction])
+
+
+def find_in_all_directions(word, find_word_in_direction, limit=None):
+    '''
+    Return a dictionary mapping direction codes to lists of the (x, y)
+    locations at which the normalized word starts, in all eight directions.
+
+    find_word_in_direction(word, direction) must return a list of (x, y)
+    locations, and is only called for the word and its reversal in each
+    of the four WordSearchSolver.canonical_directions.
+
+    If limit is given, searching stops once that many locations are found,
+    and any directions not yet searched are never searched at all.
+    '''
+
+    directions_found = {}
+
+    matches = iter_in_all_directions(word, find_word_in_direction)
+
+    if limit is not None:
+        matches = itertools.islice(matches, limit)
+
+    for direction, location in matches:
+        directions_found.setdefault(direction, []).append(location)
+
+    return directions_found
+
+
+def count_in_all_directions(word, count_word_in_direction, limit=None):
+    '''
+    Return the number of locations at which the normalized word starts,
+    in all eight directions, or limit if there are more than that.
+
+    count_word_in_direction(word, direction, limit) must return the
+    number of matches, no more than limit (which may be None), and is
+    only called for the word and its reversal in each of the four
+    WordSearchSolver.canonical_directions, until limit is reached.
+    '''
+
+    reversed_word = word[::-1]
+
+    total = 0
+
+    for direction in WordSearchSolver.canonical_directions:
+
+        found = count_word_in_direction(
+            word, direction, None if limit is None else limit - total)
+        total += found
+
+        if limit is not None and total >= limit:
+            return limit
+
+        # A palindrome reads the same backwards, so its reversal
+        # matches wherever it was just found.
+        if reversed_word != word:
+            found = count_word_in_direction(
+                reversed_word, direction,
+                None if limit is None else limit - total)
+
+        total += found
+
+        if limit is not None and total >= limit:
+            return limit
+
+    return total
+
+
+def iter_in_all_directions(word, find_word_in_direction):
+    '''
+    Yield a (direction, (x, y)) tuple for every location at which the
+    normalized word starts, in all eight directions, as they're found.
+    See find_in_all_directions.
+    '''
+
+    reversed_word = word[::-1]
+
+    for direction in WordSearchSolver.canonical_directions:
+
+        results = find_word_in_direction(word, direction)
+
+        for each_location in results:
+            yield direction, each_location
+
+        # A palindrome reads the same backwards, so the matches
+        # for its reversal are the ones which were just found.
+        if reversed_word == word:
+            reversed_results = results
+        else:
+            reversed_results = find_word_in_direction(reversed_word,
+                                                      direction)
+
+        for each_location in reversed_results:
+            location, opposite = flip_match(each_location, direction,
+                                            len(word))
+            yield opposite, location
+
+
+def iter_word_locations(word, direction, coordinates, letters_by_coordinate,
+                        reach, counts=None):
+    '''
+    Yield the (x, y) coordinates of every tile at which word starts when
+    read in direction, as each is found, by checking every occurrence of
+    the word's first letter for matching subsequent letters.
+
+    The tables are those a Puzzle builds: coordinates maps each letter to
+    the (y, x) tuples it's found at, letters_by_coordinate maps each (y, x)
+    tuple back to its letter, and reach is build_reach_table's list of rows
+    for direction. Anything which keeps them up to date as the grid changes
+    (see puzzle_session) can search with them.
+
+    If counts (a solve_stats.ProbeCounts) is given, every occurrence
+    of the word's first letter which is looked at is added to its
+    starts, and every letter looked up in the grid to its probes.
+    Probes are worked out once for each start, from how far the
+    search got, so the loop over the letters does no extra work.
+    '''
+
+    dy, dx = WordSearchSolver.directions[direction]
+
+    # We care about the first letter because words aren't supposed to
+    # change direction after we've started finding matching letters.
+    first_letter = word[0]
+
+    locations_for_first_letter = coordinates.get(first_letter, ())
+
+    # Spaces are skipped below, so they don't need room in the grid.
+    word_length = len(word) - word.count(' ')
+
+    if counts is not None:
+        counts.starts += len(locations_for_first_letter)
+
+    # We need to check each instance of the first letter, so
+    # iterate over all the locations where that letter can be found:
+    for each_location in locations_for_first_letter:
+
+        y, x = initial_y, initial_x = each_location
+
+        # If the word would run off the edge of the grid from
+        # here, there's no point checking any of its letters.
+        if reach[y][x] < word_length:
+            continue
+
+        letters_match = True
+
+        # Next, for each letter (including the first), retrieve
+        # a list of all coordinates where that letter can be found
+        # and see if the current letter were're looking at's location
+        # matches up with the expected location:
+        for each_letter in word:
+
+            if letters_match is True:
+
+                # A space isn't a letter.
+                # While there are some "words" with spaces
+                # in them in the WordList.txt file, there
+                # are none in the WordSearch.txt file.
+                # This program will assume words with spaces in
+                # the WordList.txt file are included in the
+                # WordSearch.txt file with spaces removed.
+                if each_letter == ' ':
+                    continue
+
+                letter_as_key = each_letter.upper()
+
+                # Rather than scanning every coordinate the letter
+                # can be found at, look up which letter (if any) is
+                # found at the coordinates we expect it to be at.
+                # This is a single hash lookup, so it stays fast
+                # even for very large grids with common letters.
+                found_letter = letters_by_coordinate.get((y, x))
+
+                if found_letter == letter_as_key:
+                    # If a match has been found, take
+                    # another step in this direction:
+                    y += dy
+                    x += dx
+
+                    # Note that, because we're not checking grid
+                    # indices but instead looking for tuple keys
+                    # in a dictionary, there will never be an IndexError
+                    # due to iterating outside the grid's boundaries.
+
+                else:
+                    letters_match = False
+
+        if counts is not None:
+            # Every letter matched was a step, and
+            # a letter which didn't match was a probe too.
+            steps = max(abs(y - initial_y), abs(x - initial_x))
+            counts.probes += steps if letters_match else steps + 1
+
+        if letters_match is True:
+
+            # The (x, y) ordering is intentional for readability.
+            # Every other occurrence of the first letter is only
+            # checked if the caller reads on for more matches.
+            yield (initial_x, initial_y)
+
+
+def build_reach_table(grid):
+    '''
+    Take in a list of strings and return a dictionary mapping each
+    direction code in WordSearchSolver.directions to a list of rows,
+    where reach[direction][y][x] is the number of tiles from (x, y) to
+    the edge of the grid in that direction, counting (x, y) itself.
+
+    A word can only start at (x, y) in a direction if it has no more
+    letters than this, and a word which fits never steps off the grid.
+    Rows may be of any length.
+    '''
+
+    reach = {}
+
+    for direction, (dy, dx) in WordSearchSolver.directions.items():
+
+        # Arrays of ints take far less memory than lists of them.
+        table = [array.array('i', [1]) * len(each_row) for each_row in grid]
+
+        # Each tile's reach is one more than the reach of the next
+        # tile in this direction, so the tiles nearest the far edge
+        # of the grid have to be filled in first.
+        if dy > 0:
+            row_indices = range(len(grid) - 1, -1, -1)
+        else:
+            row_indices = range(len(grid))
+
+        for y in row_indices:
+
+            each_row = table[y]
+
+            next_y = y + dy
+
+            if not 0 <= next_y < len(grid):
+                continue  # Every tile here is on the edge.
+
+            next_row = table[next_y]
+
+            if dx > 0:
+                column_indices = range(len(each_row) - 1, -1, -1)
+            else:
+                column_indices = range(len(each_row))
+
+            for x in column_indices:
+
+                next_x = x + dx
+
+                if 0 <= next_x < len(next_row):
+                    each_row[x] = next_row[next_x] + 1
+
+        reach[direction] = table
+
+    return reach
+
+
+def build_ngram_index(grid, ngram_length=2):
+    '''
+    Take in a list of strings and return a frozenset of every run of
+    ngram_length letters which can be read in a straight line in any
+    of the eight directions in WordSearchSolver.directions.
+
+    Rows may be of any length.
+    '''
+
+    ngrams = set()
+
+    # Reading a line in the opposite direction gives the reversal
+    # of every run of letters in it, so four directions are enough.
+    for direction in WordSearchSolver.canonical_directions:
+
+        dy, dx = WordSearchSolver.directions[direction]
+
+        for y, each_row in enumerate(grid):
+            for x in range(len(each_row)):
+
+                letters = []
+                step_y, step_x = y, x
+
+                while len(letters) < ngram_length:
+
+                    if not (0 <= step_y < len(grid) and
+                            0 <= step_x < len(grid[step_y])):
+                        break
+
+                    letters.append(grid[step_y][step_x])
+                    step_y += dy
+                    step_x += dx
+
+                if len(letters) == ngram_length:
+                    ngram = ''.join(letters)
+                    ngrams.add(ngram)
+                    ngrams.add(ngram[::-1])
+
+    return frozenset(ngrams)
+
+
+def could_contain(word, ngram_index, ngram_length=2):
+    '''
+    Return False if any run of ngram_length letters in the normalized
+    word is missing from ngram_index (from build_ngram_index), meaning
+    the word can't be in that grid, or True if it might be.
+    '''
+
+    for index in range(len(word) - ngram_length + 1):
+        if word[index:index + ngram_length] not in ngram_index:
+            return False
+
+    return True
+
+
+# Written at the top of every solution file.
+SOLUTION_EXPLANATION = (
+    '\nFormat of this file:'
+    '\n\nEach word found:'
+    '\n    Each direction the word was found in:'
+    '\n        (X, Y) coordinates of first letter in the word.'
+    '\n\n')
+
+
+def write_solution_to_file(results, solution_file_path):
+    '''
+    Write the results of calling solve_puzzle to the text
+    file at solution_file_path, with pretty printing.
+    '''
+
+    with open(solution_file_path, 'w+') as solution_file:
+
+        solution_file.write(SOLUTION_EXPLANATION)
+
+        sorted_keys = sorted(results)
+
+        for each_key in sorted_keys:
+            write_word_to_file(solution_file, each_key, results[each_key])
+
+        solution_file.write('\n')
+
+
+def write_summary_to_file(answers, solution_file_path):
+    '''
+    Write the answers to an 'exists' or 'count' query (see QUERY_MODES)
+    to a text file, with one "word: answer" line per word.
+    '''
+
+    with open(solution_file_path, 'w') as solution_file:
+        for word in sorted(answers):
+            solution_file.write('{}: {}\n'.format(word, answers[word]))
+
+
+def write_matches_to_file(matches, words, solution_file_path):
+    '''
+    Write the (word, direction, x, y) tuples yielded by matches (such as
+    WordSearchSolver.iter_matches) to the text file at solution_file_path,
+    in the same format as write_solution_to_file, one word at a time.
+
+    words must be the sorted list of unique words searched for, and
+    matches must yield every match for each word together, in the
+    same order as words. Only one word's matches are held at a time.
+    '''
+
+    groups = itertools.groupby(matches, key=lambda match: match[0])
+
+    group = next(groups, None)
+
+    with open(solution_file_path, 'w+') as solution_file:
+
+        solution_file.write(SOLUTION_EXPLANATION)
+
+        for each_word in words:
+
+            directions_found = {}
+
+            # Words which weren't found have no matches at all.
+            if group is not None and group[0] == each_word:
+
+                for _, direction, x, y in group[1]:
+                    directions_found.setdefault(direction, []).append((x, y))
+
+                group = next(groups, None)
+
+            results = arrange_results([each_word],
+                                      {each_word: directions_found})
+
+            write_word_to_file(solution_file, each_word, results[each_word])
+
+        solution_file.write('\n')
+
+
+def write_word_to_file(solution_file, word, directions_found):
+    '''
+    Write the section of a solution file for one word, given the
+    dictionary of directions and (x, y) coordinate lists it was found
+    at, to the already opened solution_file.
+    '''
+
+    solution_file.write('\n\n{}:'.format(word))
+
+    if not directions_found:
+            solution_file.write('\n    Not found.'.format(word))
+
+    for each_direction in directions_found.keys():
+
+        solution_file.write('\n    {}:'.format(each_direction))
+
+        for each_result in directions_found[each_direction]:
+
+            x = each_result[0]
+            y = each_result[1]
+
+            solution_file.write('\n        ({}, {})'.format(x, y))
 
 
 def load_list_from_text_file(file_name):
@@ -327,6 +1397,28 @@ def handle_cli_arguments():
     The first additional argument allows the user to specify a word list,
     while the second argument permits specification of a puzzle grid.
     The final argument allows a custom solution file to be named.
+
+    The --format option selects the format the solution file is written
+    in (see solution_formats.WRITERS), and defaults to 'text'.
+
+    The --cache-dir option keeps solutions in the given directory, so the
+    same puzzle is only ever solved once, and --cache-size limits how
+    many megabytes of solutions are kept there (defaults to 256).
+
+    The --mode option (see QUERY_MODES) and --limit option ask a cheaper
+    question about each word than where every match of it is.
+
+    The --engine option hands the puzzle off to another solver (see
+    ENGINES), and '--engine auto' reports which one it picked.
+
+    The --stats option prints how long each phase of solving took,
+    and which words took the longest to search for.
+
+    The --stream option reads puzzles from stdin and writes their
+    solutions to stdout instead, as lines of JSON (see
+    stream_word_search_solver), using the word list at key_path for
+    puzzles which don't come with one. The exit status is 1 if any
+    puzzle couldn't be solved.
     '''
 
     # sys is only needed if this function is called, which only happens
@@ -334,26 +1426,87 @@ def handle_cli_arguments():
     # required for using other parts of the word_search_solvers package
     # and may be imported only as needed: inside this function.
     import sys
+    import argparse
+
+    import solution_formats
+
+    # The ordering of these arguments presumes users
+    # are more likely to want to use custom key files
+    # on the provided grid file to test this program.
+    parser = argparse.ArgumentParser(description="Solve a word search.")
+    parser.add_argument('key_path', nargs='?', default='word_list.txt',
+                        help="path to keys")
+    parser.add_argument('grid_path', nargs='?', default='word_search.txt',
+                        help="path to grid")
+    parser.add_argument('solution_path', nargs='?',
+                        default='fancy_solution.txt',
+                        help="(optional) path to output")
+    parser.add_argument('--format', default='text',
+                        choices=sorted(solution_formats.WRITERS),
+                        help="format of the solution file")
+    parser.add_argument('--cache-dir', default=None,
+                        help="directory to keep solved puzzles in")
+    parser.add_argument('--cache-size', type=int, default=256,
+                        help="megabytes of solved puzzles to keep")
+    parser.add_argument('--mode', default='all', choices=QUERY_MODES,
+                        help="what to find out about each word")
+    parser.add_argument('--limit', type=int, default=None,
+                        help="most matches to find for each word")
+    parser.add_argument('--engine', default=None, choices=sorted(ENGINES),
+                        help="solver to use instead of the default")
+    parser.add_argument('--stats', action='store_true',
+                        help="print where the time was spent")
+    parser.add_argument('--stream', action='store_true',
+                        help="solve JSON lines from stdin to stdout")
+
+    arguments = parser.parse_args()
+
+    if arguments.mode in ('exists', 'count') and arguments.format != 'text':
+        parser.error("--mode {} only writes text.".format(arguments.mode))
+
+    if arguments.limit is not None and arguments.limit < 1:
+        parser.error("--limit must be at least 1.")
+
+    # Show which engine 'auto' chooses, and why.
+    if arguments.engine == 'auto':
+        import logging
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    if arguments.stream:
+        import stream_word_search_solver
+
+        errors = stream_word_search_solver.solve_stream(
+            sys.stdin, sys.stdout, arguments.key_path, arguments.engine,
+            arguments.mode, arguments.limit)
+
+        sys.exit(1 if errors else 0)
+
+    cache = None
+
+    if arguments.cache_dir is not None:
+        import solution_cache
+        cache = solution_cache.SolutionCache(
+            arguments.cache_dir, arguments.cache_size * 1024 * 1024)
 
     try:
-        key_path = 'word_list.txt'
-        grid_path = 'word_search.txt'
-        solution_path = 'fancy_solution.txt'
+        solver = WordSearchSolver(arguments.key_path, arguments.grid_path,
+                                  arguments.solution_path, no_output=True,
+                                  engine=arguments.engine, cache=cache,
+                                  collect_stats=arguments.stats)
+        solution = solver.solve_puzzle(arguments.mode, arguments.limit)
 
-        # The ordering of this conditional presumes users
-        # are more likely to want to use custom key files
-        # on the provided grid file to test this program.
-        if len(sys.argv) > 1:
-            key_path = sys.argv[1]
-        if len(sys.argv) > 2:
-            grid_path = sys.argv[2]
-        if len(sys.argv) > 3:
-            solution_path = sys.argv[3]
+        with time_phase(solver.stats, 'write'):
+            if arguments.mode in ('exists', 'count'):
+                write_summary_to_file(solution, arguments.solution_path)
+            else:
+                solution_formats.write_solution(solution,
+                                                arguments.solution_path,
+                                                arguments.format)
 
-        solver = WordSearchSolver(key_path, grid_path, solution_path)
-        solution = solver.solve_puzzle()
+        print("{} file written.".format(arguments.solution_path))
 
-        print("{} file written.".format(solution_path))
+        if solver.stats is not None:
+            print(solver.stats.report())
 
     except IOError:
         error = sys.exc_info()[1]
@@ -364,7 +1517,15 @@ def handle_cli_arguments():
               " <path to keys>"
               " <path to grid>"
               " <(optional) path to output>"
-              "\n".format(error))
+              " [--format {}]"
+              " [--cache-dir <directory>]"
+              " [--mode {}]"
+              " [--limit <matches>]"
+              " [--engine <engine>]"
+              " [--stats]"
+              " [--stream]"
+              "\n".format(error, '|'.join(sorted(solution_formats.WRITERS)),
+                          '|'.join(QUERY_MODES)))
 
 
 if __name__ == '__main__':